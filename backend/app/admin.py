@@ -0,0 +1,146 @@
+"""
+Maintenance commands, run from backend/ against the configured DATABASE_URL:
+
+    python -m app.admin reanalyze [--resumes | --jobs] [--chunk-size 500] [--name-extractor auto]
+                                  [--start-after ID] [--dry-run]
+
+`reanalyze` re-runs the parsers over stored rows (after a parser or
+taxonomy change) and rewrites parsed_data and skill_keys (and title and
+artifacts for jobs). Rows are read in id order, one chunk at a
+time, and each chunk is analyzed as a batch (nlp.pipe) and committed before
+the next is read. An interrupted run can continue with --start-after. Running
+API processes keep their in-memory skill index and job artifacts until they
+restart.
+"""
+import argparse
+import asyncio
+import logging
+import time
+
+from sqlalchemy import select, update
+
+from app.models.db import JobDescription, Resume
+from app.services.job_artifacts import build_job_artifacts, dump_job_artifacts
+from app.services.job_description_analyzer import analyze_job_descriptions
+from app.services.logging_setup import setup_logging, stop_logging
+from app.services.name_extractor import NAME_EXTRACTOR_MODES
+from app.services.resume_parser import analyze_resumes
+from app.services.skill_taxonomy import get_taxonomy
+
+logger = logging.getLogger("app.admin")
+
+REANALYZE_CHUNK_SIZE = 500
+
+
+def _resume_values(analysis: dict) -> dict:
+    return {
+        "parsed_data": analysis,
+        "skill_keys": get_taxonomy().skill_keys(analysis.get("skills", ()), analysis.get("skill_ids", ())),
+    }
+
+
+def _job_values(analysis: dict) -> dict:
+    return {
+        **_resume_values(analysis),
+        "title": analysis.get("title", ""),
+        "artifacts": dump_job_artifacts(build_job_artifacts(analysis)),
+    }
+
+
+async def iter_chunks(session_factory, model, chunk_size: int, start_after: int = 0):
+    """Yield lists of (id, content) in id order, each read in its own short session."""
+    last_id = start_after
+    while True:
+        async with session_factory() as db:
+            rows = (await db.execute(
+                select(model.id, model.content).where(model.id > last_id).order_by(model.id).limit(chunk_size)
+            )).all()
+        if not rows:
+            return
+        last_id = rows[-1].id
+        yield rows
+
+
+async def reanalyze(
+    session_factory,
+    model,
+    chunk_size: int = REANALYZE_CHUNK_SIZE,
+    name_extractor: str = None,
+    start_after: int = 0,
+    dry_run: bool = False,
+    batch_size: int = None,
+    n_process: int = None,
+) -> dict:
+    """Re-analyze every `model` row after `start_after`; returns {"rows", "last_id", "seconds"}."""
+    started = time.perf_counter()
+    processed, last_id = 0, start_after
+    async for rows in iter_chunks(session_factory, model, chunk_size, start_after):
+        ids = [row.id for row in rows]
+        texts = [row.content or "" for row in rows]
+        # CPU-bound; a thread keeps the event loop (and the DB driver) responsive
+        if model is Resume:
+            analyses = await asyncio.to_thread(analyze_resumes, texts, name_extractor, batch_size, n_process)
+            values = [_resume_values(analysis) for analysis in analyses]
+        else:
+            analyses = await asyncio.to_thread(analyze_job_descriptions, texts)
+            values = [_job_values(analysis) for analysis in analyses]
+
+        if not dry_run:
+            async with session_factory() as db:
+                await db.execute(update(model), [{"id": row_id, **row} for row_id, row in zip(ids, values)])
+                await db.commit()
+        processed += len(rows)
+        last_id = ids[-1]
+        logger.info(
+            "Re-analyzed chunk",
+            extra={"table": model.__tablename__, "rows": processed, "last_id": last_id, "dry_run": dry_run},
+        )
+    return {"rows": processed, "last_id": last_id, "seconds": round(time.perf_counter() - started, 3)}
+
+
+async def _run_reanalyze(args):
+    from app.models.session import AsyncSessionLocal, engine
+
+    models = [Resume] if args.resumes else [JobDescription] if args.jobs else [Resume, JobDescription]
+    try:
+        for model in models:
+            result = await reanalyze(
+                AsyncSessionLocal,
+                model,
+                chunk_size=args.chunk_size,
+                name_extractor=args.name_extractor,
+                start_after=args.start_after,
+                dry_run=args.dry_run,
+                batch_size=args.batch_size,
+                n_process=args.n_process,
+            )
+            print(f"{model.__tablename__}: {result['rows']} rows re-analyzed in {result['seconds']}s "
+                  f"(last id {result['last_id']}){' [dry run]' if args.dry_run else ''}")
+    finally:
+        await engine.dispose()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m app.admin", description="Maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+    reanalyze_parser = commands.add_parser("reanalyze", help="re-run the parsers over stored resumes and jobs")
+    tables = reanalyze_parser.add_mutually_exclusive_group()
+    tables.add_argument("--resumes", action="store_true", help="only resumes")
+    tables.add_argument("--jobs", action="store_true", help="only job descriptions")
+    reanalyze_parser.add_argument("--chunk-size", type=int, default=REANALYZE_CHUNK_SIZE)
+    reanalyze_parser.add_argument("--name-extractor", choices=NAME_EXTRACTOR_MODES, default=None)
+    reanalyze_parser.add_argument("--start-after", type=int, default=0, help="resume after this row id")
+    reanalyze_parser.add_argument("--batch-size", type=int, default=None, help="nlp.pipe batch size")
+    reanalyze_parser.add_argument("--n-process", type=int, default=None, help="nlp.pipe worker processes")
+    reanalyze_parser.add_argument("--dry-run", action="store_true", help="analyze without writing")
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    try:
+        asyncio.run(_run_reanalyze(args))
+    finally:
+        stop_logging()
+
+
+if __name__ == "__main__":
+    main()
@@ -32,7 +32,6 @@ async def register(user: UserCreate, db: AsyncSession = Depends(get_db)):
     )
     db.add(new_user)
     await db.commit()
-    await db.refresh(new_user)
     return new_user
 
 
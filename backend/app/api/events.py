@@ -0,0 +1,95 @@
+"""
+Server-sent events for the streaming endpoints. Each event is one
+`event: <name>` line and one `data: <json>` line; the final event of a
+stream is "result" (the same body the plain endpoint returns) or "error"
+({"status_code", "detail"}), since the 200 status is already sent by then.
+"""
+import asyncio
+import logging
+import os
+
+from fastapi.responses import StreamingResponse
+
+from app.services.json_codec import dumps
+
+logger = logging.getLogger(__name__)
+
+# Comment line sent while a stage runs, so idle-timeout proxies keep the connection open
+SSE_KEEPALIVE_SECONDS = float(os.getenv("SSE_KEEPALIVE_SECONDS", "15"))
+KEEPALIVE = b": keepalive\n\n"
+
+# Work started by a stream whose client went away runs to completion
+_detached = set()
+
+
+def _finish_detached(task: asyncio.Task):
+    _detached.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Streamed request failed after the client disconnected", exc_info=task.exception())
+
+
+def sse_event(event: str, data) -> bytes:
+    # orjson output has no newlines, so the payload is always a single data line
+    return b"event: " + event.encode() + b"\ndata: " + dumps(data) + b"\n\n"
+
+
+def stage_event(stage: str, progress: float = None) -> bytes:
+    return sse_event("stage", {"stage": stage, "progress": progress})
+
+
+def error_event(error: Exception) -> bytes:
+    """HTTPException and ResumeProcessingError keep their status; anything else is a 500."""
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        return sse_event("error", {"status_code": 500, "detail": str(error)})
+    return sse_event("error", {"status_code": status_code, "detail": error.detail})
+
+
+class EventStreamResponse(StreamingResponse):
+    media_type = "text/event-stream"
+
+    def __init__(self, content, **kwargs):
+        headers = {
+            "Cache-Control": "no-cache",
+            # nginx (and Render's proxy) would otherwise buffer the stream and deliver it all at the end
+            "X-Accel-Buffering": "no",
+            **kwargs.pop("headers", {}),
+        }
+        super().__init__(content, headers=headers, **kwargs)
+
+
+async def stage_events(work, progress: dict = None, keepalive: float = None):
+    """
+    Run `work(on_stage)` and yield a "stage" event each time it calls
+    on_stage, then its return value as a "result" event, or an "error" event
+    if it raises. `progress` maps stage names to the fraction done. If the
+    client disconnects, `work` is left to finish rather than cancelled
+    halfway through writing a file and a row.
+    """
+    keepalive = keepalive or SSE_KEEPALIVE_SECONDS
+    stages = asyncio.Queue()
+    task = asyncio.create_task(work(stages.put_nowait))
+    task.add_done_callback(lambda _: stages.put_nowait(None))
+    try:
+        while True:
+            try:
+                stage = await asyncio.wait_for(stages.get(), keepalive)
+            except asyncio.TimeoutError:
+                yield KEEPALIVE
+                continue
+            if stage is None:
+                break
+            yield stage_event(stage, (progress or {}).get(stage))
+    finally:
+        if not task.done():
+            _detached.add(task)
+            task.add_done_callback(_finish_detached)
+
+    try:
+        result = task.result()
+    except Exception as e:
+        if getattr(e, "status_code", None) is None:
+            logger.error("Streamed request failed", exc_info=e)
+        yield error_event(e)
+    else:
+        yield sse_event("result", result)
@@ -0,0 +1,12 @@
+from typing import Any
+
+from fastapi.responses import ORJSONResponse
+
+from app.services.json_codec import dumps
+
+
+class JSONResponse(ORJSONResponse):
+    """Default response class: orjson encoding, including NumPy values and sets."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,80 +1,271 @@
-import json
-from fastapi import APIRouter, UploadFile, File, Depends, Body, HTTPException, status
+import io
+import logging
+import os
+import zipfile
+import zlib
+from collections import Counter
+from typing import List, Optional
+from fastapi import APIRouter, UploadFile, File, Depends, Body, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.services.resume_parser import extract_text_from_pdf, analyze_resume_text
-from app.models.session import get_db
+from app.api.events import EventStreamResponse, error_event, sse_event, stage_event, stage_events
+from app.services.resume_parser import PDF_MAX_BYTES
+from app.models.session import get_db, get_db_context
 from app.models.db import Resume, JobDescription
 from app.services.job_description_analyzer import analyze_job_description
 from app.services.matcher import match_resume_to_job
-from app.services.supabase_client import upload_resume_to_supabase
+from app.services.job_artifacts import job_artifact_store, build_job_artifacts, dump_job_artifacts
+from app.services.resume_cache import resume_cache
+from app.services.job_queue import STAGE_PROGRESS, resume_job_queue, QueueFull
+from app.services.listing import LIST_DEFAULT_FIELDS, get_row, list_rows, parse_fields, parse_skills
+from app.services.metrics import stage_timer, timed
+from app.services.name_extractor import NAME_EXTRACTOR_MODES
+from app.services.resume_pipeline import (
+    ResumeProcessingError,
+    UploadItem,
+    process_resume,
+    process_resume_batch,
+)
+from app.services.skill_index import skill_index
+from app.services.skill_taxonomy import get_taxonomy
+from app.services.vector_index import resume_vector_index
+from app.services.worker_pool import worker_pool, WorkerPoolSaturated
 from pydantic import BaseModel
-from pdfminer.pdfparser import PDFSyntaxError
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+BULK_MAX_FILES = int(os.getenv("BULK_MAX_FILES", "1000"))
+# ?name_extractor= overrides NAME_EXTRACTOR for one upload, which then skips the resume cache
+NAME_EXTRACTOR_PATTERN = f"^({'|'.join(NAME_EXTRACTOR_MODES)})$"
+BULK_MAX_TOTAL_BYTES = int(os.getenv("BULK_MAX_TOTAL_BYTES", str(512 * 1024 * 1024)))
+ZIP_CONTENT_TYPES = {"application/zip", "application/x-zip-compressed"}
+
+
+@timed("read_upload")
+async def read_upload(file: UploadFile, max_bytes: int = PDF_MAX_BYTES) -> bytes:
+    """Read the upload into a single buffer, rejecting it as soon as it exceeds max_bytes."""
+    if file.size is not None and file.size > max_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File exceeds the {max_bytes // (1024 * 1024)} MB upload limit.",
+        )
+    buffer = bytearray()
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        buffer.extend(chunk)
+        if len(buffer) > max_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"File exceeds the {max_bytes // (1024 * 1024)} MB upload limit.",
+            )
+    return bytes(buffer)
+
+
+async def run_cpu_bound(func, *args):
+    """Run a CPU-bound stage on the worker pool, shedding load with a 503."""
+    try:
+        return await worker_pool.run(func, *args)
+    except WorkerPoolSaturated:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy processing other documents. Please retry shortly.",
+            headers={"Retry-After": "1"},
+        )
 
 
 @router.post("/upload-resume/")
 async def upload_resume(
-    file: UploadFile = File(...), db: AsyncSession = Depends(get_db)
+    file: UploadFile = File(...),
+    name_extractor: Optional[str] = Query(None, pattern=NAME_EXTRACTOR_PATTERN),
+    db: AsyncSession = Depends(get_db),
 ):
-    print(f"🔹 Received file: {file.filename}")
+    logger.info("Received resume upload", extra={"file_name": file.filename})
+    # One buffer serves the hash, the parser and the storage upload
+    contents = await read_upload(file)
+    file.file.close()
+
     try:
-        text = extract_text_from_pdf(file)
-        print(f"🔹 Extracted text length: {len(text) if text else 0}")
-    except PDFSyntaxError:
-        raise HTTPException(
-            status_code=400, detail="Invalid PDF file format."
+        return await process_resume(
+            db, UploadItem(file.filename, contents, file.content_type, name_extractor)
         )
-    except Exception as e:
-        print(f"❌ PDF extraction error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to read PDF file: {str(e)}")
+    except ResumeProcessingError as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail, headers=e.headers)
+
+
+@router.post("/upload-resume/stream")
+async def upload_resume_stream(
+    file: UploadFile = File(...),
+    name_extractor: Optional[str] = Query(None, pattern=NAME_EXTRACTOR_PATTERN),
+):
+    """
+    /upload-resume/ as server-sent events: a "stage" event for "received",
+    then for each pipeline stage as it completes (extracted, analyzed,
+    uploaded, stored, or just cached), then the "result" or an "error".
+    """
+    logger.info("Received streamed resume upload", extra={"file_name": file.filename})
+    contents = await read_upload(file)
+    file.file.close()
+    item = UploadItem(file.filename, contents, file.content_type, name_extractor)
+
+    async def process(on_stage):
+        # A session of its own: the request's is closed before the body is streamed
+        async with get_db_context() as db:
+            return await process_resume(db, item, on_stage=on_stage)
+
+    async def events():
+        yield stage_event("received", 0.0)
+        async for event in stage_events(process, STAGE_PROGRESS):
+            yield event
 
-    if not text or "No text found" in text:
-        raise HTTPException(status_code=422, detail="No text found in PDF.")
+    return EventStreamResponse(events())
 
-    text = text.strip()
-    if not text:
-        raise HTTPException(status_code=422, detail="PDF contains no readable text.")
 
-    analysis = analyze_resume_text(text)
-    if not analysis:
-        raise HTTPException(status_code=500, detail="Failed to analyze resume text.")
+@router.post("/resumes/jobs", status_code=status.HTTP_202_ACCEPTED)
+async def enqueue_resume(
+    file: UploadFile = File(...), name_extractor: Optional[str] = Query(None, pattern=NAME_EXTRACTOR_PATTERN)
+):
+    """Queue a resume for background processing; poll GET /resumes/jobs/{job_id}."""
+    contents = await read_upload(file)
+    file.file.close()
 
-    # Upload to Supabase
     try:
-        file_url = await upload_resume_to_supabase(file)
-        print(f"🔹 Supabase file URL: {file_url}")
-    except Exception as e:
-        print(f"❌ Supabase upload error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to upload to Supabase: {str(e)}")
+        job = resume_job_queue.submit(UploadItem(file.filename, contents, file.content_type, name_extractor))
+    except QueueFull:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Processing queue is full. Please retry shortly.",
+            headers={"Retry-After": "5"},
+        )
 
-    parsed_json = json.dumps(analysis)
+    logger.info("Queued resume upload", extra={"file_name": file.filename, "job_id": job.id})
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "status_url": f"/resumes/jobs/{job.id}",
+    }
+
+
+@router.get("/resumes/jobs/{job_id}")
+async def get_resume_job(job_id: str):
+    job = resume_job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found or expired.",
+        )
+    return job.to_dict()
+
+
+def _batch_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Batch exceeds the {BULK_MAX_TOTAL_BYTES // (1024 * 1024)} MB limit.",
+    )
 
+
+def _too_many_files() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Batch exceeds the {BULK_MAX_FILES} file limit.",
+    )
+
+
+def _expand_zip(archive: UploadItem, max_files: int, max_bytes: int) -> list:
+    """
+    The archive's PDFs as UploadItems. The entry count and the declared
+    (uncompressed) sizes are checked against the remaining batch budget
+    before anything is decompressed; zipfile never inflates an entry past its
+    declared size.
+    """
     try:
-        new_resume = Resume(
-            filename=file.filename,
-            content=text,
-            parsed_data=parsed_json,
-            file_url=file_url,
-        )
-        db.add(new_resume)
-        await db.commit()
-        await db.refresh(new_resume)
-        print(f"🔹 Resume saved to DB with ID: {new_resume.id}")
-    except Exception as e:
-        print(f"❌ Database error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+        zf = zipfile.ZipFile(io.BytesIO(archive.contents))
+    except zipfile.BadZipFile:
+        raise HTTPException(status_code=400, detail=f"Invalid zip archive: {archive.filename}")
 
-    file.file.close()
+    with zf:
+        entries = [
+            info for info in zf.infolist()
+            if not info.is_dir() and info.filename.lower().endswith(".pdf") and "__MACOSX" not in info.filename
+        ]
+        if len(entries) > max_files:
+            raise _too_many_files()
+        for info in entries:
+            if info.file_size > PDF_MAX_BYTES:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"{info.filename} exceeds the {PDF_MAX_BYTES // (1024 * 1024)} MB upload limit.",
+                )
+        if sum(info.file_size for info in entries) > max_bytes:
+            raise _batch_too_large()
+
+        items = []
+        for info in entries:
+            try:
+                contents = zf.read(info)
+            except (zipfile.BadZipFile, zlib.error, EOFError, RuntimeError, NotImplementedError) as e:
+                # Corrupt (CRC mismatch, truncated), encrypted, or an unsupported compression method
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Unreadable entry {info.filename} in {archive.filename}: {e}",
+                )
+            items.append(UploadItem(os.path.basename(info.filename), contents, "application/pdf", archive.name_extractor))
+        return items
 
+
+@router.post("/resumes/bulk")
+async def bulk_upload_resumes(
+    files: List[UploadFile] = File(...),
+    name_extractor: Optional[str] = Query(None, pattern=NAME_EXTRACTOR_PATTERN),
+    db: AsyncSession = Depends(get_db),
+):
+    """Import many resumes at once: PDFs and/or zip archives of PDFs."""
+    items = []
+    # Bytes of PDFs held in memory, counting archive entries decompressed
+    total_bytes = 0
+    for file in files:
+        is_zip = file.filename.lower().endswith(".zip") or file.content_type in ZIP_CONTENT_TYPES
+        contents = await read_upload(file, BULK_MAX_TOTAL_BYTES if is_zip else PDF_MAX_BYTES)
+        file.file.close()
+        item = UploadItem(file.filename, contents, file.content_type, name_extractor)
+        if is_zip:
+            expanded = _expand_zip(item, BULK_MAX_FILES - len(items), BULK_MAX_TOTAL_BYTES - total_bytes)
+        else:
+            expanded = [item]
+        items.extend(expanded)
+
+        total_bytes += sum(len(pdf.contents) for pdf in expanded)
+        if total_bytes > BULK_MAX_TOTAL_BYTES:
+            raise _batch_too_large()
+        if len(items) > BULK_MAX_FILES:
+            raise _too_many_files()
+
+    if not items:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="No PDF files found in the upload.",
+        )
+
+    logger.info("Received bulk upload", extra={"files": len(items)})
+    results = await process_resume_batch(db, items)
+    counts = Counter(result["status"] for result in results)
     return {
-        "id": new_resume.id,
-        "filename": new_resume.filename,
-        "file_url": file_url,
-        "analysis": analysis,
+        "total": len(results),
+        "created": counts["created"],
+        "cached": counts["cached"],
+        "duplicate": counts["duplicate"],
+        "failed": counts["failed"],
+        "results": results,
     }
 
 
+@router.get("/resume-cache/stats")
+async def resume_cache_stats():
+    return resume_cache.stats()
+
+
 @router.post("/analyze-job/")
 async def analyze_job(
     description: str = Body(..., embed=True), db: AsyncSession = Depends(get_db)
@@ -86,24 +277,31 @@ async def analyze_job(
         )
 
     try:
-        result = analyze_job_description(description)
-        parsed_json = json.dumps(result)
+        with stage_timer("analyze_job"):
+            result = await run_cpu_bound(analyze_job_description, description)
+            # Precompute everything matching needs so /match/{resume_id}/{job_id} can skip it
+            artifacts = await run_cpu_bound(build_job_artifacts, result)
 
         new_job_description = JobDescription(
             title=result.get("title", ""),
             content=description,
-            parsed_data=parsed_json,
+            parsed_data=result,
+            skill_keys=get_taxonomy().skill_keys((), result["skill_ids"]),
+            artifacts=dump_job_artifacts(artifacts),
         )
 
         db.add(new_job_description)
-        await db.commit()
-        await db.refresh(new_job_description)
+        with stage_timer("db_commit"):
+            await db.commit()
+        job_artifact_store.put(new_job_description.id, artifacts)
 
         return {
             "id": new_job_description.id,
             "title": new_job_description.title,
             "analysis": result,
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -143,25 +341,245 @@ async def match_resume_job(data: MatchRequest):
             detail="Resume and job data must be provided.",
         )
 
-    print(
-        f"🔍 Received match request - Resume keys: "
-        f"{list(data.resume.keys()) if data.resume else 'None'}"
-    )
-    print(
-        f"🔍 Received match request - Job keys: "
-        f"{list(data.job.keys()) if data.job else 'None'}"
+    logger.debug(
+        "Received match request",
+        extra={"resume_keys": list(data.resume.keys()), "job_keys": list(data.job.keys())},
     )
 
     try:
         result = match_resume_to_job(data.resume, data.job)
-        print(f"✅ Match result: {result}")
         return {"status": "success", "match": result}
     except Exception as e:
-        print(f"❌ Match error: {str(e)}")
-        import traceback
+        logger.exception("Match failed")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to match resume to job: {str(e)}",
+        )
+
+
+@router.post("/match/stream")
+async def match_resume_job_stream(data: MatchRequest):
+    """
+    /match as server-sent events. The "received" stage goes out before any
+    matching starts, so the client knows the server is up (and awake) without
+    a separate probe request.
+    """
+    if not data.resume or not data.job:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Resume and job data must be provided.",
+        )
 
-        traceback.print_exc()
+    async def events():
+        yield stage_event("received", 0.0)
+        try:
+            result = match_resume_to_job(data.resume, data.job)
+        except Exception as e:
+            logger.exception("Match failed")
+            yield error_event(e)
+            return
+        yield sse_event("result", {"status": "success", "match": result})
+
+    return EventStreamResponse(events())
+
+
+@router.get("/match/{resume_id}/{job_id}")
+async def match_stored_resume_job(
+    resume_id: int, job_id: int, db: AsyncSession = Depends(get_db)
+):
+    """Match a stored resume against a stored job using its precomputed artifacts."""
+    resume = await db.get(Resume, resume_id)
+    if resume is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Resume not found.",
+        )
+    artifacts = await job_artifact_store.get(db, job_id)
+    if artifacts is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job description not found.",
+        )
+
+    try:
+        parsed_resume = resume.parsed_data or {}
+        result = match_resume_to_job(parsed_resume, artifacts=artifacts)
+        return {"status": "success", "match": result}
+    except Exception as e:
+        logger.exception("Match failed", extra={"resume_id": resume_id, "job_id": job_id})
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to match resume to job: {str(e)}",
         )
+
+
+@router.get("/jobs/{job_id}/rank")
+async def rank_resumes_for_job(
+    job_id: int,
+    k: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+):
+    artifacts = await job_artifact_store.get(db, job_id)
+    if artifacts is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job description not found.",
+        )
+
+    try:
+        await skill_index.ensure_loaded(db)
+        with stage_timer("rank"):
+            results = skill_index.rank(artifacts, k=k)
+    except Exception as e:
+        logger.exception("Ranking failed", extra={"job_id": job_id})
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to rank resumes: {str(e)}",
+        )
+
+    return {
+        "status": "success",
+        "job_id": job_id,
+        "indexed_resumes": len(skill_index),
+        "results": results,
+    }
+
+
+@router.get("/jobs/{job_id}/rank/stream")
+async def rank_resumes_for_job_stream(
+    job_id: int,
+    k: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    /jobs/{job_id}/rank as server-sent events: a "partial" event with the
+    running top-k after every RANK_STREAM_CHUNK candidates are scored, then
+    the "result", identical to the plain endpoint's body.
+    """
+    artifacts = await job_artifact_store.get(db, job_id)
+    if artifacts is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job description not found.",
+        )
+    try:
+        await skill_index.ensure_loaded(db)
+    except Exception as e:
+        logger.exception("Loading the skill index failed", extra={"job_id": job_id})
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to rank resumes: {str(e)}",
+        )
+
+    async def events():
+        results = []
+        try:
+            for scored, total, results in skill_index.rank_iter(artifacts, k=k):
+                yield sse_event("partial", {"scored": scored, "candidates": total, "results": results})
+        except Exception as e:
+            logger.exception("Ranking failed", extra={"job_id": job_id})
+            yield error_event(e)
+            return
+        yield sse_event("result", {
+            "status": "success",
+            "job_id": job_id,
+            "indexed_resumes": len(skill_index),
+            "results": results,
+        })
+
+    return EventStreamResponse(events())
+
+
+@router.get("/jobs/{job_id}/similar-resumes")
+async def similar_resumes_for_job(
+    job_id: int,
+    k: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+):
+    """Stored resumes whose text is most similar to the job's, from the ANN index."""
+    job = await db.get(JobDescription, job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job description not found.",
+        )
+
+    try:
+        await resume_vector_index.ensure_synced(db)
+        with stage_timer("vector_search"):
+            results = resume_vector_index.search(job.content, k=k)
+    except Exception as e:
+        logger.exception("Similarity search failed", extra={"job_id": job_id})
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to search similar resumes: {str(e)}",
+        )
+
+    return {
+        "status": "success",
+        "job_id": job_id,
+        "indexed_resumes": len(resume_vector_index),
+        "results": [{"resume_id": resume_id, "similarity": round(score, 4)} for resume_id, score in results],
+    }
+
+
+async def _list(db: AsyncSession, model, fields: str, limit: int, cursor: str, skills: str) -> dict:
+    try:
+        columns = parse_fields(model, fields, default=LIST_DEFAULT_FIELDS[model])
+        page = await list_rows(db, model, columns, limit, cursor, skills=parse_skills(skills))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return {"status": "success", **page}
+
+
+async def _get(db: AsyncSession, model, row_id: int, fields: str, not_found: str) -> dict:
+    try:
+        columns = parse_fields(model, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    item = await get_row(db, model, row_id, columns)
+    if item is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=not_found)
+    return {"status": "success", "item": item}
+
+
+@router.get("/resumes")
+async def list_resumes(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str = Query(None, description="next_cursor from the previous page"),
+    fields: str = Query(None, description="Comma-separated columns, e.g. id,filename,parsed_data"),
+    skills: str = Query(None, description="Only resumes with all of these skills, e.g. python,docker"),
+    db: AsyncSession = Depends(get_db),
+):
+    """Stored resumes, newest first. Pass `next_cursor` back as `cursor` for the next page."""
+    return await _list(db, Resume, fields, limit, cursor, skills)
+
+
+@router.get("/resumes/{resume_id}")
+async def get_resume(
+    resume_id: int,
+    fields: str = Query(None, description="Comma-separated columns; all by default"),
+    db: AsyncSession = Depends(get_db),
+):
+    return await _get(db, Resume, resume_id, fields, "Resume not found.")
+
+
+@router.get("/jobs")
+async def list_job_descriptions(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str = Query(None, description="next_cursor from the previous page"),
+    fields: str = Query(None, description="Comma-separated columns, e.g. id,title,parsed_data"),
+    skills: str = Query(None, description="Only jobs requiring all of these skills, e.g. python,docker"),
+    db: AsyncSession = Depends(get_db),
+):
+    """Stored job descriptions, newest first. Pass `next_cursor` back as `cursor` for the next page."""
+    return await _list(db, JobDescription, fields, limit, cursor, skills)
+
+
+@router.get("/jobs/{job_id}")
+async def get_job_description(
+    job_id: int,
+    fields: str = Query(None, description="Comma-separated columns; all by default"),
+    db: AsyncSession = Depends(get_db),
+):
+    return await _get(db, JobDescription, job_id, fields, "Job description not found.")
@@ -1,20 +1,65 @@
-from fastapi import FastAPI
+import logging
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse
+from app.api.responses import JSONResponse
 from app.api.routes import router as core_router
 from app.models.session import init_db
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.authroutes import router as auth_router
+from app.services.worker_pool import worker_pool
+from app.services.job_queue import resume_job_queue
+from app.services.storage import close_storage
+from app.services.skill_extractor import get_skill_extractor
+from app.services.logging_setup import setup_logging, stop_logging
+from app.services.metrics import METRICS_ENABLED, REQUEST_LATENCY, registry
 import os
 
+setup_logging()
+logger = logging.getLogger("app.main")
+
 # Only load dotenv locally
 if os.getenv("ENV") != "production":
     from dotenv import load_dotenv
 
     load_dotenv()
-    print("SUPABASE_URL env var is:", os.getenv("SUPABASE_URL"))
-    print("SUPABASE_KEY env var is:", os.getenv("SUPABASE_KEY"))
-    print("DATABASE_URL env var is:", os.getenv("DATABASE_URL"))
+    # Only whether each is set: the values are credentials
+    logger.debug(
+        "Loaded local environment",
+        extra={name: bool(os.getenv(name)) for name in ("SUPABASE_URL", "SUPABASE_KEY", "DATABASE_URL")},
+    )
+
+app = FastAPI(default_response_class=JSONResponse)
+
+registry.gauge(
+    "worker_pool_pending_jobs", "CPU-bound jobs running or queued on the worker pool.", lambda: worker_pool.pending
+)
+registry.gauge(
+    "resume_queue_depth", "Resumes waiting in the background processing queue.", lambda: resume_job_queue.depth
+)
+
+
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    if not METRICS_ENABLED:
+        return await call_next(request)
+    start = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        # The route template (/jobs/{job_id}/rank), not the raw path, keeps label cardinality bounded
+        route = request.scope.get("route")
+        REQUEST_LATENCY.observe(
+            time.perf_counter() - start,
+            method=request.method,
+            route=getattr(route, "path", "unmatched"),
+            status=str(status_code),
+        )
 
-app = FastAPI()
 
 app.include_router(core_router)
 app.include_router(auth_router)
@@ -35,6 +80,20 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def warm_skill_taxonomy():
+    # Compile the taxonomy and its automaton now rather than on the first request
+    get_skill_extractor()
+
+
+@app.on_event("shutdown")
+async def shutdown_workers():
+    await resume_job_queue.stop()
+    worker_pool.shutdown(wait=False)
+    await close_storage()
+    stop_logging()
+
+
 @app.get("/init")
 async def manual_init():
     try:
@@ -44,6 +103,11 @@ async def manual_init():
         return {"message": f"DB init failed: {str(e)}"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.api_route("/health", methods=["GET", "HEAD"])
 async def health_check():
     return {"status": "ok"}
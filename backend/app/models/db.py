@@ -1,33 +1,76 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, func
+from datetime import datetime, timezone
+
+from sqlalchemy import JSON, Column, Index, Integer, String, Text, DateTime, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 
 
 Base = declarative_base()
 
+# JSONB on Postgres (indexable, queried server-side); JSON-encoded TEXT on SQLite
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+
+def _utcnow():
+    return datetime.now(timezone.utc)
+
+
+def skill_keys_index(table: str):
+    """GIN index for `skill_keys @> '[...]'` containment filters (Postgres only)."""
+    return Index(
+        f"ix_{table}_skill_keys",
+        "skill_keys",
+        postgresql_using="gin",
+        postgresql_ops={"skill_keys": "jsonb_path_ops"},
+    ).ddl_if(dialect="postgresql")
+
 
 class Resume(Base):
     __tablename__ = "resumes"
+    # Server defaults (created_at) come back in the INSERT's RETURNING clause,
+    # so new rows need no refresh() round trip after commit
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     filename = Column(String, nullable=False)
     content = Column(Text, nullable=False)  # full raw text of resume
-    parsed_data = Column(Text, nullable=True)  # JSON string of parsed analysis
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    parsed_data = Column(JSONDocument, nullable=True)  # parsed analysis
+    skill_keys = Column(JSONDocument, nullable=True)  # sorted canonical skill names, lowercased
+    # Also set client-side: SQLite stores CURRENT_TIMESTAMP as "YYYY-MM-DD HH:MM:SS"
+    # but binds datetimes with microseconds, and compared as text the two break
+    # keyset pagination cursors (listing.py)
+    created_at = Column(DateTime(timezone=True), default=_utcnow, server_default=func.now())
     file_url = Column(String, nullable=True)
+    content_hash = Column(String(64), nullable=True, index=True)  # SHA-256 of the uploaded file
+
+    # Keyset pagination of GET /resumes (newest first)
+    __table_args__ = (
+        Index("ix_resumes_created_at_id", "created_at", "id"),
+        skill_keys_index("resumes"),
+    )
 
 
 class JobDescription(Base):
     __tablename__ = "job_descriptions"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=True)  # job title if extracted
     content = Column(Text, nullable=False)  # full raw text of job description
-    parsed_data = Column(Text, nullable=True)  # JSON string of parsed analysis
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    parsed_data = Column(JSONDocument, nullable=True)  # parsed analysis
+    skill_keys = Column(JSONDocument, nullable=True)  # sorted canonical skill names, lowercased
+    artifacts = Column(Text, nullable=True)  # JSON string of precomputed matching artifacts
+    created_at = Column(DateTime(timezone=True), default=_utcnow, server_default=func.now())
+
+    __table_args__ = (
+        Index("ix_job_descriptions_created_at_id", "created_at", "id"),
+        skill_keys_index("job_descriptions"),
+    )
 
 
 class User(Base):
     __tablename__ = "users"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String, unique=True, index=True, nullable=False)
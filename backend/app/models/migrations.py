@@ -0,0 +1,72 @@
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.services.skill_taxonomy import get_taxonomy
+
+# create_all() only creates missing tables, so columns and indexes added to
+# existing tables after the initial schema are applied here (idempotently)
+# when /init runs against an existing Postgres database.
+POSTGRES_MIGRATIONS = [
+    "ALTER TABLE resumes ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64)",
+    "CREATE INDEX IF NOT EXISTS ix_resumes_content_hash ON resumes (content_hash)",
+    "ALTER TABLE job_descriptions ADD COLUMN IF NOT EXISTS artifacts TEXT",
+    "CREATE INDEX IF NOT EXISTS ix_resumes_created_at_id ON resumes (created_at, id)",
+    "CREATE INDEX IF NOT EXISTS ix_job_descriptions_created_at_id ON job_descriptions (created_at, id)",
+]
+
+# parsed_data used to be TEXT holding json.dumps() output. The type check
+# keeps /init from rewriting the table again once it is JSONB.
+JSONB_TABLES = ("resumes", "job_descriptions")
+JSONB_MIGRATION = """
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = '{table}' AND column_name = 'parsed_data' AND data_type = 'text'
+    ) THEN
+        ALTER TABLE {table} ALTER COLUMN parsed_data TYPE JSONB USING parsed_data::jsonb;
+    END IF;
+END $$
+"""
+SKILL_KEYS_MIGRATIONS = [
+    "ALTER TABLE {table} ADD COLUMN IF NOT EXISTS skill_keys JSONB",
+    "CREATE INDEX IF NOT EXISTS ix_{table}_skill_keys ON {table} USING GIN (skill_keys jsonb_path_ops)",
+]
+BACKFILL_BATCH_SIZE = 1000
+
+
+def backfill_skill_keys(conn, table: str):
+    """Fill `skill_keys` for rows stored before the column existed."""
+    taxonomy = get_taxonomy()
+    update = text(f"UPDATE {table} SET skill_keys = :keys WHERE id = :id").bindparams(
+        bindparam("keys", type_=JSONB)
+    )
+    while True:
+        rows = conn.execute(
+            text(f"SELECT id, parsed_data FROM {table} WHERE skill_keys IS NULL ORDER BY id LIMIT :n"),
+            {"n": BACKFILL_BATCH_SIZE},
+        ).all()
+        if not rows:
+            return
+        conn.execute(
+            update,
+            [
+                {
+                    "id": row_id,
+                    "keys": taxonomy.skill_keys((parsed or {}).get("skills", ()), (parsed or {}).get("skill_ids", ())),
+                }
+                for row_id, parsed in rows
+            ],
+        )
+
+
+def run_migrations(conn):
+    if conn.dialect.name != "postgresql":
+        return
+    for statement in POSTGRES_MIGRATIONS:
+        conn.execute(text(statement))
+    for table in JSONB_TABLES:
+        conn.execute(text(JSONB_MIGRATION.format(table=table)))
+        for statement in SKILL_KEYS_MIGRATIONS:
+            conn.execute(text(statement.format(table=table)))
+        backfill_skill_keys(conn, table)
@@ -1,26 +1,73 @@
 import os
 import ssl
 from dotenv import load_dotenv
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from app.models.db import Base
+from app.models.migrations import run_migrations
+from app.services import json_codec
 from contextlib import asynccontextmanager
 
-print("DATABASE_URL env var is:", os.getenv("DATABASE_URL"))
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-# Create SSL context for Neon DB connection
-ssl_context = ssl.create_default_context()
-ssl_context.check_hostname = False
-ssl_context.verify_mode = ssl.CERT_NONE
+# Statement logging is synchronous and very chatty; only on for local development
+DB_ECHO = os.getenv("DB_ECHO", str(os.getenv("ENV") == "development")).lower() == "true"
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# Recycle before the server (or Neon's proxy) drops idle connections
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+# Compiled SQL cache (SQLAlchemy) and server-side prepared statements per
+# connection (asyncpg). Set DB_STATEMENT_CACHE_SIZE=0 behind pgbouncer in
+# transaction mode, which cannot keep prepared statements.
+DB_QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", "500"))
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "500"))
+DB_SSL = os.getenv("DB_SSL", "true").lower() == "true"
 
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=True,
-    connect_args={"ssl": ssl_context},  # Pass SSL context here for secure connection
-)
+
+def _ssl_context():
+    # Create SSL context for Neon DB connection
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def engine_options(database_url: str) -> dict:
+    """create_async_engine() keyword arguments for the configured database."""
+    options = {
+        "echo": DB_ECHO,
+        "query_cache_size": DB_QUERY_CACHE_SIZE,
+        # JSON/JSONB columns (parsed_data, skill_keys) go through orjson
+        "json_serializer": json_codec.dumps_str,
+        "json_deserializer": json_codec.loads,
+    }
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        # Local/test stand-in: aiosqlite picks its own pool, and SSL does not apply
+        return options
+
+    options.update(
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+    )
+    connect_args = {}
+    if url.get_driver_name() == "asyncpg":
+        connect_args["prepared_statement_cache_size"] = DB_STATEMENT_CACHE_SIZE
+    if DB_SSL:
+        connect_args["ssl"] = _ssl_context()
+    options["connect_args"] = connect_args
+    return options
+
+
+engine = create_async_engine(DATABASE_URL, **engine_options(DATABASE_URL))
 
 AsyncSessionLocal = sessionmaker(
     bind=engine, class_=AsyncSession, expire_on_commit=False
@@ -41,3 +88,4 @@ async def get_db():
 async def init_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(run_migrations)
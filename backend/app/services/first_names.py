@@ -0,0 +1,53 @@
+# Common given names (lowercase) across the regions our resumes come from.
+# Used by name_extractor as evidence that a header line is a person's name;
+# a name missing from here only lowers confidence, it is never rejected.
+FIRST_NAMES = frozenset(
+    """
+    aaron abby abdul abdullah abel abhishek abigail abraham adam adebayo adeel adel aditi aditya adrian
+    adriana agnes ahmad ahmed aidan aiden aisha akash akira akosua alan albert alberto alejandra alejandro
+    aleksandr aleksandra alex alexa alexander alexandra alexandre alexis alfonso alfred ali alice alicia alina
+    alisha alison allison alma amanda amber amelia amina amir amit amy ana anand ananya anastasia andre
+    andrea andreas andres andrew andrzej andy angel angela angelica angelo anil anita anja ankit ann anna
+    anne annie anthony antoine anton antonio anuj anwar arjun arnav arthur arturo arun aryan asha ashley
+    ashok astrid aurelia austin ava axel ayesha ayodele ayumi barbara barry beatriz bella ben benjamin
+    bernard beth bethany betty bianca bilal bill billy blake bob bogdan bonnie boris brad bradley brandon
+    brenda brendan brian brianna bridget brittany brooke bruce bruno bryan caleb cameron camila camille
+    carl carla carlos carmen carol caroline carolyn carter casey catalina catherine cecilia celine chad
+    chandra charles charlie charlotte chelsea chen cheng cheryl chidi chinedu chioma chloe chris christian
+    christina christine christopher cindy claire clara claudia clement colin connor constance cora craig
+    cristina crystal cynthia daisy dale damian dan dana daniel daniela danielle daria dario darius darren
+    david dawn dean deborah deepak deepika denis denise dennis derek desmond devon dhruv diana diane diego
+    dilip dimitri dinesh divya dmitri dominic donald donna dora doris dorothy douglas dylan ebony edgar
+    edith eduardo edward edwin eileen elaine elena eli elias elif elijah elisa elizabeth ella ellen ellie
+    elsa emeka emil emily emma emmanuel enrique eric erica erik erin ernesto esther ethan eugene eva evan
+    evelyn fabian fahad faisal farah farid fatima federico felipe felix fernando filip fiona florian
+    frances francesca francis francisco frank franklin fred freya gabriel gabriela gabrielle gareth gary
+    gaurav gavin gemma george georgia gerald gerardo gina giorgio giovanni giulia glenn gloria gonzalo
+    gordon grace graham grant greg gregory gustavo hailey hamid hamza hana hannah hans harold harper harris
+    harry harsh hassan hayley heather hector heidi helen helena henry hiroshi hiroto hoang holly hong hugo
+    hui hussein ian ibrahim ida igor ikechukwu ilya imran ines ingrid irene iris isaac isabel isabella
+    isabelle ishaan ivan jack jackson jacob jacqueline jade jake james jamie jan jane janet janice jared
+    jasmine jason javier jay jayden jean jeff jeffrey jenna jennifer jenny jeremy jerome jerry jesse
+    jessica jesus jia jian jiang jill jin jing joan joanna joao joe joel johan johanna john johnny jon
+    jonas jonathan jordan jorge jose joseph josephine joshua joy joyce juan judith julia julian juliana
+    julie julien julio jun justin kai kamal kana karan karen karim karina karl kate katherine kathleen
+    kathryn katie kavya kayla keith kelly ken kenji kenneth kevin khalid kim kimberly kirsten klaus kofi
+    kristen kumar kunal kwame kyle lakshmi lara laura lauren lawrence leah lee leila lena leo leon leonardo
+    li lily linda lisa liu lokesh lorenzo louis louise lucas lucia luis luisa luka lukas luke lydia madison
+    magdalena mahmoud maja makoto malik manoj manuel marc marcel marco marcus margaret maria mariana marie
+    marina mario mark marta martha martin mary mason mateo matteo matthew maurice max maxim maya megan
+    mehmet mei melanie melissa mia michael michelle miguel mikhail milan min mohamed mohammad mohammed
+    monica morgan muhammad mustafa nadia naomi natalia natalie nathan neha nicholas nicole nikhil nikita
+    nikolai nina noah nora nuno olga oliver olivia omar oscar owen pablo pamela paolo patricia patrick
+    paul paula pedro peng peter philip pierre pooja prakash pranav priya priyanka rachel rafael rahul raj
+    rajesh rakesh ram ramesh rana raphael raul ravi rebecca reza ricardo richard rita robert roberto
+    robin rohan rohit roman ronald rosa ruby rui ruth ryan sabrina sachin sahil sakura salma sam samantha
+    samir samuel sandeep sandra sanjay santiago sara sarah sean sebastian sergei sergio seung shanthi
+    sharon shawn sheila shirley shreya shruti simon simone sneha sofia sonia sophia sophie stefan
+    stephanie stephen steven sunil susan suresh svetlana sven takashi tanvir tara tatiana teresa thomas
+    tiffany tim timothy tobias todd tom tomas tony tracy tyler uchenna valentina valeria vanessa varun
+    vera veronica victor victoria vijay vikram vincent vinod vivek vladimir walter wang wei wendy william
+    xavier xin yan yang yasmin yi ying yosef youssef yuki yusuf yuto zach zachary zainab zara zhang zhao
+    zoe zoltan
+    """.split()
+)
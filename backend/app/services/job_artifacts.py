@@ -0,0 +1,146 @@
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.db import JobDescription
+from app.services import json_codec
+from app.services.similarity import get_similarity_backend
+from app.services.skill_taxonomy import get_taxonomy
+
+# Bump whenever the shape or derivation of the artifacts changes; stored
+# artifacts with another version are rebuilt on first use.
+JOB_ARTIFACT_VERSION = 2
+JOB_ARTIFACT_CACHE_SIZE = int(os.getenv("JOB_ARTIFACT_CACHE_SIZE", "256"))
+
+
+@dataclass(frozen=True)
+class JobArtifacts:
+    """Everything the matcher derives from a job, computed once per job."""
+
+    version: int
+    skills: tuple  # normalized (lowercased) job skills
+    skill_choices: tuple  # rapidfuzz-preprocessed skills (token-sorted), same order
+    skill_ids: tuple  # taxonomy id of each skill (None if unknown), same order
+    taxonomy_version: int
+    similarity_backend: str
+    description_vector: Any
+
+    @property
+    def is_current(self) -> bool:
+        current = (JOB_ARTIFACT_VERSION, get_taxonomy().version, get_similarity_backend().name)
+        return (self.version, self.taxonomy_version, self.similarity_backend) == current
+
+
+def token_sort(skill: str) -> str:
+    # fuzz.ratio on token-sorted strings equals fuzz.token_sort_ratio on the
+    # originals, so the job side only has to be sorted once.
+    return " ".join(sorted(skill.split()))
+
+
+@lru_cache(maxsize=256)
+def job_description_vector(job_description: str, backend_name: str = None):
+    """Job-side similarity vector, computed once per distinct description."""
+    return get_similarity_backend(backend_name).vectorize(job_description)
+
+
+def build_job_artifacts(job: dict) -> JobArtifacts:
+    skills = tuple(sorted(set(skill.lower() for skill in job.get("skills", []))))
+    taxonomy = get_taxonomy()
+    job_description = job.get("description", "").lower()
+    backend = get_similarity_backend()
+    vector = (
+        job_description_vector(job_description, backend.name)
+        if job_description.strip()
+        else None
+    )
+    return JobArtifacts(
+        version=JOB_ARTIFACT_VERSION,
+        skills=skills,
+        skill_choices=tuple(token_sort(skill) for skill in skills),
+        skill_ids=tuple(taxonomy.lookup(skill) for skill in skills),
+        taxonomy_version=taxonomy.version,
+        similarity_backend=backend.name,
+        description_vector=vector,
+    )
+
+
+def dump_job_artifacts(artifacts: JobArtifacts) -> str:
+    backend = get_similarity_backend(artifacts.similarity_backend)
+    vector = artifacts.description_vector
+    return json_codec.dumps_str(
+        {
+            "version": artifacts.version,
+            "skills": list(artifacts.skills),
+            "skill_choices": list(artifacts.skill_choices),
+            "skill_ids": list(artifacts.skill_ids),
+            "taxonomy_version": artifacts.taxonomy_version,
+            "similarity_backend": artifacts.similarity_backend,
+            "description_vector": None if vector is None else backend.serialize(vector),
+        }
+    )
+
+
+def load_job_artifacts(data: str) -> JobArtifacts:
+    payload = json_codec.loads(data)
+    backend = get_similarity_backend(payload["similarity_backend"])
+    vector = payload["description_vector"]
+    return JobArtifacts(
+        version=payload["version"],
+        skills=tuple(payload["skills"]),
+        skill_choices=tuple(payload["skill_choices"]),
+        skill_ids=tuple(payload["skill_ids"]),
+        taxonomy_version=payload["taxonomy_version"],
+        similarity_backend=payload["similarity_backend"],
+        description_vector=None if vector is None else backend.deserialize(vector),
+    )
+
+
+class JobArtifactStore:
+    """In-memory LRU of artifacts by job id, backed by `JobDescription.artifacts`."""
+
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+
+    def put(self, job_id: int, artifacts: JobArtifacts):
+        if self.max_size <= 0:
+            return
+        self._entries[job_id] = artifacts
+        self._entries.move_to_end(job_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def get(self, db: AsyncSession, job_id: int):
+        """Artifacts for a stored job, or None if the job does not exist."""
+        artifacts = self._entries.get(job_id)
+        if artifacts is not None and artifacts.is_current:
+            self._entries.move_to_end(job_id)
+            return artifacts
+
+        job = await db.get(JobDescription, job_id)
+        if job is None:
+            return None
+
+        artifacts = None
+        if job.artifacts:
+            try:
+                artifacts = load_job_artifacts(job.artifacts)
+            except (ValueError, KeyError):
+                artifacts = None
+
+        if artifacts is None or not artifacts.is_current:
+            # Stale or missing (e.g. analyzed before artifacts existed): rebuild once and persist
+            parsed_job = job.parsed_data or {}
+            artifacts = build_job_artifacts(parsed_job)
+            job.artifacts = dump_job_artifacts(artifacts)
+            await db.commit()
+
+        self.put(job_id, artifacts)
+        return artifacts
+
+
+job_artifact_store = JobArtifactStore(max_size=JOB_ARTIFACT_CACHE_SIZE)
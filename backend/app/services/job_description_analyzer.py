@@ -1,22 +1,52 @@
-import spacy
-from spacy.matcher import PhraseMatcher
 import re
-from app.services.skills_list import skills_list
+from app.services.skill_extractor import extract_skill_ids, skill_names
 
-nlp = spacy.load("en_core_web_sm")
+ROLE_KEYWORDS = re.compile(
+    r"(developer|engineer|intern|analyst|scientist|designer|manager)", re.I
+)
 
-matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
-patterns = [nlp.make_doc(skill) for skill in skills_list if skill.strip()]
-matcher.add("SKILLS", patterns)
+# Experience patterns (improved)
+EXPERIENCE_PATTERNS = [
+    re.compile(pattern, re.I)
+    for pattern in (
+        r"\d+\+?\s*years?\s*(?:of\s*)?experience",
+        r"hands[-\s]?on experience(?: with [\w\s,]+)?",
+        r"proven experience(?: with [\w\s,]+)?",
+        r"preferred experience(?: with [\w\s,]+)?",
+        r"experience with [\w\s,]+",
+        r"previous (academic|personal|work|project) (experience|projects).*",
+        r"background (in|with) [\w\s]+",
+        r"internship.*?(\d+[-–]\d+\s*(?:month|week)s?)",
+        r"duration.*?(\d+[-–]\d+\s*(?:month|week)s?)",
+        r"(\d+[-–]\d+\s*(?:month|week)s?)\s*(?:internship|program)",
+        r"basic knowledge of [\w\s,]+",
+        r"familiarity with [\w\s,]+",
+        r"exposure to [\w\s,]+",
+    )
+]
+
+# Internship-specific patterns, tried if no experience was found
+INTERNSHIP_PATTERNS = [
+    re.compile(pattern, re.I)
+    for pattern in (
+        r"internship.*?(\d+[-–]\d+\s*(?:month|week)s?)",
+        r"(\d+[-–]\d+\s*(?:month|week)s?)\s*internship",
+        r"duration.*?(\d+[-–]\d+\s*(?:month|week)s?)",
+    )
+]
+
+EDUCATION_KEYWORDS = ["bachelor", "master", "phd", "mba", "degree", "diploma"]
+
+RESPONSIBILITIES_HEADER = re.compile(r"key responsibilities", re.I)
+RESPONSIBILITIES_END = re.compile(
+    r"(?i)(preferred|required|qualification|experience|education|about|additional|internship|skills|summary)"
+)
 
 
 def analyze_job_description(text: str) -> dict:
     lines = [line.rstrip() for line in text.split("\n")]
 
     # Extract title
-    role_keywords = re.compile(
-        r"(developer|engineer|intern|analyst|scientist|designer|manager)", re.I
-    )
     title = None
     passed_intro = False
 
@@ -24,7 +54,7 @@ def analyze_job_description(text: str) -> dict:
         if not passed_intro and "about the job" in line.lower():
             passed_intro = True
             continue
-        if passed_intro and role_keywords.search(line):
+        if passed_intro and ROLE_KEYWORDS.search(line):
             title = line.strip()
             break
 
@@ -34,53 +64,31 @@ def analyze_job_description(text: str) -> dict:
     result = {
         "title": title,
         "skills": [],
+        "skill_ids": [],
         "experience": None,
         "education": [],
         "responsibilities": [],
         "description": text.lower(),
     }
 
-    # Experience patterns (improved)
-    experience_patterns = [
-        r"\d+\+?\s*years?\s*(?:of\s*)?experience",
-        r"hands[-\s]?on experience(?: with [\w\s,]+)?",
-        r"proven experience(?: with [\w\s,]+)?",
-        r"preferred experience(?: with [\w\s,]+)?",
-        r"experience with [\w\s,]+",
-        r"previous (academic|personal|work|project) (experience|projects).*",
-        r"background (in|with) [\w\s]+",
-        r"internship.*?(\d+[-–]\d+\s*(?:month|week)s?)",
-        r"duration.*?(\d+[-–]\d+\s*(?:month|week)s?)",
-        r"(\d+[-–]\d+\s*(?:month|week)s?)\s*(?:internship|program)",
-        r"basic knowledge of [\w\s,]+",
-        r"familiarity with [\w\s,]+",
-        r"exposure to [\w\s,]+",
-    ]
-
-    for pattern in experience_patterns:
-        match = re.search(pattern, text, re.I)
+    for pattern in EXPERIENCE_PATTERNS:
+        match = pattern.search(text)
         if match:
             result["experience"] = match.group(0).strip()
             break
 
-    # If no experience found, look for internship-specific patterns
     if not result["experience"]:
-        internship_patterns = [
-            r"internship.*?(\d+[-–]\d+\s*(?:month|week)s?)",
-            r"(\d+[-–]\d+\s*(?:month|week)s?)\s*internship",
-            r"duration.*?(\d+[-–]\d+\s*(?:month|week)s?)",
-        ]
-        for pattern in internship_patterns:
-            match = re.search(pattern, text, re.I)
+        for pattern in INTERNSHIP_PATTERNS:
+            match = pattern.search(text)
             if match:
                 result["experience"] = f"Internship: {match.group(1)}"
                 break
 
     # Education
-    education_keywords = ["bachelor", "master", "phd", "mba", "degree", "diploma"]
+    lowered = result["description"]
     found_education = set()
-    for keyword in education_keywords:
-        if keyword in text.lower():
+    for keyword in EDUCATION_KEYWORDS:
+        if keyword in lowered:
             found_education.add(keyword)
     result["education"] = sorted(found_education)
 
@@ -89,48 +97,32 @@ def analyze_job_description(text: str) -> dict:
     collecting = False
     for line in lines:
         line_strip = line.strip()
-        if re.search(r"key responsibilities", line_strip, re.I):
+        if RESPONSIBILITIES_HEADER.search(line_strip):
             collecting = True
             continue
 
         if collecting:
             # Stop collecting when a new section starts
-            if re.match(
-                r"(?i)(preferred|required|qualification|experience|education|about|additional|internship|skills|summary)",
-                line_strip,
-            ):
+            if RESPONSIBILITIES_END.match(line_strip):
                 break
             # Collect bullet points or non-empty lines (ignore blank lines)
-            if re.match(r"[-•]", line_strip):
+            if line_strip.startswith(("-", "•")):
                 responsibilities.append(line_strip.lstrip("-• ").strip())
             elif line_strip:
                 responsibilities.append(line_strip)
 
     result["responsibilities"] = responsibilities
 
-    # Skills extraction with improved matching
-    doc = nlp(text.lower())
-    skills = set()
+    # Skills: one pass of the shared dictionary automaton; canonical taxonomy
+    # ids for matching, lowercase canonical names for display
+    result["skill_ids"] = extract_skill_ids(text)
+    result["skills"] = sorted(name.lower() for name in skill_names(result["skill_ids"]))
 
-    # Use PhraseMatcher for exact matches
-    matches = matcher(doc)
-    for _, start, end in matches:
-        span = doc[start:end]
-        skills.add(span.text.lower())
-
-    # Additional pattern matching for skills that might be missed
-    skill_patterns = [
-        r"\b(excel|sql|python|pandas|matplotlib|power\s*bi|tableau|google\s*sheets)\b",
-        r"\b(java|javascript|react|node\.js|html|css|docker|kubernetes)\b",
-        r"\b(aws|azure|google\s*cloud|firebase|mongodb|postgresql|mysql)\b",
-        r"\b(data\s*analytics|data\s*science|machine\s*learning|ai|ml)\b",
-    ]
-
-    for pattern in skill_patterns:
-        matches = re.finditer(pattern, text.lower())
-        for match in matches:
-            skills.add(match.group(1))
+    return result
 
-    result["skills"] = sorted(list(skills))
 
-    return result
+def analyze_job_descriptions(texts) -> list:
+    """analyze_job_description for many texts (bulk re-analysis)."""
+    # Nothing here runs a spaCy pipeline (skills come from the shared
+    # automaton), so there is no nlp.pipe batching to gain: one pass per text.
+    return [analyze_job_description(text) for text in texts]
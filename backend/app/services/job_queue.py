@@ -0,0 +1,155 @@
+import asyncio
+import logging
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+
+from app.models.session import get_db_context
+from app.services.resume_pipeline import ResumeProcessingError, UploadItem, process_resume
+
+logger = logging.getLogger(__name__)
+
+RESUME_QUEUE_WORKERS = int(os.getenv("RESUME_QUEUE_WORKERS", "2"))
+RESUME_QUEUE_MAX_SIZE = int(os.getenv("RESUME_QUEUE_MAX_SIZE", "100"))
+# Finished jobs are kept this long so clients can poll for the result
+RESUME_JOB_TTL_SECONDS = int(os.getenv("RESUME_JOB_TTL_SECONDS", "3600"))
+
+# Fraction of the pipeline done once a stage completes
+STAGE_PROGRESS = {
+    "queued": 0.0,
+    "running": 0.05,
+    "extracted": 0.4,
+    "analyzed": 0.6,
+    "uploaded": 0.8,
+    "stored": 1.0,
+    "cached": 1.0,
+}
+
+
+class QueueFull(Exception):
+    """Raised when RESUME_QUEUE_MAX_SIZE jobs are already waiting."""
+
+
+@dataclass
+class ProcessingJob:
+    id: str
+    filename: str
+    status: str = "queued"  # queued | running | succeeded | failed
+    stage: str = "queued"
+    progress: float = 0.0
+    result: dict = None
+    error: dict = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    def set_stage(self, stage: str):
+        self.stage = stage
+        self.progress = STAGE_PROGRESS.get(stage, self.progress)
+        self.updated_at = time.time()
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.id,
+            "filename": self.filename,
+            "status": self.status,
+            "stage": self.stage,
+            "progress": self.progress,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+class ResumeJobQueue:
+    """
+    In-process asyncio queue running the resume pipeline in background workers.
+    Needs no external broker; the trade-off is that queued and finished jobs
+    live in memory and do not survive a restart.
+    """
+
+    def __init__(self, workers=2, max_size=100, ttl_seconds=3600):
+        self.workers = max(1, workers)
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._queue = None
+        self._loop = None
+        self._tasks = []
+        self._jobs = {}
+
+    def _ensure_started(self):
+        # Workers start lazily on the running loop with the first submission
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and not all(task.done() for task in self._tasks):
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    @property
+    def depth(self) -> int:
+        """Resumes waiting for a worker."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, item: UploadItem) -> ProcessingJob:
+        self._ensure_started()
+        self._prune()
+        job = ProcessingJob(id=uuid.uuid4().hex, filename=item.filename)
+        try:
+            self._queue.put_nowait((job, item))
+        except asyncio.QueueFull:
+            raise QueueFull(f"{self._queue.qsize()} resumes are already waiting.")
+        self._jobs[job.id] = job
+        return job
+
+    def get(self, job_id: str):
+        return self._jobs.get(job_id)
+
+    def _prune(self):
+        cutoff = time.time() - self.ttl_seconds
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.status in ("succeeded", "failed") and job.updated_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    async def _worker(self):
+        while True:
+            job, item = await self._queue.get()
+            try:
+                await self._run(job, item)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: ProcessingJob, item: UploadItem):
+        job.status = "running"
+        job.set_stage("running")
+        try:
+            async with get_db_context() as db:
+                # Background work queues for a pool slot instead of failing with 503
+                job.result = await process_resume(db, item, wait=True, on_stage=job.set_stage)
+            job.status = "succeeded"
+        except ResumeProcessingError as e:
+            job.status = "failed"
+            job.error = {"status_code": e.status_code, "detail": e.detail}
+        except Exception as e:
+            logger.exception("Resume job failed", extra={"job_id": job.id})
+            job.status = "failed"
+            job.error = {"status_code": 500, "detail": str(e)}
+        job.updated_at = time.time()
+
+
+resume_job_queue = ResumeJobQueue(
+    workers=RESUME_QUEUE_WORKERS,
+    max_size=RESUME_QUEUE_MAX_SIZE,
+    ttl_seconds=RESUME_JOB_TTL_SECONDS,
+)
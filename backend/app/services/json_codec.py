@@ -0,0 +1,26 @@
+import orjson
+
+# NumPy arrays and scalars (scores, ids) and non-str dict keys serialize
+# without a jsonable_encoder pass first
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj):
+    # NumPy scalars other than float64 (a float subclass) are not natively supported
+    if hasattr(obj, "item"):
+        return obj.item()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(obj) -> bytes:
+    return orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS)
+
+
+def dumps_str(obj) -> str:
+    """For APIs that want text (SQLAlchemy's json_serializer, Text columns)."""
+    return dumps(obj).decode()
+
+
+loads = orjson.loads
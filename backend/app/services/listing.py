@@ -0,0 +1,114 @@
+import base64
+from datetime import datetime
+
+from sqlalchemy import Text, and_, cast, literal, select, tuple_
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.db import JobDescription, Resume
+from app.services import json_codec
+from app.services.skill_taxonomy import get_taxonomy
+
+# Columns each listing may project. The large Text columns (`content`,
+# `parsed_data`) are only read when explicitly requested.
+RESUME_FIELDS = (
+    "id", "created_at", "filename", "file_url", "content_hash", "skill_keys", "content", "parsed_data",
+)
+JOB_FIELDS = ("id", "created_at", "title", "skill_keys", "content", "parsed_data")
+LIST_DEFAULT_FIELDS = {
+    Resume: ("id", "created_at", "filename", "file_url"),
+    JobDescription: ("id", "created_at", "title"),
+}
+_ALLOWED_FIELDS = {Resume: RESUME_FIELDS, JobDescription: JOB_FIELDS}
+# Every page carries these so the next cursor can be built
+_KEY_FIELDS = ("id", "created_at")
+
+
+def parse_fields(model, fields: str = None, default: tuple = None) -> tuple:
+    """
+    Column names from a comma-separated `fields` parameter (or `default`, or
+    every allowed column). Raises ValueError for unknown names.
+    """
+    allowed = _ALLOWED_FIELDS[model]
+    if not fields:
+        return default or allowed
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(allowed)}")
+    return tuple(dict.fromkeys((*_KEY_FIELDS, *requested)))
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    payload = json_codec.dumps([created_at.isoformat() if created_at else None, row_id])
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """(created_at, id) from an opaque cursor; ValueError if it is malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json_codec.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (TypeError, ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor.")
+
+
+def parse_skills(skills: str = None) -> list:
+    """Canonical skill keys from a comma-separated `skills` parameter."""
+    if not skills:
+        return []
+    return get_taxonomy().skill_keys(skills.split(","))
+
+
+def has_skills(column, keys: list, dialect: str):
+    """SQL predicate: the `skill_keys` array `column` contains every key."""
+    if dialect == "postgresql":
+        # JSONB containment, answered from the GIN (jsonb_path_ops) index
+        return column.op("@>")(literal(keys, JSONB))
+    # SQLite stores the array as JSON text (written by json_codec); match each quoted element
+    return and_(*(cast(column, Text).contains(json_codec.dumps_str(key), autoescape=True) for key in keys))
+
+
+def _serialize(row, fields: tuple) -> dict:
+    item = {}
+    for name, value in zip(fields, row):
+        if name == "created_at" and value is not None:
+            value = value.isoformat()
+        item[name] = value
+    return item
+
+
+async def list_rows(
+    db: AsyncSession, model, fields: tuple, limit: int, cursor: str = None, skills: list = None
+) -> dict:
+    """
+    One page of `model` rows, newest first, as {"items", "next_cursor"},
+    optionally only rows having every one of the canonical `skills` keys.
+
+    Keyset pagination on (created_at, id): each page is an index range scan on
+    the composite (created_at, id) index starting right after the cursor, so
+    the cost of a page does not grow with how deep into the listing it is.
+    """
+    columns = [getattr(model, name) for name in fields]
+    query = select(*columns).order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1)
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.where(tuple_(model.created_at, model.id) < (created_at, row_id))
+    if skills:
+        query = query.where(has_skills(model.skill_keys, skills, db.bind.dialect.name))
+
+    rows = (await db.execute(query)).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    return {"items": [_serialize(row, fields) for row in rows], "next_cursor": next_cursor}
+
+
+async def get_row(db: AsyncSession, model, row_id: int, fields: tuple):
+    """One row projected to `fields`, or None."""
+    columns = [getattr(model, name) for name in fields]
+    row = (await db.execute(select(*columns).where(model.id == row_id))).first()
+    return None if row is None else _serialize(row, fields)
@@ -0,0 +1,77 @@
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
+
+from app.services import json_codec
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# "json" (one object per line, for log shippers) or "text" (for a terminal)
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json")
+
+# Attributes every LogRecord has; anything else was passed via `extra=`
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName"}
+
+_JSON_TYPES = (str, int, float, bool, type(None), list, dict)
+
+_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value if isinstance(value, _JSON_TYPES) else str(value)
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json_codec.dumps_str(entry)
+
+
+class TextFormatter(logging.Formatter):
+    converter = time.gmtime
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        extras = {k: v for k, v in vars(record).items() if k not in _RECORD_ATTRIBUTES}
+        return f"{line} {extras}" if extras else line
+
+
+def setup_logging():
+    """
+    Route the `app` loggers through a QueueHandler. Request handlers only
+    enqueue records; a QueueListener thread formats them and does the
+    blocking write to stdout. Idempotent.
+    """
+    global _listener
+    if _listener is not None:
+        return
+    log_queue = queue.SimpleQueue()
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(JsonFormatter() if LOG_FORMAT == "json" else TextFormatter())
+
+    logger = logging.getLogger("app")
+    logger.setLevel(LOG_LEVEL)
+    logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    logger.propagate = False
+
+    _listener = logging.handlers.QueueListener(log_queue, stream, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging():
+    """Flush queued records and stop the listener thread (on shutdown)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
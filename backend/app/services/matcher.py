@@ -1,12 +1,23 @@
+import os
+import numpy as np
 from rapidfuzz import fuzz, process
-from difflib import SequenceMatcher
+from app.services.job_artifacts import JobArtifacts, build_job_artifacts, token_sort
+from app.services.similarity import get_similarity_backend
+from app.services.skill_bitset import decode_skill_ids, encode_skill_ids
+from app.services.skill_taxonomy import get_taxonomy
+
+# Threads used by rapidfuzz.process.cdist; -1 uses every core.
+FUZZY_MATCH_WORKERS = int(os.getenv("FUZZY_MATCH_WORKERS", "1"))
+# Fuzzy-match the skills the taxonomy cannot resolve; off means ids only
+SKILL_FUZZY_FALLBACK = os.getenv("SKILL_FUZZY_FALLBACK", "true").lower() == "true"
 
 
 def text_similarity(text1, text2):
-    """Simple text similarity without ML models"""
+    """Simple text similarity without ML models, using the configured backend"""
     if not text1 or not text2:
         return 0.0
-    return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
+    backend = get_similarity_backend()
+    return backend.score(backend.vectorize(text1), backend.vectorize(text2))
 
 
 def fuzzy_skill_match(resume_skills, job_skills, threshold=80):
@@ -14,60 +25,169 @@ def fuzzy_skill_match(resume_skills, job_skills, threshold=80):
     Perform fuzzy matching between resume skills and job skills using rapidfuzz.
     Returns a set of matched skills from job_skills.
     """
-    matched_skills = set()
-    for r_skill in resume_skills:
-        best_match = process.extractOne(
-            r_skill, job_skills, scorer=fuzz.token_sort_ratio
-        )
-        if best_match and best_match[1] >= threshold:
-            matched_skills.add(best_match[0])
-    return matched_skills
+    return fuzzy_skill_match_batch([resume_skills], job_skills, threshold)[0]
 
 
-def match_resume_to_job(resume: dict, job: dict) -> dict:
-    # Lowercase sets of skills from resume and job description
-    resume_skills = set([skill.lower() for skill in resume.get("skills", [])])
-    job_skills = set([skill.lower() for skill in job.get("skills", [])])
+def fuzzy_skill_match_batch(resume_skill_lists, job_skills, threshold=80, workers=None):
+    """
+    Vectorized fuzzy_skill_match for many resumes against one job.
 
-    # Extract all bullets from experience entries
-    experience_entries = resume.get("experience", [])
-    all_bullets = []
-    for entry in experience_entries:
-        bullets = entry.get("bullets", [])
-        all_bullets.extend(bullets)
+    All resume skills are scored against all job skills in a single
+    rapidfuzz cdist call; each resume skill keeps its best job skill (first
+    one on ties, like process.extractOne) if it reaches the threshold.
+    Returns one set of matched job skills per entry of resume_skill_lists.
+    """
+    job_choices = list(job_skills)
+    return _fuzzy_match_preprocessed(
+        resume_skill_lists,
+        job_choices,
+        [token_sort(skill) for skill in job_choices],
+        threshold,
+        workers,
+    )
 
-    # Join all bullets to a single string
-    resume_experience_text = " ".join(all_bullets).lower()
 
-    # Lowercase job description text
-    job_description = job.get("description", "").lower()
+def _fuzzy_match_preprocessed(resume_skill_lists, job_choices, processed_choices, threshold, workers):
+    # processed_choices are the token-sorted job_choices, so plain fuzz.ratio
+    # below gives exactly the fuzz.token_sort_ratio scores.
+    resume_skill_lists = [list(skills) for skills in resume_skill_lists]
+    flat_skills = [token_sort(skill) for skills in resume_skill_lists for skill in skills]
+    if not job_choices or not flat_skills:
+        return [set() for _ in resume_skill_lists]
 
-    # Fuzzy skill matching
-    matched_skills = fuzzy_skill_match(resume_skills, job_skills, threshold=80)
-    skill_match_score = (
-        round(len(matched_skills) / len(job_skills), 2) if job_skills else 0.0
+    scores = process.cdist(
+        flat_skills,
+        processed_choices,
+        scorer=fuzz.ratio,
+        score_cutoff=threshold,
+        dtype=np.float64,
+        workers=FUZZY_MATCH_WORKERS if workers is None else workers,
     )
+    best = scores.argmax(axis=1)
+    matched_rows = scores[np.arange(len(flat_skills)), best] >= threshold
+
+    results = []
+    offset = 0
+    for skills in resume_skill_lists:
+        end = offset + len(skills)
+        results.append(
+            {job_choices[j] for j, ok in zip(best[offset:end], matched_rows[offset:end]) if ok}
+        )
+        offset = end
+    return results
+
 
-    # Calculate missing skills
-    missing_skills = list(job_skills - matched_skills)
+def resume_skill_profile(resume: dict) -> tuple:
+    """
+    (skill bitset, skills outside the taxonomy) for a parsed resume. Callers
+    that match the same resume repeatedly (the skill index) precompute these
+    as "skill_vector" / "unresolved_skills".
+    """
+    if "skill_vector" in resume:
+        return resume["skill_vector"], resume.get("unresolved_skills", [])
+    skills = {skill.lower() for skill in resume.get("skills", [])}
+    resolved, unresolved = get_taxonomy().resolve(skills)
+    resolved.update(resume.get("skill_ids") or ())
+    return encode_skill_ids(resolved), unresolved
+
+
+def match_skill_sets(resumes: list, artifacts: JobArtifacts) -> list:
+    """
+    Job skills (from artifacts.skills) matched by each resume. Skills that
+    resolve to taxonomy ids are matched by AND-ing bitsets; only what the
+    taxonomy cannot resolve goes through the fuzzy matcher.
+    """
+    job_skills_by_id = {}
+    for skill, skill_id in zip(artifacts.skills, artifacts.skill_ids):
+        if skill_id is not None:
+            job_skills_by_id.setdefault(skill_id, []).append(skill)
+    job_vector = encode_skill_ids(job_skills_by_id)
+    # Free-form job skills (e.g. a hand-written /match request) can only be matched fuzzily
+    job_has_unresolved = None in artifacts.skill_ids
+
+    matched_skill_sets = []
+    fuzzy_inputs = []
+    for resume in resumes:
+        vector, unresolved = resume_skill_profile(resume)
+        matched_skill_sets.append(
+            {skill for skill_id in decode_skill_ids(vector & job_vector) for skill in job_skills_by_id[skill_id]}
+        )
+        if job_has_unresolved:
+            fuzzy_inputs.append([skill.lower() for skill in resume.get("skills", [])])
+        else:
+            fuzzy_inputs.append(unresolved)
 
-    # Experience similarity using lightweight text comparison
-    if resume_experience_text.strip() and job_description.strip():
-        experience_match_score = round(
-            text_similarity(resume_experience_text, job_description), 2
+    if SKILL_FUZZY_FALLBACK and any(fuzzy_inputs):
+        fuzzy_matches = _fuzzy_match_preprocessed(
+            fuzzy_inputs,
+            artifacts.skills,
+            artifacts.skill_choices,
+            threshold=80,
+            workers=None,
         )
-    else:
-        experience_match_score = 0.0
+        for matched, fuzzy in zip(matched_skill_sets, fuzzy_matches):
+            matched |= fuzzy
+    return matched_skill_sets
 
-    # Overall average score of skill and experience match
-    overall_score = round((skill_match_score + experience_match_score) / 2, 2)
 
-    result = {
-        "matched_skills": list(matched_skills),
-        "missing_skills": missing_skills,
-        "skill_match_score": skill_match_score,
-        "experience_match_score": experience_match_score,
-        "overall_score": overall_score,
-    }
+def match_resume_to_job(resume: dict, job: dict = None, artifacts: JobArtifacts = None) -> dict:
+    return match_resumes_to_job([resume], job, artifacts)[0]
+
+
+def match_resumes_to_job(resumes: list, job: dict = None, artifacts: JobArtifacts = None) -> list:
+    """
+    Score many resumes against one job; job-side work is done once.
+    Pass precomputed `artifacts` (see job_artifacts.py) to skip deriving
+    them from the raw `job` dict.
+    """
+    if artifacts is None:
+        artifacts = build_job_artifacts(job or {})
+
+    # Lowercased job skills and the precomputed description vector
+    job_skills = set(artifacts.skills)
+    backend = get_similarity_backend(artifacts.similarity_backend)
+    job_vector = artifacts.description_vector
+
+    matched_skill_sets = match_skill_sets(resumes, artifacts)
+
+    results = []
+    for resume, matched_skills in zip(resumes, matched_skill_sets):
+        # Extract all bullets from experience entries
+        experience_entries = resume.get("experience", [])
+        all_bullets = []
+        for entry in experience_entries:
+            bullets = entry.get("bullets", [])
+            all_bullets.extend(bullets)
+
+        # Join all bullets to a single string
+        resume_experience_text = " ".join(all_bullets).lower()
+
+        skill_match_score = (
+            round(len(matched_skills) / len(job_skills), 2) if job_skills else 0.0
+        )
+
+        # Calculate missing skills
+        missing_skills = list(job_skills - matched_skills)
+
+        # Experience similarity against the precomputed job vector
+        if resume_experience_text.strip() and job_vector is not None:
+            experience_match_score = round(
+                backend.score(backend.vectorize(resume_experience_text), job_vector), 2
+            )
+        else:
+            experience_match_score = 0.0
+
+        # Overall average score of skill and experience match
+        overall_score = round((skill_match_score + experience_match_score) / 2, 2)
+
+        results.append(
+            {
+                "matched_skills": list(matched_skills),
+                "missing_skills": missing_skills,
+                "skill_match_score": skill_match_score,
+                "experience_match_score": experience_match_score,
+                "overall_score": overall_score,
+            }
+        )
 
-    return result
+    return results
@@ -0,0 +1,208 @@
+import logging
+import os
+import re
+
+from app.services.first_names import FIRST_NAMES
+from app.services.metrics import registry
+from app.services.nlp import NLP_BATCH_SIZE, NLP_N_PROCESS, get_ner_pipeline
+from app.services.sections import SECTION_HEADER_PATTERN
+
+logger = logging.getLogger(__name__)
+
+# "ner": always run NER (the default, and the original behaviour); "auto":
+# header heuristics, running NER only when they are not confident (opt in, per
+# deployment or per upload with ?name_extractor=); "heuristic": never load spaCy
+NAME_EXTRACTOR = os.getenv("NAME_EXTRACTOR", "ner")
+NAME_MIN_CONFIDENCE = float(os.getenv("NAME_MIN_CONFIDENCE", "0.6"))
+NAME_EXTRACTOR_MODES = ("auto", "heuristic", "ner")
+
+NO_NAME = "No name found in the text."
+HEADER_LINES = 5
+
+# Separators between a name and whatever shares its line (title, location, contact)
+_SEGMENT_SPLIT = re.compile(r"\s*(?:[|•·,\t]|\s[-–—]\s|\s{3,})\s*")
+_LABEL_PREFIX = re.compile(r"^(?:full\s+)?name\s*[:\-]\s*", re.I)
+_HONORIFIC = re.compile(r"^(?:dr|mr|mrs|ms|miss|prof)\.?\s+", re.I)
+_NAME_PART_SPLIT = re.compile(r"['’-]")
+_SURNAME_PREFIX = re.compile(r"^(?:Mc|Mac|Fitz)(?=[A-Z])")
+_CONTACT_HINTS = ("@", "http", "www.", "+", "/")
+# Lowercase words allowed inside a name ("Ludwig van Beethoven")
+_PARTICLES = {"van", "von", "de", "der", "den", "da", "di", "del", "della", "la", "le", "du", "bin", "binti",
+              "al", "el", "ibn", "dos", "das", "ten", "ter"}
+# Words that mark a header line as something other than a name
+_NOT_NAME_WORDS = {
+    "resume", "curriculum", "vitae", "cv", "engineer", "developer", "manager", "analyst", "scientist",
+    "designer", "intern", "consultant", "architect", "specialist", "senior", "junior", "lead", "software",
+    "data", "university", "college", "institute", "school", "street", "road", "avenue", "summary", "profile",
+    "objective", "contact", "page", "personal", "details", "information",
+}
+
+NAME_EXTRACTIONS = registry.counter(
+    "name_extractions_total",
+    "Resume name extractions by the path that produced the answer (heuristic fast path or NER).",
+    ("method",),
+)
+
+_ner_missing_logged = False
+
+
+def _is_name_token(token: str) -> bool:
+    # "Doe", "DOE", "J.", "O'Neil", "Müller-Schmidt", "McDonald"
+    parts = _NAME_PART_SPLIT.split(token[:-1] if token.endswith(".") else token)
+    for part in parts:
+        if not part.isalpha() or not part[0].isupper():
+            return False
+        if not (_SURNAME_PREFIX.sub("", part)[1:].islower() or part.isupper()):
+            return False
+    return True
+
+
+def _candidate(line: str, position: int):
+    """(name, confidence) if this header line plausibly holds a name, else None."""
+    line = _LABEL_PREFIX.sub("", line.strip(" \t\f"))
+    if not line or SECTION_HEADER_PATTERN.match(line):
+        return None
+    segments = _SEGMENT_SPLIT.split(line)
+    segment = _HONORIFIC.sub("", segments[0])
+    if any(hint in segment for hint in _CONTACT_HINTS) or any(c.isdigit() for c in segment):
+        return None
+    tokens = segment.split()
+    if not 2 <= len(tokens) <= 4:
+        return None
+    lowered = [token.lower().strip(".") for token in tokens]
+    if any(word in _NOT_NAME_WORDS for word in lowered):
+        return None
+    for i, token in enumerate(tokens):
+        inner_particle = 0 < i < len(tokens) - 1 and token in _PARTICLES
+        if not inner_particle and not _is_name_token(token):
+            return None
+
+    confidence = 0.35 + max(0.0, 0.25 - 0.1 * position)
+    if lowered[0] in FIRST_NAMES:
+        confidence += 0.35
+    elif any(word in FIRST_NAMES for word in lowered[1:]):
+        # Family name first
+        confidence += 0.15
+    if len(segments) == 1:
+        confidence += 0.05
+    return segment, min(confidence, 1.0)
+
+
+def heuristic_name(text: str):
+    """
+    Best (name, confidence) among the first HEADER_LINES non-empty lines, or
+    (None, 0.0). A line scores as a name when it is 2-4 capitalized words with
+    no digits, contact details or title words; being near the top and starting
+    with a known first name (FIRST_NAMES) raise the confidence.
+    """
+    best = (None, 0.0)
+    position = 0
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        candidate = _candidate(line, position)
+        if candidate and candidate[1] > best[1]:
+            best = candidate
+        position += 1
+        if position >= HEADER_LINES:
+            break
+    return best
+
+
+def _header(text: str) -> str:
+    return "\n".join(text.splitlines()[:HEADER_LINES])
+
+
+def _person(doc):
+    for ent in doc.ents:
+        if ent.label_ == "PERSON":
+            for part in ent.text.split("\n"):
+                if "+" not in part and not any(char.isdigit() for char in part):
+                    return part.strip()
+    return None
+
+
+def ner_name(text: str):
+    """First PERSON entity in the first HEADER_LINES lines, via the spaCy NER pipeline."""
+    return _person(get_ner_pipeline()(_header(text)))
+
+
+def ner_names(texts: list, batch_size: int = None, n_process: int = None) -> list:
+    """ner_name for many texts, streamed through nlp.pipe."""
+    docs = get_ner_pipeline().pipe(
+        (_header(text) for text in texts),
+        batch_size=batch_size or NLP_BATCH_SIZE,
+        n_process=n_process or NLP_N_PROCESS,
+    )
+    return [_person(doc) for doc in docs]
+
+
+def _check_mode(mode: str) -> str:
+    mode = mode or NAME_EXTRACTOR
+    if mode not in NAME_EXTRACTOR_MODES:
+        raise ValueError(f"Unknown name extractor {mode!r}; expected one of {', '.join(NAME_EXTRACTOR_MODES)}")
+    return mode
+
+
+def _ner_unavailable(error: OSError):
+    global _ner_missing_logged
+    # Model not installed: the heuristic guess is better than failing the upload
+    if not _ner_missing_logged:
+        logger.warning("spaCy NER model unavailable; using heuristic names only", extra={"error": str(error)})
+        _ner_missing_logged = True
+
+
+def resolve_name(text: str, mode: str = None) -> tuple:
+    """(name, method) where method is "heuristic" or "ner", the path that produced the answer."""
+    mode = _check_mode(mode)
+    if mode == "ner":
+        return ner_name(text) or NO_NAME, "ner"
+
+    name, confidence = heuristic_name(text)
+    if mode == "heuristic" or confidence >= NAME_MIN_CONFIDENCE:
+        return name or NO_NAME, "heuristic"
+    try:
+        return ner_name(text) or name or NO_NAME, "ner"
+    except OSError as e:
+        _ner_unavailable(e)
+        return name or NO_NAME, "heuristic"
+
+
+def resolve_names(texts: list, mode: str = None, batch_size: int = None, n_process: int = None) -> list:
+    """
+    resolve_name for many texts, with identical results. Only the texts the
+    heuristic is unsure of reach NER, and those go through nlp.pipe as one batch.
+    """
+    mode = _check_mode(mode)
+    if mode == "ner":
+        return [(name or NO_NAME, "ner") for name in ner_names(texts, batch_size, n_process)]
+
+    guesses = [heuristic_name(text) for text in texts]
+    results = [(name or NO_NAME, "heuristic") for name, _ in guesses]
+    if mode == "heuristic":
+        return results
+    unsure = [i for i, (_, confidence) in enumerate(guesses) if confidence < NAME_MIN_CONFIDENCE]
+    if not unsure:
+        return results
+    try:
+        found = ner_names([texts[i] for i in unsure], batch_size, n_process)
+    except OSError as e:
+        _ner_unavailable(e)
+        return results
+    for i, name in zip(unsure, found):
+        results[i] = (name or guesses[i][0] or NO_NAME, "ner")
+    return results
+
+
+def extract_name(text: str, mode: str = None) -> str:
+    name, method = resolve_name(text, mode)
+    NAME_EXTRACTIONS.inc(method=method)
+    return name
+
+
+def extract_names(texts: list, mode: str = None, batch_size: int = None, n_process: int = None) -> list:
+    names = []
+    for name, method in resolve_names(texts, mode, batch_size, n_process):
+        NAME_EXTRACTIONS.inc(method=method)
+        names.append(name)
+    return names
@@ -1,8 +1,49 @@
+import os
+import threading
+
 import spacy
 
+SPACY_MODEL = os.getenv("SPACY_MODEL", "en_core_web_sm")
+# nlp.pipe() settings for multi-document work (bulk re-analysis). n_process > 1
+# forks workers that each load the model, so it only pays off for large batches.
+NLP_BATCH_SIZE = int(os.getenv("NLP_BATCH_SIZE", "64"))
+NLP_N_PROCESS = int(os.getenv("NLP_N_PROCESS", "1"))
+
+# Components of the model none of our callers use. Excluding them at load time
+# means their weights are never read from disk nor kept in memory.
+UNUSED_COMPONENTS = ["tagger", "parser", "attribute_ruler", "lemmatizer", "senter"]
+
+_lock = threading.Lock()
+_pipelines = {}
+
+
+def _load_ner_pipeline():
+    nlp = spacy.load(SPACY_MODEL, exclude=UNUSED_COMPONENTS)
+    # The shared tok2vec only feeds the tagger/parser in the small English
+    # models; drop it unless NER actually listens to it.
+    if "tok2vec" in nlp.pipe_names:
+        listeners = getattr(nlp.get_pipe("tok2vec"), "listening_components", [])
+        if "ner" not in listeners:
+            nlp.remove_pipe("tok2vec")
+    return nlp
+
+
+_loaders = {
+    "ner": _load_ner_pipeline,
+}
+
 
-def get_nlp():
-    return spacy.load("en_core_web_sm")
+def _get_pipeline(name):
+    nlp = _pipelines.get(name)
+    if nlp is None:
+        with _lock:
+            nlp = _pipelines.get(name)
+            if nlp is None:
+                nlp = _loaders[name]()
+                _pipelines[name] = nlp
+    return nlp
 
 
-nlp = get_nlp()
+def get_ner_pipeline():
+    """Model pipeline with only the components needed for named entities."""
+    return _get_pipeline("ner")
@@ -0,0 +1,123 @@
+import hashlib
+import os
+from collections import OrderedDict
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.db import Resume
+
+RESUME_CACHE_SIZE = int(os.getenv("RESUME_CACHE_SIZE", "512"))
+# Hashes per IN (...) query when looking up a whole batch
+LOOKUP_CHUNK_SIZE = 1000
+
+
+def hash_content(data: bytes) -> str:
+    """SHA-256 hex digest of the uploaded file bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class ResumeCache:
+    """
+    Two-tier cache of upload results keyed by content hash.
+    Tier one is this in-process LRU; tier two is the indexed
+    `Resume.content_hash` column, consulted through `lookup`.
+    """
+
+    def __init__(self, max_size=512):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, content_hash: str):
+        entry = self._entries.get(content_hash)
+        if entry is not None:
+            self._entries.move_to_end(content_hash)
+        return entry
+
+    def put(self, content_hash: str, entry: dict):
+        if self.max_size <= 0:
+            return
+        self._entries[content_hash] = entry
+        self._entries.move_to_end(content_hash)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def lookup(self, db: AsyncSession, content_hash: str):
+        entry = self.get(content_hash)
+        if entry is not None:
+            self.memory_hits += 1
+            return entry
+
+        result = await db.execute(
+            select(Resume)
+            .where(Resume.content_hash == content_hash)
+            .order_by(Resume.id)
+            .limit(1)
+        )
+        resume = result.scalar_one_or_none()
+        if resume is None:
+            self.misses += 1
+            return None
+
+        self.db_hits += 1
+        entry = self._entry_from_row(resume)
+        self.put(content_hash, entry)
+        return entry
+
+    async def lookup_many(self, db: AsyncSession, content_hashes) -> dict:
+        """Batch `lookup`: one indexed query for everything not in memory."""
+        found = {}
+        missing = []
+        for content_hash in set(content_hashes):
+            entry = self.get(content_hash)
+            if entry is not None:
+                self.memory_hits += 1
+                found[content_hash] = entry
+            else:
+                missing.append(content_hash)
+
+        for start in range(0, len(missing), LOOKUP_CHUNK_SIZE):
+            chunk = missing[start:start + LOOKUP_CHUNK_SIZE]
+            result = await db.execute(
+                select(Resume).where(Resume.content_hash.in_(chunk)).order_by(Resume.id)
+            )
+            for resume in result.scalars():
+                if resume.content_hash in found:
+                    continue
+                self.db_hits += 1
+                entry = self._entry_from_row(resume)
+                self.put(resume.content_hash, entry)
+                found[resume.content_hash] = entry
+
+        self.misses += len(missing) - sum(1 for h in missing if h in found)
+        return found
+
+    @staticmethod
+    def _entry_from_row(resume: Resume) -> dict:
+        return {
+            "id": resume.id,
+            "filename": resume.filename,
+            "file_url": resume.file_url,
+            "analysis": resume.parsed_data or {},
+        }
+
+    def stats(self) -> dict:
+        lookups = self.memory_hits + self.db_hits + self.misses
+        hits = self.memory_hits + self.db_hits
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+resume_cache = ResumeCache(max_size=RESUME_CACHE_SIZE)
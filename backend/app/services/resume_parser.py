@@ -1,13 +1,140 @@
-from pdfminer.high_level import extract_text
+from pdfminer.converter import TextConverter
+from pdfminer.layout import LAParams
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
 from fastapi import UploadFile
+import io
+import os
 import re
-from app.services.nlp import nlp
+from app.services.metrics import stage_timer, timed
+from app.services.name_extractor import extract_name, extract_names
+from app.services.sections import find_headers, normalize_dashes, split_sections
+from app.services.skill_extractor import extract_skill_ids, skill_names
+from app.services.skill_taxonomy import get_taxonomy
+
+# Resumes carry their useful content in the first few pages; anything past
+# these limits is not worth the CPU and memory of parsing.
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "10"))
+PDF_MAX_BYTES = int(os.getenv("PDF_MAX_BYTES", str(10 * 1024 * 1024)))
+# Stop reading pages once every section the parser needs has been seen in full
+PDF_EARLY_STOP = os.getenv("PDF_EARLY_STOP", "true").lower() == "true"
+
+EMAIL_PATTERN = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+PHONE_PATTERN = re.compile(r"(\+?\d{1,3}[\s\-]?\(?\d{2,4}\)?[\s\-]?\d{3,5}[\s\-]?\d{3,5})")
+
+# Sub-headings that show up inside a skills section but are not skills
+SKILL_HEADINGS = {
+    "languages",
+    "programming languages",
+    "framework & libraries",
+    "databases",
+    "others",
+    "personal skills",
+    "tools",
+    "skills",
+    "technologies",
+    "frameworks",
+    "soft skills",
+    "technical skills",
+}
+SKILL_DELIMITER_PATTERN = re.compile(r"\s*\|\s*|\s{2,}|,\s*")
+
+DATE_RANGE_PATTERN = re.compile(
+    r"\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\s*-\s*(?:Present|\w+\s+\d{4})",
+    re.I,
+)
+# Finds a date range anywhere in the string (for splitting location+dates)
+TRAILING_DATE_RANGE_PATTERN = re.compile(
+    r"(.*?)(\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\s*-\s*(?:Present|\w+\s+\d{4}).*)",
+    re.I,
+)
+
+DEGREE_KEYWORDS = [
+    "bachelor",
+    "master",
+    "ph.d",
+    "msc",
+    "bsc",
+    "bs",
+    "ms",
+    "m.sc",
+    "b.sc",
+    "doctor",
+    "mba",
+    "m.tech",
+    "b.tech",
+]
+DEGREE_DATE_PATTERN = re.compile(
+    r"(expected\s*\d{4}|(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s*\d{4}(-\s*(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s*\d{4})?)",
+    re.I,
+)
+EXPECTED_YEAR_PATTERN = re.compile(r"expected\s*(\d{4})")
+MONTH_YEAR_PATTERN = re.compile(r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s*\d{4}", re.I)
 
 
 def extract_text_from_pdf(file: UploadFile) -> str:
     # Extract text from a pdf.
-    text = extract_text(file.file)
+    text = extract_text_from_stream(file.file)
     # Do NOT close the file here; let the caller close it
+    return _clean_pdf_text(text)
+
+
+@timed("pdfminer")
+def extract_text_from_bytes(data: bytes) -> str:
+    # Same as extract_text_from_pdf, but takes raw bytes so it can be
+    # shipped to a worker process (UploadFile is not picklable).
+    text = extract_text_from_stream(io.BytesIO(data))
+    return _clean_pdf_text(text)
+
+
+def iter_pdf_pages(fp, max_pages: int = 0):
+    """
+    Lazily yield the text of each page, producing the same text as
+    pdfminer.high_level.extract_text would for those pages.
+    """
+    rsrcmgr = PDFResourceManager(caching=True)
+    output = io.StringIO()
+    device = TextConverter(rsrcmgr, output, codec="utf-8", laparams=LAParams())
+    try:
+        interpreter = PDFPageInterpreter(rsrcmgr, device)
+        for page in PDFPage.get_pages(fp, maxpages=max_pages, caching=True):
+            interpreter.process_page(page)
+            page_text = output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+            yield page_text
+    finally:
+        device.close()
+
+
+def required_sections_complete(text: str) -> bool:
+    """
+    True once the skills and experience sections have both started and another
+    section header follows the later of them, i.e. nothing the extractors
+    read can still be on a later page.
+    """
+    headers = find_headers(text)
+    skills_at = next((pos for pos, _, name in headers if name == "skills"), None)
+    experience_at = next((pos for pos, _, name in headers if name == "experience"), None)
+    if skills_at is None or experience_at is None:
+        return False
+    last_required = max(skills_at, experience_at)
+    return any(pos > last_required for pos, _, _ in headers)
+
+
+def extract_text_from_stream(fp, max_pages: int = None, early_stop: bool = None) -> str:
+    max_pages = PDF_MAX_PAGES if max_pages is None else max_pages
+    early_stop = PDF_EARLY_STOP if early_stop is None else early_stop
+
+    pages = []
+    for page_text in iter_pdf_pages(fp, max_pages=max_pages):
+        pages.append(page_text)
+        if early_stop and required_sections_complete("".join(pages)):
+            break
+    return "".join(pages)
+
+
+def _clean_pdf_text(text: str) -> str:
     if not text:
         return "No text found in the PDF file."
     text = text.strip()
@@ -16,99 +143,85 @@ def extract_text_from_pdf(file: UploadFile) -> str:
     return text
 
 
-def analyze_resume_text(text: str) -> dict:
-    name = extract_name(text)
-    email = extract_email(text)
-    phone = extract_phone(text)
-    skills = extract_skills(text)
-    experience = extract_experience(text)
-
+def analyze_resume_text(text: str, name_extractor: str = None) -> dict:
+    # Recorded where the work runs; with WORKER_POOL_KIND=process these land
+    # in the worker's registry, and only the pool-side "analyze" is scraped
+    with stage_timer("extract_name"):
+        name = extract_name(text, name_extractor)
+    with stage_timer("extract_fields"):
+        fields = extract_resume_fields(text)
+    return {"name": name, **fields}
+
+
+def analyze_resumes(texts: list, name_extractor: str = None, batch_size: int = None, n_process: int = None) -> list:
+    """
+    analyze_resume_text for many texts, with identical results; the NER part
+    of name extraction runs once over the whole batch through nlp.pipe.
+    """
+    texts = list(texts)
+    with stage_timer("extract_name"):
+        names = extract_names(texts, name_extractor, batch_size, n_process)
+    with stage_timer("extract_fields"):
+        return [{"name": name, **extract_resume_fields(text)} for name, text in zip(names, texts)]
+
+
+def extract_resume_fields(text: str) -> dict:
+    # Everything but the name: normalize once, segment once, and give each
+    # extractor only its own section.
+    sections = split_sections(normalize_dashes(text))
+    skills = parse_skills_section(sections.get("skills"))
+    if skills:
+        skill_ids, _ = get_taxonomy().resolve(skills)
+        skill_ids.update(extract_skill_ids(sections["skills"]))
+    else:
+        # No usable skills section: fall back to known skills named anywhere
+        skill_ids = extract_skill_ids(text)
+        skills = skill_names(skill_ids)
     return {
-        "name": name,
-        "email": email,
-        "phone": phone,
+        "email": extract_email(text),
+        "phone": extract_phone(text),
         "skills": skills,
-        "experience": experience,
+        "skill_ids": sorted(skill_ids),
+        "experience": parse_experience_section(sections.get("experience")),
     }
 
 
-def extract_name(text: str) -> str:
-
-    lines = text.splitlines()
-    header = "\n".join(lines[:5])
-    doc = nlp(header)
-
-    # Extract named entities
-    for ent in doc.ents:
-        if ent.label_ == "PERSON":
-            parts = ent.text.split("\n")
-            for part in parts:
-                if "+" not in part and not any(char.isdigit() for char in part):
-                    return part.strip()
-
-    return "No name found in the text."
-
-
 def extract_email(text: str) -> str:
-    # Regular expression for matching email addresses
-    email_pattern = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
-    emails = re.findall(email_pattern, text)
+    emails = EMAIL_PATTERN.findall(text)
     if emails:
         return emails[0]  # Return the first email found
     return "No email found in the text."
 
 
 def extract_phone(text: str) -> str:
-    # Regular expression for matching phone numbers
-    phone_pattern = r"(\+?\d{1,3}[\s\-]?\(?\d{2,4}\)?[\s\-]?\d{3,5}[\s\-]?\d{3,5})"
-    phones = re.findall(phone_pattern, text)
+    phones = PHONE_PATTERN.findall(text)
     if phones:
         return phones[0]  # Return the first phone number found
     return "No phone number found in the text."
 
 
+def _section(text: str, name: str):
+    return split_sections(normalize_dashes(text)).get(name)
+
+
 def extract_skills(text: str) -> list:
-    # Normalize special dashes
-    text = re.sub(r"[–—−‐]", "-", text)
-    # Match SKILLS section to next known section or end of file
-    match = re.search(
-        r"(?is)^skills\s*\n(.*?)(?=\n(?:certifications|education|experience|projects|summary|contact|languages|profile|additional information|additional)\b|\Z)",
-        text,
-        re.M,
-    )
-    if not match:
+    return parse_skills_section(_section(text, "skills"))
+
+
+def parse_skills_section(skills_section: str) -> list:
+    if not skills_section:
         return []
 
-    # Join broken lines in the skills section
-    skills_section = match.group(1)
-    skills_section = re.sub(r"\n+", " ", skills_section)  # all newlines become spaces
-
-    # Now split cleanly by known delimiters
-    raw_skills = re.split(r"\s*\|\s*|\s{2,}|,\s*", skills_section)
-
-    # Strip whitespace, remove empties
-    skills = [s.strip() for s in raw_skills if s.strip()]
-
-    ignoringWordsList = {
-        "languages",
-        "programming languages",
-        "framework & libraries",
-        "databases",
-        "others",
-        "personal skills",
-        "tools",
-        "skills",
-        "technologies",
-        "frameworks",
-        "soft skills",
-        "technical skills",
-    }
+    # Join broken lines, then split cleanly by known delimiters
+    skills_section = skills_section.replace("\n", " ")
+    raw_skills = SKILL_DELIMITER_PATTERN.split(skills_section)
 
     filtered_skills = []
-    for skill in skills:
-        skill_clean = skill.lower().strip()
+    for skill in raw_skills:
+        skill = skill.strip()
+        skill_clean = skill.lower()
 
-        if skill_clean in ignoringWordsList:
+        if not skill_clean or skill_clean in SKILL_HEADINGS:
             continue
 
         if len(skill_clean) <= 2:
@@ -123,31 +236,14 @@ def extract_skills(text: str) -> list:
 
 
 def extract_experience(text: str) -> list:
-    # Normalize special dashes
-    text = re.sub(r"[–—−‐]", "-", text)
-
-    # Find the experience section
-    match = re.search(
-        r"(?is)(?:^|\n)(work experience|experience|professional experience)\s*\n(.*?)(?=\n(?:certifications|education|skills|projects|summary|contact|languages|profile|additional information|additional)\b|\Z)",
-        text,
-        re.M,
-    )
-    if not match:
-        return []
+    return parse_experience_section(_section(text, "experience"))
 
-    experience_section = match.group(2)
-    lines = [line.strip() for line in experience_section.split("\n") if line.strip()]
 
-    date_pattern = re.compile(
-        r"\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\s*-\s*(?:Present|\w+\s+\d{4})",
-        re.I,
-    )
+def parse_experience_section(experience_section: str) -> list:
+    if not experience_section:
+        return []
 
-    # Pattern to find a date range anywhere in the string (for splitting location+dates)
-    split_date_pattern = re.compile(
-        r"(.*?)(\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\s*-\s*(?:Present|\w+\s+\d{4}).*)",
-        re.I,
-    )
+    lines = [line.strip() for line in experience_section.split("\n") if line.strip()]
 
     experiences = []
     i = 0
@@ -165,13 +261,13 @@ def extract_experience(text: str) -> list:
             i += 3
 
         # Check if location contains dates and split
-        m = split_date_pattern.match(location)
+        m = TRAILING_DATE_RANGE_PATTERN.match(location)
         if m:
             location = m.group(1).strip()
             dates = m.group(2).strip()
         else:
             # Check if next line is dates
-            if i < len(lines) and date_pattern.match(lines[i]):
+            if i < len(lines) and DATE_RANGE_PATTERN.match(lines[i]):
                 dates = lines[i]
                 i += 1
             else:
@@ -179,7 +275,7 @@ def extract_experience(text: str) -> list:
 
         # Collect bullets
         bullets = []
-        while i < len(lines) and re.match(r"^[-•]", lines[i]):
+        while i < len(lines) and lines[i].startswith(("-", "•")):
             bullets.append(lines[i].lstrip("-• ").strip())
             i += 1
 
@@ -197,38 +293,15 @@ def extract_experience(text: str) -> list:
 
 
 def extract_education(text: str) -> list:
-    import re
+    return parse_education_section(_section(text, "education"))
 
-    # Normalize dashes
-    text = re.sub(r"[–—−‐]", "-", text)
 
-    # Extract education block (case-insensitive)
-    match = re.search(
-        r"(?is)^education\s*\n(.*?)(?=\n[A-Z][A-Z\s]+\n|certifications|skills|experience|projects|\Z)",
-        text,
-        re.M,
-    )
-    education_section = match.group(1).strip() if match else ""
+def parse_education_section(education_section: str) -> list:
+    education_section = (education_section or "").strip()
 
     # Split by blank lines (one or more)
     blocks = re.split(r"\n\s*\n", education_section)
 
-    degree_keywords = [
-        "bachelor",
-        "master",
-        "ph.d",
-        "msc",
-        "bsc",
-        "bs",
-        "ms",
-        "m.sc",
-        "b.sc",
-        "doctor",
-        "mba",
-        "m.tech",
-        "b.tech",
-    ]
-
     educations = []
 
     for block in blocks:
@@ -251,16 +324,10 @@ def extract_education(text: str) -> list:
             line_lower = line.lower()
 
             if not current_education["degree"] and any(
-                k in line_lower for k in degree_keywords
+                k in line_lower for k in DEGREE_KEYWORDS
             ):
                 # Clean degree line by removing trailing date info
-                degree_line = line.strip()
-                degree_line_clean = re.sub(
-                    r"(expected\s*\d{4}|(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s*\d{4}(-\s*(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)\s*\d{4})?)",
-                    "",
-                    degree_line,
-                    flags=re.IGNORECASE,
-                ).strip()
+                degree_line_clean = DEGREE_DATE_PATTERN.sub("", line.strip()).strip()
                 current_education["degree"] = degree_line_clean
                 continue
 
@@ -278,16 +345,12 @@ def extract_education(text: str) -> list:
             line_lower = line.lower()
 
             # Expected year (priority for end_date)
-            expected_match = re.search(r"expected\s*(\d{4})", line_lower)
+            expected_match = EXPECTED_YEAR_PATTERN.search(line_lower)
             if expected_match and not current_education["end_date"]:
                 current_education["end_date"] = expected_match.group(1)
 
             # Date range like "Jan 2019 - Jan 2023"
-            date_matches = re.findall(
-                r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s*\d{4}",
-                line,
-                re.IGNORECASE,
-            )
+            date_matches = MONTH_YEAR_PATTERN.findall(line)
             if len(date_matches) == 2:
                 current_education["start_date"] = date_matches[0]
                 current_education["end_date"] = date_matches[1]
@@ -0,0 +1,359 @@
+import asyncio
+import logging
+import os
+from typing import NamedTuple
+
+from pdfminer.pdfparser import PDFSyntaxError
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.db import Resume
+from app.services.metrics import stage_timer
+from app.services.resume_cache import resume_cache, hash_content
+from app.services.resume_parser import extract_text_from_bytes, analyze_resume_text
+from app.services.skill_index import skill_index
+from app.services.skill_taxonomy import get_taxonomy
+from app.services.supabase_client import (
+    delete_resume_from_supabase,
+    resume_object_path,
+    upload_resume_to_supabase,
+)
+from app.services.vector_index import resume_vector_index
+from app.services.worker_pool import worker_pool, WorkerPoolSaturated
+
+logger = logging.getLogger(__name__)
+
+# Concurrent storage uploads per bulk request
+BULK_UPLOAD_CONCURRENCY = int(os.getenv("BULK_UPLOAD_CONCURRENCY", "8"))
+# Start the storage upload alongside parsing instead of after it; the object
+# is deleted again if parsing fails.
+STORAGE_UPLOAD_EAGER = os.getenv("STORAGE_UPLOAD_EAGER", "true").lower() == "true"
+
+
+class ResumeProcessingError(Exception):
+    """A pipeline stage failed; carries the HTTP status the API should report."""
+
+    def __init__(self, status_code: int, detail: str, headers: dict = None):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+        self.headers = headers
+
+
+class UploadItem(NamedTuple):
+    filename: str
+    contents: bytes
+    content_type: str
+    # Per-request override of NAME_EXTRACTOR ("auto", "heuristic" or "ner")
+    name_extractor: str = None
+
+
+async def _run_on_pool(func, *args, wait=False):
+    try:
+        return await worker_pool.run(func, *args, wait=wait)
+    except WorkerPoolSaturated:
+        raise ResumeProcessingError(
+            503,
+            "Server is busy processing other documents. Please retry shortly.",
+            headers={"Retry-After": "1"},
+        )
+
+
+def _notify(on_stage, stage):
+    if on_stage is not None:
+        on_stage(stage)
+
+
+async def parse_resume(contents: bytes, wait: bool = False, on_stage=None, name_extractor: str = None):
+    """
+    Extract and analyze a PDF on the worker pool. Returns (text, analysis).
+    `on_stage`, if given, is called with "extracted" and "analyzed" as each
+    stage completes.
+    """
+    try:
+        # Pool-side stage timings include any wait for a free worker
+        with stage_timer("extract_text"):
+            text = await _run_on_pool(extract_text_from_bytes, contents, wait=wait)
+        logger.debug("Extracted text", extra={"text_length": len(text) if text else 0})
+    except ResumeProcessingError:
+        raise
+    except PDFSyntaxError:
+        raise ResumeProcessingError(400, "Invalid PDF file format.")
+    except Exception as e:
+        logger.exception("PDF extraction failed")
+        raise ResumeProcessingError(500, f"Failed to read PDF file: {str(e)}")
+
+    if not text or "No text found" in text:
+        raise ResumeProcessingError(422, "No text found in PDF.")
+
+    text = text.strip()
+    if not text:
+        raise ResumeProcessingError(422, "PDF contains no readable text.")
+    _notify(on_stage, "extracted")
+
+    with stage_timer("analyze"):
+        analysis = await _run_on_pool(analyze_resume_text, text, name_extractor, wait=wait)
+    if not analysis:
+        raise ResumeProcessingError(500, "Failed to analyze resume text.")
+    _notify(on_stage, "analyzed")
+    return text, analysis
+
+
+async def store_resume_file(item: UploadItem, object_path: str = None) -> str:
+    try:
+        with stage_timer("storage_upload"):
+            file_url = await upload_resume_to_supabase(
+                item.contents, item.filename, item.content_type, object_path=object_path
+            )
+        logger.debug("Stored resume file", extra={"file_url": file_url})
+        return file_url
+    except Exception as e:
+        logger.exception("Supabase upload failed")
+        raise ResumeProcessingError(500, f"Failed to upload to Supabase: {str(e)}")
+
+
+async def discard_resume_file(object_path: str):
+    # Best effort: an orphaned object is preferable to masking the real error
+    try:
+        with stage_timer("storage_delete"):
+            await delete_resume_from_supabase(object_path)
+    except Exception as e:
+        logger.warning("Supabase cleanup failed", extra={"object_path": object_path, "error": str(e)})
+
+
+async def _limited(slots, start):
+    # `start` makes the coroutine only once a slot is held, so a task cancelled
+    # before it gets one leaves no never-awaited coroutine behind
+    if slots is None:
+        return await start()
+    async with slots:
+        return await start()
+
+
+async def parse_and_store(
+    item: UploadItem, wait: bool = False, on_stage=None, parse_slots=None, upload_slots=None
+):
+    """
+    Parse the PDF and upload it to storage. Returns (text, analysis, file_url,
+    object_path). With STORAGE_UPLOAD_EAGER the upload runs concurrently with
+    parsing; if parsing fails the upload is cancelled or its object deleted.
+    The optional semaphores bound parsing and uploading independently.
+    """
+    object_path = resume_object_path(item.filename)
+
+    def parse():
+        return _limited(parse_slots, lambda: parse_resume(
+            item.contents, wait=wait, on_stage=on_stage, name_extractor=item.name_extractor
+        ))
+
+    def upload():
+        return _limited(upload_slots, lambda: store_resume_file(item, object_path))
+
+    if not STORAGE_UPLOAD_EAGER:
+        text, analysis = await parse()
+        file_url = await upload()
+        _notify(on_stage, "uploaded")
+        return text, analysis, file_url, object_path
+
+    upload_task = asyncio.create_task(upload())
+    try:
+        text, analysis = await parse()
+    except BaseException:
+        upload_task.cancel()
+        uploaded = await asyncio.gather(upload_task, return_exceptions=True)
+        if isinstance(uploaded[0], str):
+            await discard_resume_file(object_path)
+        raise
+    file_url = await upload_task
+    _notify(on_stage, "uploaded")
+    return text, analysis, file_url, object_path
+
+
+def _skill_keys(analysis: dict) -> list:
+    return get_taxonomy().skill_keys(analysis.get("skills", ()), analysis.get("skill_ids", ()))
+
+
+async def _index_vectors(items):
+    # The ANN index is derived data (and can be backfilled from the DB), so a
+    # failure here must not fail an upload that has already been stored
+    try:
+        with stage_timer("vector_index"):
+            await resume_vector_index.insert(items)
+    except Exception:
+        logger.exception("Vector index insert failed")
+
+
+def _cacheable(item: UploadItem) -> bool:
+    # The cache is keyed on the file bytes alone, so it only holds (and
+    # answers) parses made with the default name extractor; an explicit
+    # ?name_extractor= always gets a fresh parse
+    return item.name_extractor is None
+
+
+def _remember(resume_id, item, file_url, analysis, content_hash):
+    skill_index.add(resume_id, analysis)
+    entry = {
+        "id": resume_id,
+        "filename": item.filename,
+        "file_url": file_url,
+        "analysis": analysis,
+    }
+    if _cacheable(item):
+        resume_cache.put(content_hash, entry)
+    return entry
+
+
+async def process_resume(db: AsyncSession, item: UploadItem, wait: bool = False, on_stage=None) -> dict:
+    """
+    Full single-upload pipeline: cache lookup, parse, store file, insert row.
+    `on_stage` is called with "cached", or with "extracted", "analyzed",
+    "uploaded" and "stored" as the stages complete. Uploads with an explicit
+    name_extractor skip the cache.
+    """
+    # Identical bytes were already parsed and stored: skip the whole pipeline
+    content_hash = hash_content(item.contents)
+    cached = None
+    try:
+        if _cacheable(item):
+            with stage_timer("cache_lookup"):
+                cached = await resume_cache.lookup(db, content_hash)
+    except Exception as e:
+        # The cache is only an optimization; fall through to a full parse
+        logger.warning("Resume cache lookup failed", extra={"error": str(e)})
+        await db.rollback()
+    if cached:
+        logger.info("Resume cache hit", extra={"resume_id": cached["id"]})
+        _notify(on_stage, "cached")
+        return {**cached, "cached": True}
+
+    text, analysis, file_url, object_path = await parse_and_store(item, wait=wait, on_stage=on_stage)
+
+    try:
+        new_resume = Resume(
+            filename=item.filename,
+            content=text,
+            parsed_data=analysis,
+            skill_keys=_skill_keys(analysis),
+            file_url=file_url,
+            content_hash=content_hash,
+        )
+        db.add(new_resume)
+        with stage_timer("db_commit"):
+            await db.commit()
+        logger.info("Resume stored", extra={"resume_id": new_resume.id})
+    except Exception as e:
+        logger.exception("Resume insert failed")
+        await discard_resume_file(object_path)
+        raise ResumeProcessingError(500, f"Database error: {str(e)}")
+
+    entry = _remember(new_resume.id, item, file_url, analysis, content_hash)
+    await _index_vectors([(new_resume.id, text)])
+    _notify(on_stage, "stored")
+    return {**entry, "cached": False}
+
+
+async def process_resume_batch(db: AsyncSession, items: list) -> list:
+    """
+    Bulk pipeline. Files are parsed concurrently on the worker pool (queueing
+    for a slot rather than failing, and never taking more slots than there are
+    workers so interactive uploads keep headroom), uploaded alongside parsing
+    with bounded concurrency, and all new rows are inserted with one
+    INSERT ... RETURNING in a single transaction. Returns one status dict per item, in order.
+    """
+    results = [None] * len(items)
+    hashes = [hash_content(item.contents) for item in items]
+
+    cached = {}
+    try:
+        cacheable = [content_hash for item, content_hash in zip(items, hashes) if _cacheable(item)]
+        if cacheable:
+            with stage_timer("cache_lookup"):
+                cached = await resume_cache.lookup_many(db, cacheable)
+    except Exception as e:
+        logger.warning("Resume cache lookup failed", extra={"error": str(e)})
+        await db.rollback()
+
+    first_seen = {}
+    to_process = []
+    for i, (item, content_hash) in enumerate(zip(items, hashes)):
+        if _cacheable(item) and content_hash in cached:
+            entry = cached[content_hash]
+            results[i] = {
+                "filename": item.filename,
+                "status": "cached",
+                "id": entry["id"],
+                "file_url": entry["file_url"],
+            }
+        elif content_hash in first_seen:
+            results[i] = {"filename": item.filename, "status": "duplicate"}
+        else:
+            first_seen[content_hash] = i
+            to_process.append(i)
+
+    parse_slots = asyncio.Semaphore(worker_pool.max_workers)
+    upload_slots = asyncio.Semaphore(BULK_UPLOAD_CONCURRENCY)
+
+    async def prepare(i):
+        item = items[i]
+        try:
+            text, analysis, file_url, object_path = await parse_and_store(
+                item, wait=True, parse_slots=parse_slots, upload_slots=upload_slots
+            )
+        except ResumeProcessingError as e:
+            results[i] = {"filename": item.filename, "status": "failed", "error": e.detail}
+            return None
+        return i, text, analysis, file_url, object_path
+
+    prepared = [p for p in await asyncio.gather(*(prepare(i) for i in to_process)) if p]
+
+    if prepared:
+        rows = [
+            {
+                "filename": items[i].filename,
+                "content": text,
+                "parsed_data": analysis,
+                "skill_keys": _skill_keys(analysis),
+                "file_url": file_url,
+                "content_hash": hashes[i],
+            }
+            for i, text, analysis, file_url, _ in prepared
+        ]
+        try:
+            with stage_timer("db_bulk_insert"):
+                inserted = await db.execute(
+                    insert(Resume).returning(Resume.id, sort_by_parameter_order=True), rows
+                )
+                ids = inserted.scalars().all()
+                await db.commit()
+            logger.info("Bulk inserted resumes", extra={"count": len(ids)})
+        except Exception as e:
+            logger.exception("Bulk resume insert failed")
+            await db.rollback()
+            await asyncio.gather(*(discard_resume_file(p[-1]) for p in prepared))
+            for i, *_ in prepared:
+                results[i] = {
+                    "filename": items[i].filename,
+                    "status": "failed",
+                    "error": f"Database error: {str(e)}",
+                }
+        else:
+            for (i, _, analysis, file_url, _), resume_id in zip(prepared, ids):
+                _remember(resume_id, items[i], file_url, analysis, hashes[i])
+                results[i] = {
+                    "filename": items[i].filename,
+                    "status": "created",
+                    "id": resume_id,
+                    "file_url": file_url,
+                }
+            await _index_vectors((resume_id, text) for (_, text, *_), resume_id in zip(prepared, ids))
+
+    # Point in-batch duplicates at whatever happened to their first copy
+    for i, result in enumerate(results):
+        if result["status"] == "duplicate":
+            original = results[first_seen[hashes[i]]]
+            result["id"] = original.get("id")
+            result["file_url"] = original.get("file_url")
+            if original["status"] == "failed":
+                result.update(status="failed", error=original["error"])
+
+    return results
@@ -0,0 +1,62 @@
+import re
+
+# Header text as written on the resume -> canonical section name
+SECTION_ALIASES = {
+    "skills": "skills",
+    "work experience": "experience",
+    "professional experience": "experience",
+    "experience": "experience",
+    "education": "education",
+    "certifications": "certifications",
+    "projects": "projects",
+    "summary": "summary",
+    "contact": "contact",
+    "languages": "languages",
+    "profile": "profile",
+    "additional information": "additional",
+    "additional": "additional",
+}
+
+# A header is a line holding nothing but a section name and an optional colon.
+# \f is allowed in front because pdfminer starts every page with a form feed.
+_HEADER_NAMES = "|".join(re.escape(name) for name in sorted(SECTION_ALIASES, key=len, reverse=True))
+SECTION_HEADER_PATTERN = re.compile(rf"^[ \t\f]*({_HEADER_NAMES})[ \t]*:?[ \t]*$", re.I | re.M)
+
+DASH_PATTERN = re.compile(r"[–—−‐]")
+
+
+def normalize_dashes(text: str) -> str:
+    # One char for one char, so offsets into the text stay valid
+    return DASH_PATTERN.sub("-", text)
+
+
+def find_headers(text: str) -> list:
+    """(start, end, section) for every header line, in order of appearance."""
+    return [
+        (m.start(), m.end(), SECTION_ALIASES[m.group(1).lower()])
+        for m in SECTION_HEADER_PATTERN.finditer(text)
+    ]
+
+
+def segment_sections(text: str) -> dict:
+    """
+    Scan the text once and map each section to the (start, end) span of its
+    body, which runs from the line after its header up to the next header.
+    If a section appears twice, the first occurrence wins.
+    """
+    headers = find_headers(text)
+    spans = {}
+    for i, (_, body_start, section) in enumerate(headers):
+        if section in spans:
+            continue
+        body_end = headers[i + 1][0] if i + 1 < len(headers) else len(text)
+        spans[section] = (body_start, body_end)
+    return spans
+
+
+def split_sections(text: str) -> dict:
+    """Section name -> body text, as delimited by segment_sections."""
+    return {
+        section: text[start:end]
+        for section, (start, end) in segment_sections(text).items()
+    }
@@ -0,0 +1,118 @@
+import os
+import re
+import zlib
+from difflib import SequenceMatcher
+from typing import NamedTuple
+
+import numpy as np
+
+# "hashed_ngram" (default) or "sequence" (the original difflib ratio)
+SIMILARITY_BACKEND = os.getenv("SIMILARITY_BACKEND", "hashed_ngram")
+SIMILARITY_HASH_BITS = int(os.getenv("SIMILARITY_HASH_BITS", "20"))
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+class SparseVector(NamedTuple):
+    indices: np.ndarray  # sorted, unique bucket ids
+    values: np.ndarray  # L2-normalized weights
+
+
+class SequenceMatcherBackend:
+    """difflib ratio over the raw text. Worst-case quadratic in text length."""
+
+    name = "sequence"
+
+    def vectorize(self, text: str) -> str:
+        return (text or "").lower()
+
+    def score(self, resume_vector: str, job_vector: str) -> float:
+        if not resume_vector or not job_vector:
+            return 0.0
+        return SequenceMatcher(None, resume_vector, job_vector).ratio()
+
+    def serialize(self, vector: str):
+        return vector
+
+    def deserialize(self, data) -> str:
+        return data
+
+
+class HashedNgramBackend:
+    """
+    Cosine similarity of word uni/bi-gram vectors hashed into 2**bits buckets,
+    with sublinear (1 + log tf) weighting. Vectorizing is linear in the text
+    and scoring looks each resume bucket up in the sorted job vector, so the
+    cost of a match against a precomputed job vector depends only on the
+    resume length.
+    """
+
+    name = "hashed_ngram"
+
+    def __init__(self, bits=20, ngram_range=(1, 2)):
+        self.bits = bits
+        self.ngram_range = ngram_range
+        self._mask = (1 << bits) - 1
+
+    def _hashes(self, text: str):
+        tokens = _TOKEN_RE.findall((text or "").lower())
+        low, high = self.ngram_range
+        hashes = []
+        for n in range(low, high + 1):
+            for i in range(len(tokens) - n + 1):
+                gram = " ".join(tokens[i:i + n])
+                # crc32 rather than hash(): stable across processes and restarts
+                hashes.append(zlib.crc32(gram.encode("utf-8")) & self._mask)
+        return hashes
+
+    def vectorize(self, text: str) -> SparseVector:
+        hashes = self._hashes(text)
+        if not hashes:
+            return SparseVector(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64))
+        indices, counts = np.unique(np.asarray(hashes, dtype=np.int64), return_counts=True)
+        values = 1.0 + np.log(counts)
+        values /= np.linalg.norm(values)
+        return SparseVector(indices, values)
+
+    def score(self, resume_vector: SparseVector, job_vector: SparseVector) -> float:
+        if not len(resume_vector.indices) or not len(job_vector.indices):
+            return 0.0
+        positions = np.searchsorted(job_vector.indices, resume_vector.indices)
+        positions[positions == len(job_vector.indices)] = 0
+        hits = job_vector.indices[positions] == resume_vector.indices
+        dot = float(np.dot(resume_vector.values[hits], job_vector.values[positions[hits]]))
+        return min(1.0, max(0.0, dot))
+
+    def serialize(self, vector: SparseVector) -> dict:
+        return {
+            "bits": self.bits,
+            "indices": vector.indices.tolist(),
+            "values": vector.values.tolist(),
+        }
+
+    def deserialize(self, data: dict) -> SparseVector:
+        if data.get("bits") != self.bits:
+            raise ValueError("Vector was hashed with a different bucket count")
+        return SparseVector(
+            np.asarray(data["indices"], dtype=np.int64),
+            np.asarray(data["values"], dtype=np.float64),
+        )
+
+
+def _make_backend(name: str):
+    if name == SequenceMatcherBackend.name:
+        return SequenceMatcherBackend()
+    if name == HashedNgramBackend.name:
+        return HashedNgramBackend(bits=SIMILARITY_HASH_BITS)
+    raise ValueError(f"Unknown similarity backend: {name}")
+
+
+_backends = {}
+
+
+def get_similarity_backend(name: str = None):
+    name = name or SIMILARITY_BACKEND
+    backend = _backends.get(name)
+    if backend is None:
+        backend = _backends[name] = _make_backend(name)
+    return backend
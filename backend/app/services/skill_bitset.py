@@ -0,0 +1,56 @@
+import numpy as np
+
+from app.services.skill_taxonomy import get_taxonomy
+
+# Bit i of a skill vector is set when the document has taxonomy skill id i.
+# In memory a vector is a Python int (popcount is int.bit_count()); for
+# ranking, vectors are rows of uint64 words.
+
+_M1 = np.uint64(0x5555555555555555)
+_M2 = np.uint64(0x3333333333333333)
+_M4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+_H01 = np.uint64(0x0101010101010101)
+
+
+def skill_vector_words() -> int:
+    """uint64 words needed for one bit per taxonomy skill."""
+    return (len(get_taxonomy()) + 63) // 64
+
+
+def encode_skill_ids(skill_ids) -> int:
+    vector = 0
+    for skill_id in skill_ids:
+        vector |= 1 << skill_id
+    return vector
+
+
+def decode_skill_ids(vector: int) -> list:
+    skill_ids = []
+    while vector:
+        low = vector & -vector
+        skill_ids.append(low.bit_length() - 1)
+        vector ^= low
+    return skill_ids
+
+
+def skill_vector_to_words(vector: int, words: int = None) -> np.ndarray:
+    words = skill_vector_words() if words is None else words
+    return np.frombuffer(vector.to_bytes(words * 8, "little"), dtype="<u8").astype(np.uint64)
+
+
+def popcount64(x: np.ndarray) -> np.ndarray:
+    """Per-element popcount of a uint64 array (SWAR; NumPy < 2 has no bitwise_count)."""
+    x = x - ((x >> np.uint64(1)) & _M1)
+    x = (x & _M2) + ((x >> np.uint64(2)) & _M2)
+    x = (x + (x >> np.uint64(4))) & _M4
+    return (x * _H01) >> np.uint64(56)
+
+
+def overlap_counts(matrix: np.ndarray, job_words: np.ndarray) -> np.ndarray:
+    """popcount(row AND job) for every row of a (rows, words) uint64 matrix."""
+    columns = np.flatnonzero(job_words)
+    if len(columns) == 0 or len(matrix) == 0:
+        return np.zeros(len(matrix), dtype=np.int64)
+    # Only the words where the job has any bit can contribute
+    anded = matrix[:, columns] & job_words[columns]
+    return popcount64(anded).sum(axis=1, dtype=np.int64)
@@ -0,0 +1,93 @@
+from collections import deque
+from functools import lru_cache
+
+from app.services.skill_taxonomy import get_taxonomy, tokenize
+
+
+class SkillExtractor:
+    """
+    Aho-Corasick automaton over tokenized skill names. Text and patterns are
+    split into tokens the same way, so a match always starts and ends on a word
+    boundary ("java" never matches inside "javascript", nor "c" inside "c++"),
+    and one linear pass reports every occurrence of every pattern, overlapping
+    ones included ("apache spark" and "spark").
+    """
+
+    def __init__(self, patterns: dict):
+        # patterns: surface form -> value to report (a skill id, for the shared one)
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [()]
+        for surface, value in patterns.items():
+            tokens = tokenize(surface)
+            if tokens:
+                self._add(tokens, value)
+        self._build_failure_links()
+
+    def _add(self, tokens: list, value):
+        state = 0
+        for token in tokens:
+            nxt = self._goto[state].get(token)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+                self._goto[state][token] = nxt
+            state = nxt
+        if (len(tokens), value) not in self._out[state]:
+            self._out[state] += ((len(tokens), value),)
+
+    def _build_failure_links(self):
+        goto, fail, out = self._goto, self._fail, self._out
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and token not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(token, 0)
+                out[nxt] += out[fail[nxt]]
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+    def find(self, text: str) -> list:
+        """(start, end, value) for every match, as token offsets into tokenize(text)."""
+        goto, fail, out = self._goto, self._fail, self._out
+        matches = []
+        state = 0
+        for i, token in enumerate(tokenize(text)):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for length, value in out[state]:
+                matches.append((i + 1 - length, i + 1, value))
+        return matches
+
+    def extract(self, text: str) -> list:
+        """Distinct values found in the text, sorted."""
+        return sorted({value for _, _, value in self.find(text)})
+
+
+@lru_cache(maxsize=1)
+def get_skill_extractor() -> SkillExtractor:
+    # Every name and alias in the taxonomy, reporting canonical skill ids.
+    # Built once and shared by the resume parser and job analyzer.
+    return SkillExtractor(get_taxonomy().alias_to_id)
+
+
+def extract_skill_ids(text: str) -> list:
+    return get_skill_extractor().extract(text)
+
+
+def skill_names(skill_ids) -> list:
+    taxonomy = get_taxonomy()
+    return sorted(taxonomy.name(skill_id) for skill_id in skill_ids)
+
+
+def extract_known_skills(text: str) -> list:
+    """Canonical names of the taxonomy skills mentioned in the text, sorted."""
+    return skill_names(extract_skill_ids(text))
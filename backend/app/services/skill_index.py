@@ -0,0 +1,224 @@
+import asyncio
+import os
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.db import Resume
+from app.services.job_artifacts import JobArtifacts
+from app.services.matcher import match_resumes_to_job, resume_skill_profile
+from app.services.skill_bitset import (
+    decode_skill_ids,
+    encode_skill_ids,
+    overlap_counts,
+    skill_vector_to_words,
+    skill_vector_words,
+)
+from app.services.skill_taxonomy import get_taxonomy
+
+# Only the best `k * RANK_OVERSAMPLE` resumes by raw skill overlap are scored
+# with the full matcher; the rest cannot realistically make the top-k.
+RANK_OVERSAMPLE = int(os.getenv("RANK_OVERSAMPLE", "5"))
+# Candidates scored between two partial results of a streamed ranking
+RANK_STREAM_CHUNK = int(os.getenv("RANK_STREAM_CHUNK", "10"))
+INDEX_LOAD_BATCH_SIZE = int(os.getenv("INDEX_LOAD_BATCH_SIZE", "1000"))
+# Relative cost of scanning one uint64 word of the bitset matrix vs. one
+# posting-list entry; the cheaper of the two is used per query.
+BITSET_SCAN_COST = float(os.getenv("BITSET_SCAN_COST", "3"))
+
+
+def _rank_order(result: dict):
+    return -result["overall_score"], -result["skill_overlap"], result["resume_id"]
+
+
+def normalize_skill(skill: str) -> str:
+    return " ".join(skill.lower().split())
+
+
+def index_key(skill):
+    """Taxonomy id for known skills, else the normalized text."""
+    if isinstance(skill, int):
+        return skill
+    skill_id = get_taxonomy().lookup(skill)
+    return normalize_skill(skill) if skill_id is None else skill_id
+
+
+class SkillIndex:
+    """
+    In-memory skill index over resumes stored in dense rows.
+
+    Every row has a taxonomy skill bitset in a contiguous (rows, words)
+    uint64 matrix, and an inverted index maps each skill (taxonomy id, or
+    normalized text for skills outside the taxonomy) to its rows. The overlap
+    of every resume with a job is either one vectorized AND + popcount over
+    the matrix or an `np.bincount` over the job's posting lists, whichever
+    touches less memory: rare skills favour the postings, common ones the
+    matrix, whose cost does not depend on how popular a skill is.
+    """
+
+    def __init__(self):
+        self.loaded = False
+        self._lock = asyncio.Lock()
+        self._row_of = {}  # resume id -> row
+        self._ids = []  # row -> resume id
+        self._docs = []  # row -> parsed resume (None once superseded)
+        self._matrix = None  # row -> skill bitset as uint64 words (grown by doubling)
+        self._postings = {}  # skill -> list of rows
+        self._posting_arrays = {}  # skill -> cached np.ndarray of the list above
+        self._dead_rows = 0
+
+    def _set_vector(self, row: int, vector: int):
+        if self._matrix is None:
+            self._matrix = np.zeros((64, skill_vector_words()), dtype=np.uint64)
+        if row >= len(self._matrix):
+            grown = np.zeros((2 * len(self._matrix), self._matrix.shape[1]), dtype=np.uint64)
+            grown[: len(self._matrix)] = self._matrix
+            self._matrix = grown
+        self._matrix[row] = skill_vector_to_words(vector, self._matrix.shape[1])
+
+    def __len__(self):
+        return len(self._row_of)
+
+    def add(self, resume_id: int, parsed: dict):
+        old_row = self._row_of.get(resume_id)
+        if old_row is not None:
+            # Superseded rows stay in the posting lists (their bits are cleared)
+            # but are skipped at query time
+            self._docs[old_row] = None
+            self._set_vector(old_row, 0)
+            self._dead_rows += 1
+
+        # Resolved once here instead of on every rank
+        vector, unresolved = resume_skill_profile(parsed)
+        row = len(self._ids)
+        self._ids.append(resume_id)
+        self._docs.append(
+            {
+                "skills": parsed.get("skills", []),
+                "skill_vector": vector,
+                "unresolved_skills": unresolved,
+                "experience": parsed.get("experience", []),
+            }
+        )
+        self._row_of[resume_id] = row
+        self._set_vector(row, vector)
+
+        skills = {normalize_skill(s) for s in unresolved if s and s.strip()}
+        skills.update(decode_skill_ids(vector))
+        for skill in skills:
+            self._postings.setdefault(skill, []).append(row)
+            self._posting_arrays.pop(skill, None)
+
+    def _posting_array(self, skill):
+        array = self._posting_arrays.get(skill)
+        if array is None:
+            array = np.asarray(self._postings[skill], dtype=np.int64)
+            self._posting_arrays[skill] = array
+        return array
+
+    def candidates(self, job_skills, limit: int):
+        """
+        Best `limit` (resume id, overlap) pairs sharing at least one skill with
+        the job. `job_skills` may mix skill names and taxonomy ids.
+        """
+        skills = {index_key(s) for s in job_skills if isinstance(s, int) or (s and s.strip())}
+        skills = [s for s in skills if s in self._postings]
+        if not skills or limit <= 0:
+            return []
+
+        rows = len(self._ids)
+        skill_ids = [s for s in skills if isinstance(s, int)]
+        job_words = skill_vector_to_words(encode_skill_ids(skill_ids), self._matrix.shape[1])
+        posting_entries = sum(len(self._postings[s]) for s in skill_ids)
+        if posting_entries > BITSET_SCAN_COST * rows * np.count_nonzero(job_words):
+            counts = overlap_counts(self._matrix[:rows], job_words)
+            skills = [s for s in skills if not isinstance(s, int)]
+        else:
+            counts = np.zeros(rows, dtype=np.int64)
+        if skills:
+            counts += np.bincount(np.concatenate([self._posting_array(s) for s in skills]), minlength=rows)
+        hit_rows = np.flatnonzero(counts)
+        # Over-fetch by the number of superseded rows so they can be dropped below
+        wanted = min(len(hit_rows), limit + self._dead_rows)
+        if wanted < len(hit_rows):
+            top = np.argpartition(-counts[hit_rows], wanted - 1)[:wanted]
+            hit_rows = hit_rows[top]
+        hit_rows = hit_rows[np.lexsort((hit_rows, -counts[hit_rows]))]
+
+        result = []
+        for row in hit_rows:
+            if self._docs[row] is None:
+                continue
+            result.append((self._ids[row], int(counts[row])))
+            if len(result) == limit:
+                break
+        return result
+
+    def _rank_candidates(self, artifacts: JobArtifacts, k: int) -> list:
+        job_skills = [
+            skill if skill_id is None else skill_id
+            for skill, skill_id in zip(artifacts.skills, artifacts.skill_ids)
+        ]
+        candidates = self.candidates(job_skills, limit=k * max(1, RANK_OVERSAMPLE))
+        if len(candidates) < k:
+            # Too few resumes share a skill with the job (or none of its skills
+            # are indexed): score the rest as well, as a full scan would
+            seen = {resume_id for resume_id, _ in candidates}
+            candidates += [
+                (resume_id, 0) for row, resume_id in enumerate(self._ids)
+                if self._docs[row] is not None and resume_id not in seen
+            ]
+        return [(resume_id, overlap, self._docs[self._row_of[resume_id]]) for resume_id, overlap in candidates]
+
+    @staticmethod
+    def _score(candidates: list, artifacts: JobArtifacts) -> list:
+        docs = [doc for _, _, doc in candidates]
+        return [
+            {"resume_id": resume_id, "skill_overlap": overlap, **match}
+            for (resume_id, overlap, _), match in zip(candidates, match_resumes_to_job(docs, artifacts=artifacts))
+        ]
+
+    def rank(self, artifacts: JobArtifacts, k: int = 10) -> list:
+        """
+        Top-k indexed resumes for a job's artifacts, scored with the batch
+        matcher. Only the best k * RANK_OVERSAMPLE by skill overlap are scored,
+        unless fewer than k overlap at all; then every resume is.
+        """
+        scored = self._score(self._rank_candidates(artifacts, k), artifacts)
+        scored.sort(key=_rank_order)
+        return scored[:k]
+
+    def rank_iter(self, artifacts: JobArtifacts, k: int = 10, chunk_size: int = RANK_STREAM_CHUNK):
+        """
+        rank() in steps: yields (scored, total, top_k) after each `chunk_size`
+        candidates are scored. Candidates come best overlap first, so the
+        early top-k is usually close to the final one, which equals rank().
+        The candidates are fixed up front; resumes indexed meanwhile are not seen.
+        """
+        candidates = self._rank_candidates(artifacts, k)
+        top = []
+        for start in range(0, len(candidates), chunk_size):
+            chunk = candidates[start:start + chunk_size]
+            top = sorted(top + self._score(chunk, artifacts), key=_rank_order)[:k]
+            yield start + len(chunk), len(candidates), top
+
+    async def ensure_loaded(self, db: AsyncSession):
+        """Build the index from `Resume.parsed_data` the first time it is needed."""
+        if self.loaded:
+            return
+        async with self._lock:
+            if self.loaded:
+                return
+            result = await db.stream(
+                select(Resume.id, Resume.parsed_data).execution_options(
+                    yield_per=INDEX_LOAD_BATCH_SIZE
+                )
+            )
+            async for resume_id, parsed_data in result:
+                if parsed_data:
+                    self.add(resume_id, parsed_data)
+            self.loaded = True
+
+
+skill_index = SkillIndex()
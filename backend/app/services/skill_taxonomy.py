@@ -0,0 +1,99 @@
+import re
+import zlib
+from functools import lru_cache
+from typing import NamedTuple
+
+from app.services.skills_list import skill_definitions
+
+# Words (keeping internal dots and trailing +/#, so "node.js", "asp.net",
+# "c++" and "c#" are single tokens) and single punctuation characters.
+TOKEN_PATTERN = re.compile(r"\w+(?:\.\w+)*[+#]*|[^\w\s]")
+
+
+def tokenize(text: str) -> list:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+@lru_cache(maxsize=65536)
+def skill_key(surface: str) -> str:
+    """Normalized form aliases are compared on: lowercase tokens, single-spaced."""
+    return " ".join(tokenize(surface))
+
+
+class Skill(NamedTuple):
+    id: int
+    name: str
+    category: str
+    aliases: tuple
+
+
+class SkillTaxonomy:
+    """
+    Canonical skills with integer ids, their categories, and a precomputed
+    alias -> id map, so free-text skills resolve with one dict lookup and
+    matching reduces to integer set intersection.
+    """
+
+    def __init__(self, definitions: list):
+        self.skills = tuple(
+            Skill(skill_id, name, category, tuple(aliases))
+            for skill_id, (name, category, aliases) in enumerate(definitions)
+        )
+        self.alias_to_id = {}
+        self.categories = {}
+        for skill in self.skills:
+            self.categories.setdefault(skill.category, []).append(skill.id)
+            for surface in (skill.name, *skill.aliases):
+                key = skill_key(surface)
+                existing = self.alias_to_id.setdefault(key, skill.id)
+                if existing != skill.id:
+                    raise ValueError(
+                        f"{surface!r} is an alias of both {self.skills[existing].name!r} and {skill.name!r}"
+                    )
+        # Changes whenever the definitions do, so derived data can be rebuilt
+        self.version = zlib.crc32(repr(definitions).encode())
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def lookup(self, surface: str):
+        """Id of the skill named or aliased by `surface`, or None."""
+        return self.alias_to_id.get(skill_key(surface))
+
+    def resolve(self, surfaces) -> tuple:
+        """(set of ids, list of surfaces that did not resolve) for many skills."""
+        ids = set()
+        unresolved = []
+        for surface in surfaces:
+            skill_id = self.lookup(surface)
+            if skill_id is None:
+                unresolved.append(surface)
+            else:
+                ids.add(skill_id)
+        return ids, unresolved
+
+    def name(self, skill_id: int) -> str:
+        return self.skills[skill_id].name
+
+    def category(self, skill_id: int) -> str:
+        return self.skills[skill_id].category
+
+    def canonical_key(self, surface: str) -> str:
+        """Lowercased canonical name of a taxonomy skill, else the normalized surface."""
+        skill_id = self.lookup(surface)
+        return skill_key(surface) if skill_id is None else self.skills[skill_id].name.lower()
+
+    def skill_keys(self, surfaces, skill_ids=()) -> list:
+        """
+        Sorted, distinct canonical keys for a document's skills; what the
+        `skill_keys` column stores and `?skills=` filters compare against.
+        """
+        keys = {self.canonical_key(surface) for surface in surfaces if surface and surface.strip()}
+        keys.update(self.skills[skill_id].name.lower() for skill_id in skill_ids)
+        return sorted(keys)
+
+
+@lru_cache(maxsize=1)
+def get_taxonomy() -> SkillTaxonomy:
+    # Compiled once; main.py warms it at startup
+    return SkillTaxonomy(skill_definitions)
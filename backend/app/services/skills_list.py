@@ -1,267 +1,283 @@
-skills_list = [
-    ":NET Entity Framework" ".NET (5+)",
-    ".NET Framework (1.0 - 4.8)",
-    ".NET MAUI",
-    "APT",
-    "ASP.NET",
-    "ASP.NET CORE",
-    "Accountability",
-    "Ada",
-    "Adaptability",
-    "Alibaba Cloud",
-    "Amazon Web Services (AWS)",
-    "Analytical Thinking",
-    "Angular",
-    "AngularJS",
-    "Ansible",
-    "Ant",
-    "Apache Kafka",
-    "Apache Spark",
-    "Apex",
-    "Assembly",
-    "Astro",
-    "Attention to Detail",
-    "Bash/Shell (all shells)",
-    "BigQuery",
-    "Blazor",
-    "Bun",
-    "Business Intelligence",
-    "C",
-    "C#",
-    "C++",
-    "CUDA",
-    "Capacitor",
-    "Cassandra",
-    "Chef",
-    "Chocolatey",
-    "Clickhouse",
-    "Clojure",
-    "Cloud Firestore",
-    "Cloudflare",
-    "Cobol",
-    "Cockroachdb",
-    "CodeIgniter",
-    "Collaboration",
-    "Colocation",
-    "Composer",
-    "Cordova",
-    "Cosmos DB",
-    "Couch DB",
-    "Couchbase",
-    "Creative Thinking",
-    "Critical Thinking",
-    "Crystal",
-    "Dagger",
-    "Dart",
-    "Dashboarding",
-    "Data Analytics",
-    "Data Cleaning",
-    "Data Engineering",
-    "Data Science",
-    "Data Visualization",
-    "Databricks",
-    "Databricks SQL",
-    "Datawrapper",
-    "Datomic",
-    "Delphi",
-    "Deno",
-    "Digital Ocean",
-    "DirectX",
-    "Django",
-    "Docker",
-    "Drupal",
-    "DuckDB",
-    "Dynamodb",
-    "EDA",
-    "ETL",
-    "Elasticsearch",
-    "Electron",
-    "Elixir",
-    "Elm",
-    "Erlang",
-    "EventStoreDB",
-    "Excel",
-    "Express",
-    "F#",
-    "Fast Learner",
-    "FastAPI",
-    "Fastify",
-    "Firebase",
-    "Firebase Realtime Database",
-    "Firebird",
-    "Flask",
-    "Flexibility",
-    "Flutter",
-    "Fly.io",
-    "Fortran",
-    "GDScript",
-    "GTK",
-    "Gatsby",
-    "Go",
-    "Goal-Oriented",
-    "Godot",
-    "Google Cloud",
-    "Google Data Studio",
-    "Google Sheets",
-    "Google Test",
-    "Gradle",
-    "Groovy",
-    "H2",
-    "HTML/CSS",
-    "Hadoop",
-    "Haskell",
-    "Heroku",
-    "Hetzner",
-    "Homebrew",
-    "Htmx",
-    "Hugging Face Transformers",
-    "IBM Cloud Or Watson",
-    "IBM DB2",
-    "Independent Work",
-    "InfluxDB",
-    "Initiative",
-    "Ionic",
-    "JAX",
-    "Java",
-    "JavaScript",
-    "Julia",
-    "Keras",
-    "Kotlin",
-    "Ktor",
-    "Kubernetes",
-    "Laravel",
-    "Leadership",
-    "Linode, now Akamai",
-    "Lisp",
-    "Looker",
-    "Lua",
-    "MATLAB",
-    "MFC",
-    "MS Excel",
-    "MSBuild",
-    "Make",
-    "Managed Hosting",
-    "MariaDB",
-    "Matplotlib",
-    "Maven (build tool)",
-    "Metabase",
-    "MicroPython",
-    "Microsoft Access",
-    "Microsoft Azure",
-    "Microsoft Excel",
-    "Microsoft SQL Server",
-    "MongoDB",
-    "MySQL",
-    "Neo4J",
-    "NestJS",
-    "Netlify",
-    "Next.js",
-    "Nim",
-    "Ninja",
-    "Nix",
-    "Node.js",
-    "NuGet",
-    "NumPy",
-    "Nuxt.js",
-    "OCaml",
-    "OVH",
-    "Objective-C",
-    "OpenCL",
-    "OpenGL",
-    "OpenShift",
-    "OpenStack",
-    "Opencv",
-    "Oracle",
-    "Oracle Cloud Infrastructure (OCI)",
-    "PHP",
-    "Pacman",
-    "Pandas",
-    "Perl",
-    "Phoenix",
-    "Pip",
-    "Play Framework",
-    "Podman",
-    "PostgreSQL",
-    "Power BI",
-    "PowerBI",
-    "PowerShell",
-    "Presto",
-    "Problem Solving",
-    "Prolog",
-    "Pulumi",
-    "Puppet",
-    "Python",
-    "PythonAnywhere",
-    "Qt",
-    "Quarkus",
-    "R",
-    "RabbitMQ",
-    "RavenDB",
-    "React",
-    "React Native",
-    "Redis",
-    "Remix",
-    "Render",
-    "Reporting",
-    "Roslyn",
-    "Ruby",
-    "Ruby on Rails",
-    "Ruff",
-    "Rust",
-    "SQL",
-    "SQLite",
-    "Scala",
-    "Scaleway",
-    "Scikit-Learn",
-    "Seaborn",
-    "Self-motivation",
-    "Sheets",
-    "Snowflake",
-    "Solid.js",
-    "Solidity",
-    "Solr",
-    "Spreadsheets",
-    "Spring Boot",
-    "Spring Framework",
-    "Strapi",
-    "Strategic Thinking",
-    "Strong Communication",
-    "Supabase",
-    "Superset",
-    "Svelte",
-    "Swift",
-    "SwiftUI",
-    "Symfony",
-    "Tableau",
-    "Tauri",
-    "Teamwork",
-    "TensorFlow",
-    "Terraform",
-    "TiDB",
-    "Tidyverse",
-    "Time Management",
-    "Torch/PyTorch",
-    "TypeScript",
-    "Unity 3D",
-    "Unreal Engine",
-    "VBA",
-    "VMware",
-    "Vercel",
-    "Visual Basic (.Net)",
-    "Visual Studio Solution",
-    "Vite",
-    "Vue.js",
-    "Vultr",
-    "Webpack",
-    "WordPress",
-    "Work Ethic",
-    "Xamarin",
-    "Yarn",
-    "Yii 2",
-    "Zephyr",
-    "Zig",
-    "jQuery",
-    "mlflow",
-    "npm",
-    "pnpm",
+LANGUAGES = "Programming Languages"
+WEB = "Web Frameworks"
+LIBRARIES = "Libraries & Frameworks"
+APPS = "Mobile & Desktop"
+DATABASES = "Databases"
+CLOUD = "Cloud & Hosting"
+DEVOPS = "DevOps & Infrastructure"
+BUILD = "Build Tools & Package Managers"
+DATA = "Data & Analytics"
+ML = "Machine Learning & AI"
+SOFT = "Soft Skills"
+OTHER = "Other"
+
+# (canonical name, category, aliases). A skill's id is its position in this
+# list, and ids are stored with parsed resumes and jobs: only ever append.
+skill_definitions = [
+    (".NET Entity Framework", LIBRARIES, ("entity framework", "ef core")),
+    (".NET (5+)", LIBRARIES, (".net", "dotnet", ".net core")),
+    (".NET Framework (1.0 - 4.8)", LIBRARIES, (".net framework",)),
+    (".NET MAUI", APPS, ("maui",)),
+    ("APT", BUILD, ()),
+    ("ASP.NET", WEB, ()),
+    ("ASP.NET CORE", WEB, ()),
+    ("Accountability", SOFT, ()),
+    ("Ada", LANGUAGES, ()),
+    ("Adaptability", SOFT, ("adaptable",)),
+    ("Alibaba Cloud", CLOUD, ()),
+    ("Amazon Web Services (AWS)", CLOUD, ("aws", "amazon web services")),
+    ("Analytical Thinking", SOFT, ("analytical skills",)),
+    ("Angular", WEB, ()),
+    ("AngularJS", WEB, ("angular.js",)),
+    ("Ansible", DEVOPS, ()),
+    ("Ant", BUILD, ("apache ant",)),
+    ("Apache Kafka", DATA, ("kafka",)),
+    ("Apache Spark", DATA, ("spark", "pyspark")),
+    ("Apex", LANGUAGES, ()),
+    ("Assembly", LANGUAGES, ()),
+    ("Astro", WEB, ()),
+    ("Attention to Detail", SOFT, ("detail oriented", "detail-oriented")),
+    ("Bash/Shell (all shells)", LANGUAGES, ("bash", "shell scripting")),
+    ("BigQuery", DATA, ("google bigquery",)),
+    ("Blazor", WEB, ()),
+    ("Bun", WEB, ()),
+    ("Business Intelligence", DATA, ()),
+    ("C", LANGUAGES, ()),
+    ("C#", LANGUAGES, ("csharp",)),
+    ("C++", LANGUAGES, ("cpp",)),
+    ("CUDA", LANGUAGES, ()),
+    ("Capacitor", APPS, ()),
+    ("Cassandra", DATABASES, ("apache cassandra",)),
+    ("Chef", DEVOPS, ()),
+    ("Chocolatey", BUILD, ()),
+    ("Clickhouse", DATABASES, ()),
+    ("Clojure", LANGUAGES, ()),
+    ("Cloud Firestore", DATABASES, ("firestore",)),
+    ("Cloudflare", CLOUD, ()),
+    ("Cobol", LANGUAGES, ()),
+    ("Cockroachdb", DATABASES, ("cockroach db",)),
+    ("CodeIgniter", WEB, ()),
+    ("Collaboration", SOFT, ()),
+    ("Colocation", CLOUD, ()),
+    ("Composer", BUILD, ()),
+    ("Cordova", APPS, ("apache cordova",)),
+    ("Cosmos DB", DATABASES, ("cosmosdb",)),
+    ("Couch DB", DATABASES, ("couchdb",)),
+    ("Couchbase", DATABASES, ()),
+    ("Creative Thinking", SOFT, ("creativity",)),
+    ("Critical Thinking", SOFT, ()),
+    ("Crystal", LANGUAGES, ()),
+    ("Dagger", DEVOPS, ()),
+    ("Dart", LANGUAGES, ()),
+    ("Dashboarding", DATA, ("dashboards",)),
+    ("Data Analytics", DATA, ("data analysis", "dataanalytics")),
+    ("Data Cleaning", DATA, ()),
+    ("Data Engineering", DATA, ()),
+    ("Data Science", DATA, ("datascience",)),
+    ("Data Visualization", DATA, ("data visualisation",)),
+    ("Databricks", DATA, ()),
+    ("Databricks SQL", DATA, ()),
+    ("Datawrapper", DATA, ()),
+    ("Datomic", DATABASES, ()),
+    ("Delphi", LANGUAGES, ()),
+    ("Deno", WEB, ()),
+    ("Digital Ocean", CLOUD, ("digitalocean",)),
+    ("DirectX", LIBRARIES, ()),
+    ("Django", WEB, ()),
+    ("Docker", DEVOPS, ()),
+    ("Drupal", WEB, ()),
+    ("DuckDB", DATABASES, ()),
+    ("Dynamodb", DATABASES, ("dynamo db",)),
+    ("EDA", DATA, ("exploratory data analysis",)),
+    ("ETL", DATA, ()),
+    ("Elasticsearch", DATABASES, ("elastic search",)),
+    ("Electron", APPS, ("electron.js",)),
+    ("Elixir", LANGUAGES, ()),
+    ("Elm", LANGUAGES, ()),
+    ("Erlang", LANGUAGES, ()),
+    ("EventStoreDB", DATABASES, ()),
+    ("Excel", DATA, ("ms excel", "microsoft excel")),
+    ("Express", WEB, ("express.js", "expressjs")),
+    ("F#", LANGUAGES, ()),
+    ("Fast Learner", SOFT, ("quick learner",)),
+    ("FastAPI", WEB, ()),
+    ("Fastify", WEB, ()),
+    ("Firebase", CLOUD, ()),
+    ("Firebase Realtime Database", DATABASES, ()),
+    ("Firebird", DATABASES, ()),
+    ("Flask", WEB, ()),
+    ("Flexibility", SOFT, ()),
+    ("Flutter", APPS, ()),
+    ("Fly.io", CLOUD, ()),
+    ("Fortran", LANGUAGES, ()),
+    ("GDScript", LANGUAGES, ()),
+    ("GTK", APPS, ()),
+    ("Gatsby", WEB, ()),
+    ("Go", LANGUAGES, ("golang",)),
+    ("Goal-Oriented", SOFT, ("goal oriented",)),
+    ("Godot", OTHER, ()),
+    ("Google Cloud", CLOUD, ("gcp", "google cloud platform", "googlecloud")),
+    ("Google Data Studio", DATA, ("looker studio",)),
+    ("Google Sheets", DATA, ("sheets", "googlesheets")),
+    ("Google Test", LIBRARIES, ("gtest",)),
+    ("Gradle", BUILD, ()),
+    ("Groovy", LANGUAGES, ()),
+    ("H2", DATABASES, ()),
+    ("HTML/CSS", LANGUAGES, ("html", "css", "html5", "css3")),
+    ("Hadoop", DATA, ("apache hadoop",)),
+    ("Haskell", LANGUAGES, ()),
+    ("Heroku", CLOUD, ()),
+    ("Hetzner", CLOUD, ()),
+    ("Homebrew", BUILD, ()),
+    ("Htmx", WEB, ()),
+    ("Hugging Face Transformers", ML, ("hugging face", "huggingface")),
+    ("IBM Cloud Or Watson", CLOUD, ("ibm cloud", "ibm watson")),
+    ("IBM DB2", DATABASES, ("db2",)),
+    ("Independent Work", SOFT, ()),
+    ("InfluxDB", DATABASES, ()),
+    ("Initiative", SOFT, ()),
+    ("Ionic", APPS, ()),
+    ("JAX", ML, ()),
+    ("Java", LANGUAGES, ()),
+    ("JavaScript", LANGUAGES, ("js", "es6", "ecmascript")),
+    ("Julia", LANGUAGES, ()),
+    ("Keras", ML, ()),
+    ("Kotlin", LANGUAGES, ()),
+    ("Ktor", WEB, ()),
+    ("Kubernetes", DEVOPS, ("k8s",)),
+    ("Laravel", WEB, ()),
+    ("Leadership", SOFT, ()),
+    ("Linode", CLOUD, ("linode, now akamai", "akamai")),
+    ("Lisp", LANGUAGES, ()),
+    ("Looker", DATA, ()),
+    ("Lua", LANGUAGES, ()),
+    ("MATLAB", LANGUAGES, ()),
+    ("MFC", LIBRARIES, ()),
+    ("MSBuild", BUILD, ()),
+    ("Make", BUILD, ("makefile",)),
+    ("Managed Hosting", CLOUD, ()),
+    ("MariaDB", DATABASES, ()),
+    ("Matplotlib", DATA, ()),
+    ("Maven", BUILD, ("maven (build tool)", "apache maven")),
+    ("Metabase", DATA, ()),
+    ("MicroPython", LANGUAGES, ()),
+    ("Microsoft Access", DATABASES, ("ms access",)),
+    ("Microsoft Azure", CLOUD, ("azure",)),
+    ("Microsoft SQL Server", DATABASES, ("sql server", "mssql", "ms sql server")),
+    ("MongoDB", DATABASES, ("mongo",)),
+    ("MySQL", DATABASES, ()),
+    ("Neo4J", DATABASES, ()),
+    ("NestJS", WEB, ("nest.js",)),
+    ("Netlify", CLOUD, ()),
+    ("Next.js", WEB, ("nextjs",)),
+    ("Nim", LANGUAGES, ()),
+    ("Ninja", BUILD, ()),
+    ("Nix", BUILD, ()),
+    ("Node.js", WEB, ("nodejs", "node js")),
+    ("NuGet", BUILD, ()),
+    ("NumPy", DATA, ()),
+    ("Nuxt.js", WEB, ("nuxt", "nuxtjs")),
+    ("OCaml", LANGUAGES, ()),
+    ("OVH", CLOUD, ()),
+    ("Objective-C", LANGUAGES, ("objc", "objective c")),
+    ("OpenCL", LIBRARIES, ()),
+    ("OpenGL", LIBRARIES, ()),
+    ("OpenShift", DEVOPS, ()),
+    ("OpenStack", CLOUD, ()),
+    ("OpenCV", ML, ()),
+    ("Oracle", DATABASES, ("oracle database",)),
+    ("Oracle Cloud Infrastructure (OCI)", CLOUD, ("oci", "oracle cloud")),
+    ("PHP", LANGUAGES, ()),
+    ("Pacman", BUILD, ()),
+    ("Pandas", DATA, ()),
+    ("Perl", LANGUAGES, ()),
+    ("Phoenix", WEB, ()),
+    ("Pip", BUILD, ()),
+    ("Play Framework", WEB, ()),
+    ("Podman", DEVOPS, ()),
+    ("PostgreSQL", DATABASES, ("postgres",)),
+    ("Power BI", DATA, ("powerbi",)),
+    ("PowerShell", LANGUAGES, ()),
+    ("Presto", DATA, ()),
+    ("Problem Solving", SOFT, ("problem-solving",)),
+    ("Prolog", LANGUAGES, ()),
+    ("Pulumi", DEVOPS, ()),
+    ("Puppet", DEVOPS, ()),
+    ("Python", LANGUAGES, ()),
+    ("PythonAnywhere", CLOUD, ()),
+    ("Qt", APPS, ()),
+    ("Quarkus", WEB, ()),
+    ("R", LANGUAGES, ()),
+    ("RabbitMQ", DEVOPS, ()),
+    ("RavenDB", DATABASES, ()),
+    ("React", WEB, ("react.js", "reactjs")),
+    ("React Native", APPS, ()),
+    ("Redis", DATABASES, ()),
+    ("Remix", WEB, ()),
+    ("Render", CLOUD, ()),
+    ("Reporting", DATA, ()),
+    ("Roslyn", LIBRARIES, ()),
+    ("Ruby", LANGUAGES, ()),
+    ("Ruby on Rails", WEB, ("rails", "ror")),
+    ("Ruff", BUILD, ()),
+    ("Rust", LANGUAGES, ()),
+    ("SQL", LANGUAGES, ()),
+    ("SQLite", DATABASES, ()),
+    ("Scala", LANGUAGES, ()),
+    ("Scaleway", CLOUD, ()),
+    ("Scikit-Learn", ML, ("sklearn", "scikit learn")),
+    ("Seaborn", DATA, ()),
+    ("Self-motivation", SOFT, ("self-motivated", "self motivated")),
+    ("Snowflake", DATA, ()),
+    ("Solid.js", WEB, ("solidjs",)),
+    ("Solidity", LANGUAGES, ()),
+    ("Solr", DATABASES, ("apache solr",)),
+    ("Spreadsheets", DATA, ()),
+    ("Spring Boot", WEB, ()),
+    ("Spring Framework", WEB, ()),
+    ("Strapi", WEB, ()),
+    ("Strategic Thinking", SOFT, ()),
+    ("Strong Communication", SOFT, ("communication", "communication skills")),
+    ("Supabase", CLOUD, ()),
+    ("Superset", DATA, ("apache superset",)),
+    ("Svelte", WEB, ()),
+    ("Swift", LANGUAGES, ()),
+    ("SwiftUI", APPS, ()),
+    ("Symfony", WEB, ()),
+    ("Tableau", DATA, ()),
+    ("Tauri", APPS, ()),
+    ("Teamwork", SOFT, ("team player",)),
+    ("TensorFlow", ML, ()),
+    ("Terraform", DEVOPS, ()),
+    ("TiDB", DATABASES, ()),
+    ("Tidyverse", DATA, ()),
+    ("Time Management", SOFT, ()),
+    ("Torch/PyTorch", ML, ("pytorch", "torch")),
+    ("TypeScript", LANGUAGES, ()),
+    ("Unity 3D", OTHER, ()),
+    ("Unreal Engine", OTHER, ()),
+    ("VBA", LANGUAGES, ()),
+    ("VMware", CLOUD, ()),
+    ("Vercel", CLOUD, ()),
+    ("Visual Basic (.Net)", LANGUAGES, ("vb.net", "visual basic")),
+    ("Visual Studio Solution", BUILD, ()),
+    ("Vite", BUILD, ()),
+    ("Vue.js", WEB, ("vue", "vuejs")),
+    ("Vultr", CLOUD, ()),
+    ("Webpack", BUILD, ()),
+    ("WordPress", WEB, ()),
+    ("Work Ethic", SOFT, ()),
+    ("Xamarin", APPS, ()),
+    ("Yarn", BUILD, ()),
+    ("Yii 2", WEB, ("yii",)),
+    ("Zephyr", OTHER, ()),
+    ("Zig", LANGUAGES, ()),
+    ("jQuery", LIBRARIES, ()),
+    ("mlflow", ML, ()),
+    ("npm", BUILD, ()),
+    ("pnpm", BUILD, ()),
+    ("Machine Learning", ML, ("ml", "machinelearning")),
+    ("Artificial Intelligence", ML, ("ai",)),
 ]
+
+skills_list = [name for name, _, _ in skill_definitions]
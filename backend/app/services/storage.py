@@ -0,0 +1,179 @@
+import asyncio
+import os
+import random
+from pathlib import Path
+from urllib.parse import quote
+
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# "supabase" (Storage REST API over pooled async HTTP) or "local" (filesystem,
+# for tests and local development without a Supabase project)
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "supabase")
+STORAGE_BUCKET = os.getenv("STORAGE_BUCKET", "resumes")
+STORAGE_LOCAL_DIR = os.getenv("STORAGE_LOCAL_DIR", "./storage")
+STORAGE_MAX_CONCURRENCY = int(os.getenv("STORAGE_MAX_CONCURRENCY", "8"))
+STORAGE_MAX_RETRIES = int(os.getenv("STORAGE_MAX_RETRIES", "3"))
+STORAGE_RETRY_BACKOFF = float(os.getenv("STORAGE_RETRY_BACKOFF", "0.5"))
+STORAGE_TIMEOUT = float(os.getenv("STORAGE_TIMEOUT", "30"))
+
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+class StorageError(Exception):
+    """Raised when an object cannot be stored or deleted."""
+
+
+class SupabaseStorage:
+    """
+    Async client for the Supabase Storage REST API. One pooled httpx client
+    is reused for every request, concurrency is capped by a semaphore, and
+    transport errors and retryable statuses are retried with jittered
+    exponential backoff.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        key: str,
+        bucket: str = "resumes",
+        max_concurrency: int = 8,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 30,
+        transport: httpx.AsyncBaseTransport = None,
+    ):
+        if not url or not key:
+            raise StorageError("SUPABASE_URL and SUPABASE_KEY must be set for Supabase storage.")
+        self.base_url = f"{url.rstrip('/')}/storage/v1"
+        self.key = key
+        self.bucket = bucket
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max(0, max_retries)
+        self.backoff = backoff
+        self.timeout = timeout
+        self._transport = transport
+        self._client = None
+        self._slots = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={"Authorization": f"Bearer {self.key}", "apikey": self.key},
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+                timeout=self.timeout,
+                transport=self._transport,
+            )
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+        return self._client
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        client = self._get_client()
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self._slots:
+                    response = await client.request(method, url, **kwargs)
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    break
+                error = StorageError(f"{method} {url} failed: {response.status_code} {response.text}")
+            except httpx.TransportError as e:
+                response = None
+                error = StorageError(f"{method} {url} failed: {e!r}")
+
+            if attempt == self.max_retries:
+                raise error
+            await asyncio.sleep(self.backoff * (2 ** attempt) * (0.5 + random.random()))
+
+        if response.is_error:
+            raise StorageError(f"{method} {url} failed: {response.status_code} {response.text}")
+        return response
+
+    def public_url(self, path: str) -> str:
+        # Bucket must be public
+        return f"{self.base_url}/object/public/{self.bucket}/{quote(path)}"
+
+    async def upload(self, path: str, data: bytes, content_type: str = None) -> str:
+        await self._request(
+            "POST",
+            f"/object/{self.bucket}/{quote(path)}",
+            content=data,
+            headers={
+                "Content-Type": content_type or "application/octet-stream",
+                "x-upsert": "false",
+            },
+        )
+        return self.public_url(path)
+
+    async def delete(self, path: str):
+        await self._request("DELETE", f"/object/{self.bucket}", json={"prefixes": [path]})
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+class LocalStorage:
+    """Stores objects under a local directory and returns file:// URLs."""
+
+    def __init__(self, root: str, bucket: str = "resumes"):
+        self.root = Path(root).resolve() / bucket
+
+    def _path(self, path: str) -> Path:
+        target = (self.root / path).resolve()
+        if self.root not in target.parents:
+            raise StorageError(f"Invalid object path: {path}")
+        return target
+
+    async def upload(self, path: str, data: bytes, content_type: str = None) -> str:
+        target = self._path(path)
+
+        def write():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(data)
+
+        await asyncio.to_thread(write)
+        return target.as_uri()
+
+    async def delete(self, path: str):
+        await asyncio.to_thread(self._path(path).unlink, True)
+
+    async def close(self):
+        pass
+
+
+_storage = None
+
+
+def get_storage():
+    """The configured storage backend, created on first use."""
+    global _storage
+    if _storage is None:
+        if STORAGE_BACKEND == "local":
+            _storage = LocalStorage(STORAGE_LOCAL_DIR, bucket=STORAGE_BUCKET)
+        elif STORAGE_BACKEND == "supabase":
+            _storage = SupabaseStorage(
+                os.getenv("SUPABASE_URL"),
+                os.getenv("SUPABASE_KEY"),
+                bucket=STORAGE_BUCKET,
+                max_concurrency=STORAGE_MAX_CONCURRENCY,
+                max_retries=STORAGE_MAX_RETRIES,
+                backoff=STORAGE_RETRY_BACKOFF,
+                timeout=STORAGE_TIMEOUT,
+            )
+        else:
+            raise StorageError(f"Unknown storage backend: {STORAGE_BACKEND}")
+    return _storage
+
+
+async def close_storage():
+    global _storage
+    if _storage is not None:
+        await _storage.close()
+        _storage = None
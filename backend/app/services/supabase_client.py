@@ -1,34 +1,28 @@
-from supabase import create_client
-import os
-from dotenv import load_dotenv
+import logging
 import uuid
 
-load_dotenv()
+from app.services.storage import get_storage
 
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")
+logger = logging.getLogger(__name__)
 
-supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
 
+def resume_object_path(filename: str) -> str:
+    return f"{uuid.uuid4()}_{filename}"
 
-async def upload_resume_to_supabase(file):
-    try:
-        contents = await file.read()
-        unique_id = str(uuid.uuid4())
-        file_name = f"{unique_id}_{file.filename}"
-
-        # Upload (will raise exception if RLS or auth fails)
-        upload_response = supabase.storage.from_('resumes').upload(
-            file_name,
-            contents,
-            file_options={"content-type": file.content_type},
-        )
-
-        # Build public URL (bucket must be public)
-        public_url = supabase.storage.from_('resumes').get_public_url(file_name)
-
-        return public_url
 
+async def upload_resume_to_supabase(
+    contents: bytes, filename: str, content_type: str, object_path: str = None
+) -> str:
+    # Takes the bytes the caller already read for parsing, so the upload
+    # is never read from the request a second time. Goes through the async
+    # storage client, so the event loop is never blocked on the network.
+    object_path = object_path or resume_object_path(filename)
+    try:
+        return await get_storage().upload(object_path, contents, content_type)
     except Exception as e:
-        print("❌ Supabase upload error:", str(e))
+        logger.warning("Supabase upload failed", extra={"object_path": object_path, "error": str(e)})
         raise
+
+
+async def delete_resume_from_supabase(object_path: str):
+    await get_storage().delete(object_path)
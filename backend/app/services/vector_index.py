@@ -0,0 +1,315 @@
+import asyncio
+import json
+import logging
+import os
+import re
+import zlib
+from collections import Counter
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.db import Resume
+
+logger = logging.getLogger(__name__)
+
+VECTOR_INDEX_DIR = os.getenv("VECTOR_INDEX_DIR", "./vector_index")
+VECTOR_DIM = int(os.getenv("VECTOR_DIM", "256"))
+# IVF lists, and how many of them a query scans
+VECTOR_INDEX_LISTS = int(os.getenv("VECTOR_INDEX_LISTS", "64"))
+VECTOR_INDEX_PROBES = int(os.getenv("VECTOR_INDEX_PROBES", "8"))
+# Below this many vectors search is an exact scan and no centroids are trained
+VECTOR_INDEX_TRAIN_SIZE = int(os.getenv("VECTOR_INDEX_TRAIN_SIZE", "4096"))
+# Centroids are retrained once the index has grown this many times over
+VECTOR_INDEX_RETRAIN_GROWTH = float(os.getenv("VECTOR_INDEX_RETRAIN_GROWTH", "4"))
+
+_TOKEN_RE = re.compile(r"\w+")
+_KMEANS_ITERATIONS = 10
+_KMEANS_SAMPLE_PER_LIST = 64
+_ASSIGN_CHUNK = 65536
+
+
+def embed_text(text: str, dim: int = None) -> np.ndarray:
+    """
+    Dense float32 embedding of word uni/bi-grams hashed into `dim` signed
+    buckets (the sign halves collision bias), with sublinear (1 + log tf)
+    weights, L2-normalized so a dot product is a cosine similarity.
+    """
+    dim = dim or VECTOR_DIM
+    tokens = _TOKEN_RE.findall((text or "").lower())
+    grams = Counter(tokens)
+    grams.update(" ".join(pair) for pair in zip(tokens, tokens[1:]))
+    vector = np.zeros(dim, dtype=np.float32)
+    if not grams:
+        return vector
+
+    hashes = np.fromiter((zlib.crc32(gram.encode("utf-8")) for gram in grams), dtype=np.int64, count=len(grams))
+    weights = 1.0 + np.log(np.fromiter(grams.values(), dtype=np.float64, count=len(grams)))
+    signs = np.where(hashes & 0x80000000, -1.0, 1.0)
+    vector += np.bincount(hashes % dim, weights=signs * weights, minlength=dim).astype(np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class VectorIndex:
+    """
+    Persistent CPU-only approximate nearest-neighbour index over resume
+    embeddings (inverted file / IVF).
+
+    Vectors live in a memory-mapped float32 matrix (`vectors.f32`) with
+    parallel memory-mapped resume ids (`ids.i64`, -1 once superseded) and IVF
+    list assignments (`lists.i32`); `meta.json` records how many rows are
+    committed, so rows written by an interrupted insert are ignored on load.
+    Until VECTOR_INDEX_TRAIN_SIZE vectors exist search is an exact scan. Past
+    that, k-means centroids partition the rows and a query scans only the
+    `probes` lists whose centroids are closest to it. Inserts append a row and
+    file it under its nearest centroid without a rebuild.
+
+    On the event loop use `insert` and `ensure_synced`: they embed and write
+    on a thread under the index lock, and retrain in a background task, so
+    only `search` (read-only) runs on the loop itself.
+    """
+
+    def __init__(self, directory: str, dim: int = None, n_lists: int = None):
+        self.directory = directory
+        self.dim = dim or VECTOR_DIM
+        self.n_lists = n_lists or VECTOR_INDEX_LISTS
+        self._opened = False
+        self._synced = False
+        self._lock = asyncio.Lock()
+        self._training = None
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _open(self):
+        if self._opened:
+            return
+        self.count = 0
+        self.capacity = 0
+        self.trained_count = 0
+        self._centroids = None
+        self._vectors = self._ids = self._assignments = None
+        try:
+            with open(self._path("meta.json")) as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            meta = None
+        if meta and meta["dim"] == self.dim and meta["n_lists"] == self.n_lists:
+            self.count = meta["count"]
+            self.trained_count = meta["trained_count"]
+            self._map(meta["capacity"])
+            if self.trained_count:
+                self._centroids = np.load(self._path("centroids.npy"))
+        elif meta:
+            logger.warning("Vector index has another shape; rebuilding it", extra={"directory": self.directory})
+
+        self._row_of = {}
+        for row, resume_id in enumerate(self._ids[: self.count].tolist() if self.count else ()):
+            if resume_id >= 0:
+                self._row_of[resume_id] = row
+        self._set_lists(self._build_lists() if self.trained_count else None)
+        self._opened = True
+
+    def _map(self, capacity: int):
+        """(Re)map the row files with room for `capacity` rows, growing them if needed."""
+        os.makedirs(self.directory, exist_ok=True)
+        mapped = []
+        for name, dtype, width in (("vectors.f32", np.float32, self.dim), ("ids.i64", np.int64, 1),
+                                   ("lists.i32", np.int32, 1)):
+            path = self._path(name)
+            size = capacity * width * np.dtype(dtype).itemsize
+            with open(path, "ab") as f:
+                if f.tell() < size:
+                    f.truncate(size)
+            shape = (capacity, self.dim) if width > 1 else (capacity,)
+            mapped.append(np.memmap(path, dtype=dtype, mode="r+", shape=shape))
+        self._vectors, self._ids, self._assignments = mapped
+        self.capacity = capacity
+
+    def _build_lists(self) -> list:
+        lists = [[] for _ in range(self.n_lists)]
+        live = np.flatnonzero(self._ids[: self.count] >= 0)
+        for row, list_id in zip(live.tolist(), self._assignments[live].tolist()):
+            lists[list_id].append(row)
+        return lists
+
+    def _set_lists(self, lists):
+        # Swapped in whole: a search on the event loop may run while a thread retrains
+        self._lists, self._list_arrays = lists or [[] for _ in range(self.n_lists)], {}
+
+    def _write_meta(self):
+        for array in (self._vectors, self._ids, self._assignments):
+            array.flush()
+        meta = {
+            "dim": self.dim,
+            "n_lists": self.n_lists,
+            "count": self.count,
+            "capacity": self.capacity,
+            "trained_count": self.trained_count,
+        }
+        tmp_path = self._path("meta.json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self._path("meta.json"))
+
+    def __len__(self):
+        self._open()
+        return len(self._row_of)
+
+    def __contains__(self, resume_id: int):
+        self._open()
+        return resume_id in self._row_of
+
+    def add(self, resume_id: int, text: str):
+        self.add_many([(resume_id, text)])
+
+    @property
+    def needs_training(self) -> bool:
+        """Enough vectors for IVF and no centroids yet, or grown RETRAIN_GROWTH times since the last fit."""
+        live = len(self._row_of)
+        return live >= VECTOR_INDEX_TRAIN_SIZE and (
+            not self.trained_count or live >= VECTOR_INDEX_RETRAIN_GROWTH * self.trained_count
+        )
+
+    def add_many(self, items):
+        """
+        Embed and insert (resume id, text) pairs, training inline when due; a
+        re-added id replaces its old vector. Blocking: for scripts and tests.
+        """
+        self._insert(list(items))
+        if self.needs_training:
+            self.train()
+
+    def _insert(self, items: list):
+        self._open()
+        if not items:
+            return
+        if self.count + len(items) > self.capacity:
+            self._map(max(1024, 2 * self.capacity, self.count + len(items)))
+
+        for resume_id, text in items:
+            old_row = self._row_of.get(resume_id)
+            if old_row is not None:
+                # Superseded rows stay in their IVF list but are skipped at query time
+                self._ids[old_row] = -1
+            row = self.count
+            vector = embed_text(text, self.dim)
+            self._vectors[row] = vector
+            self._ids[row] = resume_id
+            if self.trained_count:
+                list_id = int(np.argmax(self._centroids @ vector))
+                self._assignments[row] = list_id
+                self._lists[list_id].append(row)
+                self._list_arrays.pop(list_id, None)
+            self._row_of[resume_id] = row
+            self.count += 1
+        self._write_meta()
+
+    async def insert(self, items):
+        """add_many without blocking the event loop; retraining, when due, starts in the background."""
+        items = list(items)
+        if not items:
+            return
+        async with self._lock:
+            await asyncio.to_thread(self._insert, items)
+        self._schedule_training()
+
+    def _schedule_training(self):
+        if self.needs_training and (self._training is None or self._training.done()):
+            self._training = asyncio.create_task(self._train_in_background())
+
+    async def _train_in_background(self):
+        try:
+            async with self._lock:
+                # Inserts queue behind the lock meanwhile; searches keep using the old centroids
+                if self.needs_training:
+                    await asyncio.to_thread(self.train)
+        except Exception:
+            logger.exception("Vector index training failed", extra={"directory": self.directory})
+
+    def train(self, seed: int = 0):
+        """Fit IVF centroids with spherical k-means and reassign every row."""
+        self._open()
+        live = np.flatnonzero(self._ids[: self.count] >= 0)
+        if len(live) < self.n_lists:
+            return
+        rng = np.random.default_rng(seed)
+        sample_size = min(len(live), self.n_lists * _KMEANS_SAMPLE_PER_LIST)
+        sample = np.asarray(self._vectors[np.sort(rng.choice(live, sample_size, replace=False))])
+
+        centroids = sample[rng.choice(len(sample), self.n_lists, replace=False)].copy()
+        for _ in range(_KMEANS_ITERATIONS):
+            nearest = np.argmax(sample @ centroids.T, axis=1)
+            for list_id in range(self.n_lists):
+                members = sample[nearest == list_id]
+                if len(members):
+                    centroid = members.sum(axis=0)
+                    norm = np.linalg.norm(centroid)
+                    if norm:
+                        centroids[list_id] = centroid / norm
+
+        # Searches do not read the assignments, only the lists built from them
+        for start in range(0, len(live), _ASSIGN_CHUNK):
+            rows = live[start:start + _ASSIGN_CHUNK]
+            self._assignments[rows] = np.argmax(self._vectors[rows] @ centroids.T, axis=1)
+        np.save(self._path("centroids.npy"), centroids)
+        self._set_lists(self._build_lists())
+        self._centroids = centroids
+        self.trained_count = len(live)
+        self._write_meta()
+
+    def _list_array(self, list_id: int) -> np.ndarray:
+        array = self._list_arrays.get(list_id)
+        if array is None:
+            array = np.asarray(self._lists[list_id], dtype=np.int64)
+            self._list_arrays[list_id] = array
+        return array
+
+    def search(self, text: str, k: int = 10, probes: int = None) -> list:
+        """Up to `k` (resume id, cosine similarity) pairs, most similar first."""
+        self._open()
+        query = embed_text(text, self.dim)
+        if not self.count or not query.any() or k <= 0:
+            return []
+
+        if self.trained_count:
+            probes = min(self.n_lists, probes or VECTOR_INDEX_PROBES)
+            closest = np.argpartition(-(self._centroids @ query), probes - 1)[:probes]
+            rows = np.concatenate([self._list_array(list_id) for list_id in closest])
+        else:
+            rows = np.arange(self.count)
+        rows = rows[self._ids[rows] >= 0]
+        if not len(rows):
+            return []
+
+        scores = self._vectors[rows] @ query
+        if len(rows) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+            rows, scores = rows[top], scores[top]
+        order = np.lexsort((rows, -scores))
+        return [(int(self._ids[rows[i]]), float(scores[i])) for i in order]
+
+    async def ensure_synced(self, db: AsyncSession, batch_size: int = 1000):
+        """Index stored resumes missing from the index (first run, or rows added elsewhere)."""
+        if self._synced:
+            return
+        async with self._lock:
+            if self._synced:
+                return
+            await asyncio.to_thread(self._open)
+            result = await db.stream(select(Resume.id, Resume.content).execution_options(yield_per=batch_size))
+            batch = []
+            async for resume_id, content in result:
+                if resume_id not in self._row_of:
+                    batch.append((resume_id, content))
+                if len(batch) >= batch_size:
+                    await asyncio.to_thread(self._insert, batch)
+                    batch = []
+            await asyncio.to_thread(self._insert, batch)
+            self._synced = True
+        self._schedule_training()
+
+
+resume_vector_index = VectorIndex(VECTOR_INDEX_DIR)
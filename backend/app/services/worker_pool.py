@@ -0,0 +1,113 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# "thread" keeps one copy of the spaCy model in memory; "process" sidesteps the
+# GIL for pdfminer/spaCy at the cost of one model copy per worker process.
+WORKER_POOL_KIND = os.getenv("WORKER_POOL_KIND", "thread")
+WORKER_POOL_SIZE = int(os.getenv("WORKER_POOL_SIZE", str(min(4, os.cpu_count() or 1))))
+# Jobs allowed in flight (running + queued) before new work is rejected.
+WORKER_POOL_MAX_PENDING = int(
+    os.getenv("WORKER_POOL_MAX_PENDING", str(WORKER_POOL_SIZE * 4))
+)
+
+
+class WorkerPoolSaturated(Exception):
+    """Raised when the pool already has `max_pending` jobs in flight."""
+
+
+class WorkerPool:
+    """
+    Runs CPU-bound callables (PDF extraction, NLP) off the event loop.
+    The executor is created lazily so importing the app stays cheap, and the
+    number of in-flight jobs is capped so callers can shed load with a 503
+    instead of queueing without bound.
+    """
+
+    def __init__(self, kind="thread", max_workers=1, max_pending=4):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown worker pool kind: {kind}")
+        self.kind = kind
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(1, max_pending)
+        self._executor = None
+        self._pending = 0
+        self._slot_freed = None
+        self._slot_freed_loop = None
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    @property
+    def saturated(self) -> bool:
+        return self._pending >= self.max_pending
+
+    def _get_executor(self):
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="worker-pool"
+                )
+        return self._executor
+
+    def _release(self):
+        self._pending -= 1
+        if self._slot_freed is not None:
+            self._slot_freed.set()
+
+    async def _wait_for_slot(self):
+        loop = asyncio.get_running_loop()
+        if self._slot_freed is None or self._slot_freed_loop is not loop:
+            self._slot_freed = asyncio.Event()
+            self._slot_freed_loop = loop
+        while self.saturated:
+            self._slot_freed.clear()
+            await self._slot_freed.wait()
+
+    async def run(self, func, *args, wait=False):
+        """
+        Run func(*args) on the pool. When saturated, raise WorkerPoolSaturated,
+        or with wait=True (batch work that should queue rather than fail)
+        wait for a slot instead.
+        """
+        if self.saturated:
+            if not wait:
+                raise WorkerPoolSaturated(
+                    f"Worker pool is saturated ({self._pending} jobs in flight)."
+                )
+            await self._wait_for_slot()
+
+        loop = asyncio.get_running_loop()
+        future = self._get_executor().submit(func, *args)
+        self._pending += 1
+
+        # Release the slot when the work really finishes, not when the awaiting
+        # request goes away, so cancelled requests still count against the cap.
+        def on_done(_):
+            try:
+                loop.call_soon_threadsafe(self._release)
+            except RuntimeError:
+                # Event loop already closed (shutdown)
+                pass
+
+        future.add_done_callback(on_done)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self, wait=True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+
+worker_pool = WorkerPool(
+    kind=WORKER_POOL_KIND,
+    max_workers=WORKER_POOL_SIZE,
+    max_pending=WORKER_POOL_MAX_PENDING,
+)
@@ -0,0 +1,85 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import asyncio
+from types import SimpleNamespace
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.admin import reanalyze
+from app.models.db import Base, JobDescription, Resume
+from app.services import name_extractor
+from app.services.job_description_analyzer import analyze_job_description, analyze_job_descriptions
+from app.services.resume_parser import analyze_resume_text, analyze_resumes
+
+RESUMES = [
+    "John Doe\njohn@example.com\n\nSkills\nPython, Docker\n",
+    "Software Engineer\nBerlin, Germany\nZed Quarnby\n\nSkills\nSQL, React\n",
+    "Summary\nNo header name here\n\nSkills\nExcel\n",
+]
+
+
+class FakeNer:
+    """Stands in for the spaCy pipeline: tags "Zed Quarnby" as a PERSON."""
+
+    def __init__(self):
+        self.piped = []
+
+    def _doc(self, text):
+        ents = [SimpleNamespace(label_="PERSON", text="Zed Quarnby")] if "Zed Quarnby" in text else []
+        return SimpleNamespace(ents=ents)
+
+    def __call__(self, text):
+        return self._doc(text)
+
+    def pipe(self, texts, batch_size=None, n_process=None):
+        texts = list(texts)
+        self.piped.append((len(texts), batch_size, n_process))
+        return [self._doc(text) for text in texts]
+
+
+def test_batch_results_match_single_document_results(monkeypatch):
+    ner = FakeNer()
+    monkeypatch.setattr(name_extractor, "get_ner_pipeline", lambda: ner)
+    for mode in ("auto", "heuristic", "ner"):
+        assert analyze_resumes(RESUMES, mode, batch_size=8) == [analyze_resume_text(t, mode) for t in RESUMES]
+    # auto sends only the two unsure headers to NER, as one batch
+    ner.piped.clear()
+    analyze_resumes(RESUMES, "auto", batch_size=8, n_process=1)
+    assert ner.piped == [(2, 8, 1)]
+
+    jobs = ["About the job\nData Engineer\nPython and SQL", "Backend Developer\nDocker, Kubernetes"]
+    assert analyze_job_descriptions(jobs) == [analyze_job_description(t) for t in jobs]
+
+
+def test_reanalyze_rewrites_rows_in_chunks(monkeypatch):
+    monkeypatch.setattr(name_extractor, "get_ner_pipeline", lambda: FakeNer())
+
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        sessions = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        async with sessions() as db:
+            for i, text in enumerate(RESUMES, start=1):
+                db.add(Resume(id=i, filename=f"r{i}.pdf", content=text, parsed_data={"skills": []}))
+            db.add(JobDescription(id=1, title="old", content="About the job\nData Engineer\nPython and SQL"))
+            await db.commit()
+
+        dry = await reanalyze(sessions, Resume, chunk_size=2, dry_run=True)
+        resumed = await reanalyze(sessions, Resume, chunk_size=2, start_after=1)
+        jobs = await reanalyze(sessions, JobDescription, chunk_size=2)
+        async with sessions() as db:
+            resumes = {r.id: r for r in (await db.execute(Resume.__table__.select())).all()}
+            job = await db.get(JobDescription, 1)
+        await engine.dispose()
+        return dry, resumed, jobs, resumes, job
+
+    dry, resumed, jobs, resumes, job = asyncio.run(run())
+    assert dry["rows"] == 3 and resumed == {**resumed, "rows": 2, "last_id": 3} and jobs["rows"] == 1
+    assert resumes[1].parsed_data == {"skills": []}  # before --start-after
+    assert resumes[2].parsed_data == analyze_resume_text(RESUMES[1])
+    assert resumes[2].parsed_data["name"] == "Zed Quarnby"
+    assert resumes[2].skill_keys == ["react", "sql"]
+    assert job.title == "Data Engineer" and job.artifacts and "python" in job.skill_keys
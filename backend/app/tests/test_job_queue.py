@@ -0,0 +1,63 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import asyncio
+
+import pytest
+
+import app.services.job_queue as job_queue
+from app.services.job_queue import QueueFull, ResumeJobQueue
+from app.services.resume_pipeline import ResumeProcessingError, UploadItem
+
+
+class FakeDbContext:
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+async def fake_process_resume(db, item, wait=False, on_stage=None):
+    if item.contents == b"bad":
+        raise ResumeProcessingError(400, "Invalid PDF file format.")
+    for stage in ("extracted", "analyzed", "uploaded", "stored"):
+        on_stage(stage)
+        await asyncio.sleep(0)
+    return {"id": 1, "filename": item.filename}
+
+
+@pytest.fixture
+def queue(monkeypatch):
+    monkeypatch.setattr(job_queue, "get_db_context", FakeDbContext)
+    monkeypatch.setattr(job_queue, "process_resume", fake_process_resume)
+    return ResumeJobQueue(workers=1, max_size=2)
+
+
+def test_jobs_report_progress_and_results(queue):
+    async def main():
+        ok = queue.submit(UploadItem("ok.pdf", b"%PDF", "application/pdf"))
+        bad = queue.submit(UploadItem("bad.pdf", b"bad", "application/pdf"))
+        assert ok.status == "queued"
+        await queue._queue.join()
+        await queue.stop()
+        return queue.get(ok.id), queue.get(bad.id)
+
+    ok, bad = asyncio.run(main())
+    assert ok.status == "succeeded"
+    assert ok.progress == 1.0
+    assert ok.result == {"id": 1, "filename": "ok.pdf"}
+    assert bad.status == "failed"
+    assert bad.error == {"status_code": 400, "detail": "Invalid PDF file format."}
+
+
+def test_full_queue_rejects(queue):
+    async def main():
+        queue.submit(UploadItem("a.pdf", b"a", "application/pdf"))
+        queue.submit(UploadItem("b.pdf", b"b", "application/pdf"))
+        with pytest.raises(QueueFull):
+            queue.submit(UploadItem("c.pdf", b"c", "application/pdf"))
+        await queue.stop()
+
+    asyncio.run(main())
@@ -0,0 +1,22 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import numpy as np
+
+from app.api.responses import JSONResponse
+from app.services import json_codec
+
+
+def test_round_trips_numpy_values_and_sets():
+    payload = {"ids": np.array([1, 2]), "count": np.int64(3), "score": np.float32(0.5), "skills": {"sql"}, 7: None}
+    assert json_codec.loads(json_codec.dumps(payload)) == {
+        "ids": [1, 2], "count": 3, "score": 0.5, "skills": ["sql"], "7": None,
+    }
+    assert json_codec.dumps_str({"name": "Zoë"}) == '{"name":"Zoë"}'
+
+
+def test_default_response_class_renders_with_orjson():
+    response = JSONResponse({"results": [{"resume_id": np.int64(4), "overall_score": 0.75}]})
+    assert response.body == b'{"results":[{"resume_id":4,"overall_score":0.75}]}'
+    assert response.media_type == "application/json"
@@ -0,0 +1,115 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.models.db import Base, JobDescription, Resume
+from app.services.listing import (
+    LIST_DEFAULT_FIELDS,
+    decode_cursor,
+    get_row,
+    has_skills,
+    list_rows,
+    parse_fields,
+    parse_skills,
+)
+from app.services.skill_taxonomy import get_taxonomy
+
+
+async def with_resumes(func):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine) as db:
+        # Two pairs share a timestamp, so ordering has to fall back to the id
+        for i, day in enumerate([1, 1, 2, 3, 3], start=1):
+            skills = ["Python", "Docker"] if i % 2 else ["Python", "C++"]
+            db.add(Resume(
+                id=i, filename=f"r{i}.pdf", content="x" * 1000, parsed_data={"skills": skills},
+                skill_keys=get_taxonomy().skill_keys(skills), created_at=datetime(2024, 1, day),
+            ))
+        await db.commit()
+        result = await func(db)
+    await engine.dispose()
+    return result
+
+
+def test_keyset_pages_cover_every_row_once():
+    async def paginate(db):
+        fields = LIST_DEFAULT_FIELDS[Resume]
+        pages, cursor = [], None
+        while True:
+            page = await list_rows(db, Resume, fields, limit=2, cursor=cursor)
+            pages.append([item["id"] for item in page["items"]])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                return pages, page["items"][-1]
+
+    pages, last = asyncio.run(with_resumes(paginate))
+    assert pages == [[5, 4], [3, 2], [1]]
+    assert "content" not in last and "parsed_data" not in last
+    assert last["created_at"] == "2024-01-01T00:00:00"
+
+
+def test_projection_and_detail():
+    async def fetch(db):
+        fields = parse_fields(Resume, "filename,parsed_data")
+        return fields, await get_row(db, Resume, 2, fields), await get_row(db, Resume, 99, fields)
+
+    fields, item, missing = asyncio.run(with_resumes(fetch))
+    assert fields == ("id", "created_at", "filename", "parsed_data")
+    assert item["parsed_data"] == {"skills": ["Python", "C++"]}
+    assert missing is None
+
+
+def test_skill_filter_matches_every_requested_skill():
+    async def filtered(db):
+        fields = ("id", "created_at")
+        both = await list_rows(db, Resume, fields, limit=10, skills=parse_skills("python, Docker"))
+        cpp = await list_rows(db, Resume, fields, limit=1, skills=parse_skills("c++"))
+        return [item["id"] for item in both["items"]], cpp
+
+    both, cpp = asyncio.run(with_resumes(filtered))
+    assert both == [5, 3, 1]
+    assert [item["id"] for item in cpp["items"]] == [4]
+    assert cpp["next_cursor"] is not None
+
+
+def test_postgres_skill_filter_uses_jsonb_containment():
+    predicate = has_skills(Resume.skill_keys, ["docker", "python"], "postgresql")
+    assert "@>" in str(predicate.compile(dialect=postgresql.dialect()))
+
+
+def test_invalid_fields_and_cursor_are_rejected():
+    with pytest.raises(ValueError):
+        parse_fields(JobDescription, "title,hashed_password")
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_cursor_advances_over_default_timestamps():
+    async def paginate():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine) as db:
+            for i in range(1, 6):
+                db.add(Resume(id=i, filename=f"r{i}.pdf", content="x"))
+                await db.commit()
+            pages, cursor = [], None
+            while len(pages) < 5:
+                page = await list_rows(db, Resume, ("id", "created_at"), limit=2, cursor=cursor)
+                pages.append([item["id"] for item in page["items"]])
+                cursor = page["next_cursor"]
+                if cursor is None:
+                    break
+        await engine.dispose()
+        return pages
+
+    assert asyncio.run(paginate()) == [[5, 4], [3, 2], [1]]
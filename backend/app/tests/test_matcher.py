@@ -0,0 +1,95 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from difflib import SequenceMatcher
+
+import pytest
+from rapidfuzz import fuzz, process
+
+from app.services.matcher import (
+    fuzzy_skill_match,
+    fuzzy_skill_match_batch,
+    match_resume_to_job,
+    match_resumes_to_job,
+)
+from app.services.job_artifacts import build_job_artifacts, dump_job_artifacts, load_job_artifacts
+from app.services.similarity import get_similarity_backend
+
+
+def legacy_fuzzy_skill_match(resume_skills, job_skills, threshold=80):
+    matched_skills = set()
+    for r_skill in resume_skills:
+        best_match = process.extractOne(r_skill, job_skills, scorer=fuzz.token_sort_ratio)
+        if best_match and best_match[1] >= threshold:
+            matched_skills.add(best_match[0])
+    return matched_skills
+
+
+RESUMES = [
+    {"python", "fastapi", "docker", "amazon web services"},
+    {"javascript", "react.js", "node js", "css"},
+    {"sql", "postgres", "machine learnings"},
+    set(),
+]
+JOB_SKILLS = {"python", "docker", "aws", "react", "node.js", "postgresql", "machine learning", "sql"}
+
+
+def test_matches_legacy_semantics():
+    for resume_skills in RESUMES:
+        for threshold in (60, 80, 95):
+            assert fuzzy_skill_match(resume_skills, JOB_SKILLS, threshold) == (
+                legacy_fuzzy_skill_match(resume_skills, JOB_SKILLS, threshold)
+            )
+
+
+def test_batch_matches_single_calls():
+    batch = fuzzy_skill_match_batch(RESUMES, JOB_SKILLS, threshold=80, workers=2)
+    assert batch == [fuzzy_skill_match(r, JOB_SKILLS, 80) for r in RESUMES]
+
+
+def test_empty_job_skills():
+    assert fuzzy_skill_match_batch(RESUMES, set()) == [set()] * len(RESUMES)
+
+
+def test_match_resumes_to_job_matches_single_calls():
+    resumes = [
+        {"skills": ["Python", "Docker"], "experience": [{"bullets": ["Built APIs"]}]},
+        {"skills": ["React"], "experience": []},
+    ]
+    job = {"skills": ["Python", "React", "SQL"], "description": "Build APIs in Python"}
+    batch = match_resumes_to_job(resumes, job)
+    for resume, result in zip(resumes, batch):
+        single = match_resume_to_job(resume, job)
+        assert sorted(single.pop("matched_skills")) == sorted(result.pop("matched_skills"))
+        assert sorted(single.pop("missing_skills")) == sorted(result.pop("missing_skills"))
+        assert single == result
+
+
+def test_hashed_ngram_similarity():
+    backend = get_similarity_backend("hashed_ngram")
+    job = backend.vectorize("Build REST APIs in Python and deploy them with Docker")
+    assert backend.score(backend.vectorize("build rest apis in python"), job) > (
+        backend.score(backend.vectorize("designed marketing campaigns"), job)
+    )
+    assert backend.score(job, job) == pytest.approx(1.0)
+    assert backend.score(backend.vectorize(""), job) == 0.0
+
+
+def test_sequence_backend_matches_difflib():
+    backend = get_similarity_backend("sequence")
+    expected = SequenceMatcher(None, "developed apis", "develop apis").ratio()
+    assert backend.score(backend.vectorize("Developed APIs"), backend.vectorize("develop APIs")) == expected
+
+
+def test_artifacts_round_trip_and_match_like_raw_job():
+    job = {"skills": ["Python", "Node JS", "SQL"], "description": "Python APIs with Node js and SQL"}
+    artifacts = load_job_artifacts(dump_job_artifacts(build_job_artifacts(job)))
+    assert artifacts.is_current
+    assert artifacts.skills == ("node js", "python", "sql")
+
+    resume = {"skills": ["js node", "python"], "experience": [{"bullets": ["Python APIs"]}]}
+    from_raw = match_resume_to_job(resume, job)
+    from_artifacts = match_resume_to_job(resume, artifacts=artifacts)
+    assert sorted(from_raw["matched_skills"]) == sorted(from_artifacts["matched_skills"]) == ["node js", "python"]
+    assert from_raw["overall_score"] == from_artifacts["overall_score"]
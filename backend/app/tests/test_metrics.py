@@ -0,0 +1,90 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import asyncio
+import json
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import metrics
+from app.services.logging_setup import JsonFormatter
+from app.services.metrics import STAGE_ERRORS, STAGE_LATENCY, Registry, stage_timer, timed
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = Registry()
+    histogram = registry.histogram("latency_seconds", "Latency.", ("stage",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, stage="parse")
+    histogram.observe(0.5, stage="parse")
+    histogram.observe(5, stage="parse")
+    registry.counter("errors_total", "Errors.", ("stage",)).inc(stage="parse")
+
+    lines = registry.render().splitlines()
+    assert "# TYPE latency_seconds histogram" in lines
+    assert 'latency_seconds_bucket{stage="parse",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{stage="parse",le="1"} 2' in lines
+    assert 'latency_seconds_bucket{stage="parse",le="+Inf"} 3' in lines
+    assert 'latency_seconds_count{stage="parse"} 3' in lines
+    assert 'errors_total{stage="parse"} 1' in lines
+
+    with pytest.raises(ValueError):
+        registry.counter("errors_total", "Errors.")
+
+
+def test_stage_timer_records_latency_and_errors():
+    with stage_timer("test_ok"):
+        pass
+    with pytest.raises(RuntimeError):
+        with stage_timer("test_failing"):
+            raise RuntimeError("boom")
+
+    @timed("test_async")
+    async def work():
+        return 42
+
+    assert asyncio.run(work()) == 42
+    assert STAGE_LATENCY.count(stage="test_ok") == 1
+    assert STAGE_LATENCY.count(stage="test_failing") == 1
+    assert STAGE_ERRORS.value(stage="test_failing") == 1
+    assert STAGE_ERRORS.value(stage="test_ok") == 0
+    assert STAGE_LATENCY.count(stage="test_async") == 1
+
+
+def test_disabled_metrics_record_nothing(monkeypatch):
+    monkeypatch.setattr(metrics, "METRICS_ENABLED", False)
+    with stage_timer("test_disabled"):
+        pass
+    STAGE_ERRORS.inc(stage="test_disabled")
+    assert STAGE_LATENCY.count(stage="test_disabled") == 0
+    assert STAGE_ERRORS.value(stage="test_disabled") == 0
+
+
+def test_metrics_endpoint_reports_route_templates():
+    client = TestClient(app)
+    assert client.get("/health").status_code == 200
+    client.get("/resumes/jobs/does-not-exist")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'http_request_duration_seconds_count{method="GET",route="/health",status="200"}' in body
+    # Labelled by template, so ids in the path do not create new series
+    assert 'route="/resumes/jobs/{job_id}",status="404"' in body
+    assert "worker_pool_pending_jobs " in body
+    assert "resume_queue_depth " in body
+
+
+def test_json_formatter_includes_extras():
+    record = logging.LogRecord("app.test", logging.INFO, __file__, 1, "Stored %s", ("resume",), None)
+    record.resume_id = 7
+    record.path = object()
+    entry = json.loads(JsonFormatter().format(record))
+    assert entry["message"] == "Stored resume"
+    assert entry["level"] == "INFO"
+    assert entry["resume_id"] == 7
+    assert isinstance(entry["path"], str)
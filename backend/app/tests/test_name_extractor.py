@@ -0,0 +1,61 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import pytest
+
+from app.services import name_extractor
+from app.services.name_extractor import NAME_EXTRACTIONS, NO_NAME, extract_name, heuristic_name, resolve_name
+
+
+def test_heuristic_finds_name_in_header():
+    assert heuristic_name("John Doe\njohn.doe@example.com\n+1 234-567-8900")[0] == "John Doe"
+    assert heuristic_name("\n\nCURRICULUM VITAE\nPriya Sharma\nSoftware Engineer")[0] == "Priya Sharma"
+    assert heuristic_name("Maria Garcia | Data Analyst | Madrid")[0] == "Maria Garcia"
+    assert heuristic_name("Name: José Müller-Schmidt")[0] == "José Müller-Schmidt"
+    assert heuristic_name("Ludwig van Beethoven\nComposer")[0] == "Ludwig van Beethoven"
+
+
+def test_heuristic_rejects_non_name_lines():
+    assert heuristic_name("Senior Software Engineer\nSummary\njane@example.com\nBerlin 10115") == (None, 0.0)
+
+
+def test_confidence_rewards_known_first_names_near_the_top():
+    _, known = heuristic_name("Wei Zhang\nBackend Developer")
+    _, unknown = heuristic_name("Software Engineer\nBerlin, Germany\nZed Quarnby")
+    assert known >= name_extractor.NAME_MIN_CONFIDENCE > unknown
+
+
+def test_auto_mode_falls_back_to_ner_only_when_unsure(monkeypatch):
+    calls = []
+
+    def fake_ner(text):
+        calls.append(text)
+        return "Zed Quarnby"
+
+    monkeypatch.setattr(name_extractor, "ner_name", fake_ner)
+    assert resolve_name("John Doe\njohn@example.com", "auto") == ("John Doe", "heuristic")
+    assert calls == []
+    assert resolve_name("Software Engineer\nBerlin, Germany\nZed Quarnby", "auto") == ("Zed Quarnby", "ner")
+    assert len(calls) == 1
+    assert resolve_name("Software Engineer\nZed Quarnby", "heuristic") == ("Zed Quarnby", "heuristic")
+    assert len(calls) == 1
+
+
+def test_auto_mode_survives_missing_ner_model(monkeypatch):
+    def missing_model(text):
+        raise OSError("[E050] Can't find model 'en_core_web_sm'")
+
+    monkeypatch.setattr(name_extractor, "ner_name", missing_model)
+    assert resolve_name("Software Engineer\nBerlin, Germany\nZed Quarnby", "auto") == ("Zed Quarnby", "heuristic")
+    assert resolve_name("Summary\nBuilt things", "auto") == (NO_NAME, "heuristic")
+    with pytest.raises(OSError):
+        resolve_name("Zed Quarnby", "ner")
+
+
+def test_extract_name_counts_paths_and_validates_mode():
+    before = NAME_EXTRACTIONS.value(method="heuristic")
+    assert extract_name("Aisha Khan\naisha@example.com", "heuristic") == "Aisha Khan"
+    assert NAME_EXTRACTIONS.value(method="heuristic") == before + 1
+    with pytest.raises(ValueError):
+        extract_name("Aisha Khan", "spacy")
@@ -0,0 +1,83 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import io
+
+from pdfminer.high_level import extract_text
+
+from app.services.resume_parser import (
+    extract_text_from_stream,
+    iter_pdf_pages,
+    required_sections_complete,
+)
+
+
+def make_pdf(pages):
+    """Minimal multi-page PDF with one Helvetica text line per entry."""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for lines in pages:
+        ops = ["BT /F1 11 Tf 14 TL 72 760 Td"]
+        for line in lines:
+            escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            ops.append(f"({escaped}) Tj T*")
+        ops.append("ET")
+        stream = "\n".join(ops).encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % k for k in kids), len(kids)
+    )
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+RESUME_PAGES = [
+    ["John Doe", "john.doe@example.com", "Skills", "Python, FastAPI, SQL"],
+    ["Work Experience", "Software Engineer | CompanyX | Berlin", "- Developed REST APIs"],
+    ["Education", "BSc Computer Science"],
+    ["Hobbies", "Chess"],
+    ["Appendix", "More pages nobody reads"],
+]
+
+
+def test_pages_match_extract_text():
+    data = make_pdf(RESUME_PAGES)
+    streamed = "".join(iter_pdf_pages(io.BytesIO(data)))
+    assert streamed == extract_text(io.BytesIO(data))
+
+
+def test_stops_once_required_sections_are_complete():
+    data = make_pdf(RESUME_PAGES)
+    text = extract_text_from_stream(io.BytesIO(data), max_pages=0, early_stop=True)
+    assert "Education" in text
+    assert "Hobbies" not in text
+
+
+def test_page_cap():
+    data = make_pdf(RESUME_PAGES)
+    text = extract_text_from_stream(io.BytesIO(data), max_pages=1, early_stop=False)
+    assert "John Doe" in text
+    assert "Work Experience" not in text
+
+
+def test_required_sections_complete():
+    assert not required_sections_complete("Skills\nPython\nExperience\nDev at X\n")
+    assert required_sections_complete("Skills\nPython\nExperience\nDev at X\nEducation\n")
@@ -0,0 +1,79 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.models.db import Base
+from app.services import resume_pipeline
+from app.services.resume_cache import ResumeCache, hash_content
+from app.services.resume_pipeline import UploadItem, process_resume
+from app.services.skill_index import SkillIndex
+
+
+def test_hash_content_is_sha256():
+    assert hash_content(b"resume") == (
+        "a83a31320d921b888a48fa5edd0b4b5a29984de6e96bf7b8ac7d29ba06caf616"
+    )
+
+
+def test_lru_evicts_least_recently_used():
+    cache = ResumeCache(max_size=2)
+    cache.put("a", {"id": 1})
+    cache.put("b", {"id": 2})
+    assert cache.get("a") == {"id": 1}
+    cache.put("c", {"id": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"id": 1}
+    assert cache.get("c") == {"id": 3}
+    assert len(cache) == 2
+
+
+def test_memory_hit_is_counted():
+    cache = ResumeCache(max_size=4)
+    cache.put("abc", {"id": 7})
+
+    # A memory hit never touches the database session
+    entry = asyncio.run(cache.lookup(None, "abc"))
+
+    assert entry == {"id": 7}
+    stats = cache.stats()
+    assert stats["memory_hits"] == 1
+    assert stats["misses"] == 0
+    assert stats["hit_ratio"] == 1.0
+
+
+def test_name_extractor_override_bypasses_cache(monkeypatch):
+    parses = []
+
+    async def fake_parse_and_store(item, wait=False, on_stage=None, **kwargs):
+        parses.append(item.name_extractor)
+        return "text", {"name": item.name_extractor or "default", "skills": []}, "url", "path"
+
+    async def no_index(items):
+        pass
+
+    monkeypatch.setattr(resume_pipeline, "parse_and_store", fake_parse_and_store)
+    monkeypatch.setattr(resume_pipeline, "_index_vectors", no_index)
+    monkeypatch.setattr(resume_pipeline, "resume_cache", ResumeCache())
+    monkeypatch.setattr(resume_pipeline, "skill_index", SkillIndex())
+
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        results = []
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            for mode in (None, None, "heuristic", None):
+                result = await process_resume(db, UploadItem("r.pdf", b"%PDF same bytes", "application/pdf", mode))
+                results.append((result["cached"], result["analysis"]["name"]))
+        await engine.dispose()
+        return results
+
+    assert asyncio.run(run()) == [
+        (False, "default"), (True, "default"), (False, "heuristic"), (True, "default"),
+    ]
+    assert parses == [None, "heuristic"]
@@ -2,9 +2,15 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
 
+import io
+import zipfile
 
+import pytest
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
+from app.api import routes
 from app.main import app
+from app.services.resume_pipeline import UploadItem
 
 
 client = TestClient(app)
@@ -24,3 +30,45 @@ def test_upload_resume_invalid_file():
     response = client.post("/upload-resume/", files={"file": ("empty.pdf", b"")})
     assert response.status_code == 400
     assert response.json()["detail"] == "Invalid PDF file format."
+
+
+def test_upload_resume_rejects_unknown_name_extractor():
+    response = client.post(
+        "/upload-resume/", params={"name_extractor": "spacy"}, files={"file": ("resume.pdf", b"%PDF-1.4")}
+    )
+    assert response.status_code == 422
+
+
+def _zip_of(entries: dict, compression=zipfile.ZIP_DEFLATED) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression) as zf:
+        for name, data in entries.items():
+            zf.writestr(name, data)
+    return buffer.getvalue()
+
+
+def test_bulk_zip_limits_checked_before_decompressing(monkeypatch):
+    def no_read(*args, **kwargs):
+        raise AssertionError("entry decompressed before the limits were checked")
+
+    monkeypatch.setattr(zipfile.ZipFile, "read", no_read)
+    archive = UploadItem("batch.zip", _zip_of({f"{i}.pdf": b"\0" * 100_000 for i in range(5)}), "application/zip")
+    with pytest.raises(HTTPException) as files_error:
+        routes._expand_zip(archive, max_files=4, max_bytes=10**9)
+    with pytest.raises(HTTPException) as bytes_error:
+        routes._expand_zip(archive, max_files=10, max_bytes=400_000)
+    assert files_error.value.status_code == bytes_error.value.status_code == 413
+
+    monkeypatch.setattr(routes, "BULK_MAX_TOTAL_BYTES", 400_000)
+    response = client.post("/resumes/bulk", files=[("files", ("batch.zip", archive.contents, "application/zip"))])
+    assert response.status_code == 413
+
+
+def test_bulk_zip_with_corrupt_entry_is_a_client_error():
+    contents = b"%PDF-1.4 resume"
+    data = bytearray(_zip_of({"good.pdf": contents, "bad.pdf": contents}, zipfile.ZIP_STORED))
+    # Stored uncompressed: flip a byte of the second entry's data so its CRC check fails
+    data[data.rindex(contents) + 5] ^= 0xFF
+    response = client.post("/resumes/bulk", files=[("files", ("batch.zip", bytes(data), "application/zip"))])
+    assert response.status_code == 400
+    assert "bad.pdf" in response.json()["detail"]
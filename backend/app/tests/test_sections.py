@@ -0,0 +1,79 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from app.services.resume_parser import extract_education, extract_resume_fields, extract_skills
+from app.services.sections import normalize_dashes, segment_sections, split_sections
+
+resume_text = """Jane Roe
+jane@example.com
+
+Skills:
+Python, FastAPI,
+Docker | Kubernetes
+
+Work Experience
+Backend Engineer | Acme | Remote
+Jan 2021 – Present
+- Built APIs
+
+\fEducation
+Bachelor of Science in Computer Science
+University of Example, Berlin
+Sep 2016 - Jul 2020
+
+Skills
+Ignored, Second, Copy
+"""
+
+
+def test_segment_sections_maps_each_section_to_its_body():
+    sections = split_sections(resume_text)
+    assert set(sections) == {"skills", "experience", "education"}
+    assert sections["skills"].split() == ["Python,", "FastAPI,", "Docker", "|", "Kubernetes"]
+    assert sections["experience"].strip().startswith("Backend Engineer")
+    assert "Education" not in sections["experience"]
+
+
+def test_first_occurrence_of_a_section_wins():
+    start, end = segment_sections(resume_text)["skills"]
+    assert start < resume_text.index("Work Experience")
+
+
+def test_headers_must_be_whole_lines():
+    sections = split_sections("Skills\nExperience with Python is required, Go\nEducation\nBSc")
+    assert "experience" not in sections
+    assert "Experience with Python" in sections["skills"]
+
+
+def test_normalize_dashes_keeps_offsets():
+    text = "Jan 2021 – Present — now"
+    assert normalize_dashes(text) == "Jan 2021 - Present - now"
+    assert len(normalize_dashes(text)) == len(text)
+
+
+def test_skills_stop_at_work_experience_header():
+    assert extract_skills(resume_text) == ["Python", "FastAPI", "Docker", "Kubernetes"]
+
+
+def test_extract_resume_fields_uses_section_slices():
+    fields = extract_resume_fields(resume_text)
+    assert fields["email"] == "jane@example.com"
+    assert fields["skills"] == ["Python", "FastAPI", "Docker", "Kubernetes"]
+    assert fields["experience"] == [
+        {
+            "title": "Backend Engineer",
+            "company": "Acme",
+            "location": "Remote",
+            "dates": "Jan 2021 - Present",
+            "bullets": ["Built APIs"],
+        }
+    ]
+
+
+def test_extract_education_reads_only_its_section():
+    [education] = extract_education(resume_text)
+    assert education["degree"] == "Bachelor of Science in Computer Science"
+    assert education["university"] == "University of Example"
+    assert education["location"] == "Berlin"
+    assert education["end_date"] == "Jul"  # findall returns the month group
@@ -0,0 +1,49 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import asyncio
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.models.db import Base, JobDescription
+from app.models.session import engine_options
+
+
+def test_postgres_profile_pools_and_caches_statements():
+    options = engine_options("postgresql+asyncpg://user:pw@db.example.com/app")
+    assert options["pool_pre_ping"] is True
+    assert options["pool_size"] > 0 and options["pool_recycle"] > 0
+    assert options["connect_args"]["prepared_statement_cache_size"] > 0
+    assert "ssl" in options["connect_args"]
+
+
+def test_sqlite_profile_has_no_pool_or_ssl_arguments():
+    options = engine_options("sqlite+aiosqlite:///:memory:")
+    assert "connect_args" not in options
+    assert "pool_size" not in options
+
+
+def test_insert_returns_server_defaults_without_refresh():
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        statements = []
+        event.listen(
+            engine.sync_engine, "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            job = JobDescription(title="Engineer", content="Build things")
+            session.add(job)
+            await session.commit()
+        await engine.dispose()
+        return job, statements
+
+    job, statements = asyncio.run(run())
+    assert job.id is not None
+    assert job.created_at is not None
+    assert len(statements) == 1 and "RETURNING" in statements[0]
@@ -0,0 +1,51 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import random
+
+import numpy as np
+
+from app.services import skill_index as skill_index_module
+from app.services.skill_bitset import (
+    decode_skill_ids,
+    encode_skill_ids,
+    overlap_counts,
+    popcount64,
+    skill_vector_to_words,
+    skill_vector_words,
+)
+from app.services.skill_index import SkillIndex
+from app.services.skill_taxonomy import get_taxonomy
+
+
+def test_vector_round_trips():
+    ids = [0, 5, 63, 64, len(get_taxonomy()) - 1]
+    vector = encode_skill_ids(ids)
+    assert decode_skill_ids(vector) == ids
+    assert len(skill_vector_to_words(vector)) == skill_vector_words()
+    assert decode_skill_ids(int(skill_vector_to_words(vector)[1])) == [0]
+
+
+def test_popcount_and_overlap_match_set_intersection():
+    rng = random.Random(7)
+    n_skills = len(get_taxonomy())
+    resumes = [rng.sample(range(n_skills), rng.randint(0, 40)) for _ in range(200)]
+    job = rng.sample(range(n_skills), 12)
+    matrix = np.stack([skill_vector_to_words(encode_skill_ids(ids)) for ids in resumes])
+
+    assert popcount64(matrix).sum(axis=1).tolist() == [len(ids) for ids in resumes]
+    counts = overlap_counts(matrix, skill_vector_to_words(encode_skill_ids(job)))
+    assert counts.tolist() == [len(set(ids) & set(job)) for ids in resumes]
+
+
+def test_index_scans_either_bitsets_or_postings(monkeypatch):
+    index = SkillIndex()
+    index.add(1, {"skills": ["AWS", "Python", "Rustacean"], "experience": []})
+    index.add(2, {"skills": ["amazon web services"], "experience": []})
+    index.add(1, {"skills": ["aws", "python", "rustacean"], "experience": []})
+    job = ["Amazon Web Services (AWS)", "python", "rustacean"]
+
+    for cost in (0.0, 1e9):
+        monkeypatch.setattr(skill_index_module, "BITSET_SCAN_COST", cost)
+        assert index.candidates(job, limit=10) == [(1, 3), (2, 1)]
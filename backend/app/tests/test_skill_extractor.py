@@ -0,0 +1,44 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from app.services.job_description_analyzer import analyze_job_description
+from app.services.resume_parser import extract_resume_fields
+from app.services.skill_extractor import SkillExtractor, extract_known_skills
+from app.services.skill_taxonomy import get_taxonomy
+
+
+def test_matches_respect_word_boundaries():
+    skills = extract_known_skills("JavaScript, C++ and ASP.NET Core; node.js. Python3 is not Python")
+    assert "JavaScript" in skills
+    assert "Java" not in skills
+    assert "C++" in skills
+    assert "C" not in skills
+    assert {"ASP.NET", "ASP.NET CORE", "Node.js", "Python"} <= set(skills)
+
+
+def test_overlapping_and_multi_word_patterns():
+    extractor = SkillExtractor({"apache spark": "Apache Spark", "spark": "Spark", "machine learning": "ML"})
+    assert extractor.find("Apache\n  Spark and machine learning") == [
+        (0, 2, "Apache Spark"),
+        (1, 2, "Spark"),
+        (3, 5, "ML"),
+    ]
+
+
+def test_aliases_report_the_canonical_skill():
+    assert extract_known_skills("googlesheets and datascience") == ["Data Science", "Google Sheets"]
+
+
+def test_job_analyzer_uses_the_automaton():
+    job = analyze_job_description(
+        "Data Engineer\nAbout the job\nWe use Python, PowerBI, Docker and AWS.\n3+ years of experience"
+    )
+    assert job["skills"] == ["amazon web services (aws)", "docker", "power bi", "python"]
+    assert job["skill_ids"] == sorted(get_taxonomy().lookup(s) for s in ("aws", "docker", "powerbi", "python"))
+    assert job["experience"] == "3+ years of experience"
+
+
+def test_resume_without_skills_section_falls_back_to_dictionary():
+    fields = extract_resume_fields("Jane Roe\nBuilt services in Go and PostgreSQL on Kubernetes.")
+    assert {"Go", "PostgreSQL", "Kubernetes"} <= set(fields["skills"])
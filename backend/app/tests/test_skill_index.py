@@ -0,0 +1,53 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from app.services.job_artifacts import build_job_artifacts
+from app.services.skill_index import SkillIndex, normalize_skill
+
+
+def make_index():
+    index = SkillIndex()
+    index.add(1, {"skills": ["Python", "Docker"], "experience": []})
+    index.add(2, {"skills": ["python", "SQL", "Docker", "AWS"], "experience": []})
+    index.add(3, {"skills": ["Java"], "experience": []})
+    return index
+
+
+def test_normalize_skill():
+    assert normalize_skill("  Machine   Learning ") == "machine learning"
+
+
+def test_candidates_ordered_by_overlap():
+    index = make_index()
+    candidates = index.candidates(["Python", "sql", "Docker"], limit=10)
+    assert candidates == [(2, 3), (1, 2)]
+
+
+def test_readding_a_resume_replaces_it():
+    index = make_index()
+    index.add(3, {"skills": ["Python"], "experience": []})
+    assert len(index) == 3
+    assert index.candidates(["Java"], limit=10) == []
+    assert (3, 1) in index.candidates(["Python"], limit=10)
+
+
+def test_rank_returns_top_k_scored_matches():
+    index = make_index()
+    job = {"skills": ["python", "sql", "docker", "aws"], "description": ""}
+    results = index.rank(build_job_artifacts(job), k=1)
+    assert len(results) == 1
+    assert results[0]["resume_id"] == 2
+    assert results[0]["skill_match_score"] == 1.0
+
+
+def test_rank_scores_every_resume_when_too_few_overlap():
+    index = make_index()
+    unknown = build_job_artifacts({"skills": ["Rust"], "description": ""})
+    assert sorted(r["resume_id"] for r in index.rank(unknown, k=10)) == [1, 2, 3]
+    assert all(r["skill_overlap"] == 0 for r in index.rank(unknown, k=10))
+
+    java = build_job_artifacts({"skills": ["java"], "description": ""})
+    results = index.rank(java, k=2)
+    assert results[0]["resume_id"] == 3 and results[0]["skill_overlap"] == 1
+    assert len(results) == 2
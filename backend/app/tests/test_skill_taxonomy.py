@@ -0,0 +1,54 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import pytest
+
+import app.services.matcher as matcher
+from app.services.job_artifacts import build_job_artifacts
+from app.services.matcher import match_resume_to_job
+from app.services.resume_parser import extract_resume_fields
+from app.services.skill_taxonomy import SkillTaxonomy, get_taxonomy
+from app.services.skills_list import skills_list
+
+
+def test_every_listed_skill_resolves_to_its_own_id():
+    taxonomy = get_taxonomy()
+    assert [taxonomy.lookup(name) for name in skills_list] == list(range(len(skills_list)))
+    assert ".NET Entity Framework" in skills_list
+    assert not any(name.startswith(":") for name in skills_list)
+
+
+def test_aliases_resolve_to_canonical_ids():
+    taxonomy = get_taxonomy()
+    aws = taxonomy.lookup("Amazon Web Services (AWS)")
+    assert taxonomy.lookup("AWS") == taxonomy.lookup("amazon  web services") == aws
+    assert taxonomy.name(taxonomy.lookup("PowerBI")) == "Power BI"
+    assert taxonomy.category(aws) == "Cloud & Hosting"
+    assert taxonomy.lookup("Underwater Basket Weaving") is None
+
+
+def test_conflicting_aliases_are_rejected():
+    with pytest.raises(ValueError):
+        SkillTaxonomy([("Go", "Languages", ("golang",)), ("Golang Tools", "Tools", ("golang",))])
+
+
+def test_resume_parser_emits_skill_ids():
+    fields = extract_resume_fields("Jane Roe\n\nSkills\nAWS, Postgres, Basket Weaving\n")
+    taxonomy = get_taxonomy()
+    assert fields["skills"] == ["AWS", "Postgres", "Basket Weaving"]
+    assert fields["skill_ids"] == sorted([taxonomy.lookup("aws"), taxonomy.lookup("postgresql")])
+
+
+def test_matching_uses_ids_without_fuzzy_scoring(monkeypatch):
+    monkeypatch.setattr(matcher, "SKILL_FUZZY_FALLBACK", False)
+    artifacts = build_job_artifacts({"skills": ["Amazon Web Services (AWS)", "PostgreSQL", "Rust"]})
+    resume = {"skills": ["AWS"], "skill_ids": [get_taxonomy().lookup("postgres")], "experience": []}
+    result = match_resume_to_job(resume, artifacts=artifacts)
+    assert sorted(result["matched_skills"]) == ["amazon web services (aws)", "postgresql"]
+    assert result["missing_skills"] == ["rust"]
+
+
+def test_unresolved_skills_fall_back_to_fuzzy_matching():
+    result = match_resume_to_job({"skills": ["js node", "Kubernetes"]}, {"skills": ["Node JS", "k8s", "Go lang"]})
+    assert sorted(result["matched_skills"]) == ["k8s", "node js"]
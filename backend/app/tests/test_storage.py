@@ -0,0 +1,97 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import asyncio
+
+import httpx
+import pytest
+
+import app.services.resume_pipeline as resume_pipeline
+from app.services.resume_pipeline import ResumeProcessingError, UploadItem, parse_and_store
+from app.services.storage import LocalStorage, StorageError, SupabaseStorage
+
+
+def test_local_storage_round_trip(tmp_path):
+    storage = LocalStorage(str(tmp_path))
+
+    async def main():
+        url = await storage.upload("abc_resume.pdf", b"%PDF", "application/pdf")
+        stored = tmp_path / "resumes" / "abc_resume.pdf"
+        assert url == stored.as_uri()
+        assert stored.read_bytes() == b"%PDF"
+        await storage.delete("abc_resume.pdf")
+        assert not stored.exists()
+
+    asyncio.run(main())
+
+
+def test_local_storage_rejects_escaping_paths(tmp_path):
+    with pytest.raises(StorageError):
+        asyncio.run(LocalStorage(str(tmp_path)).upload("../outside.pdf", b"x"))
+
+
+def test_supabase_storage_retries_transient_failures():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) < 3:
+            return httpx.Response(503, text="busy")
+        return httpx.Response(200, json={"Key": "resumes/a b.pdf"})
+
+    storage = SupabaseStorage(
+        "http://supabase.test", "key", backoff=0, transport=httpx.MockTransport(handler)
+    )
+
+    async def main():
+        try:
+            return await storage.upload("a b.pdf", b"%PDF", "application/pdf")
+        finally:
+            await storage.close()
+
+    url = asyncio.run(main())
+    assert url == "http://supabase.test/storage/v1/object/public/resumes/a%20b.pdf"
+    assert len(calls) == 3
+    assert calls[-1].url.path == "/storage/v1/object/resumes/a b.pdf"
+    assert calls[-1].headers["authorization"] == "Bearer key"
+    assert calls[-1].headers["content-type"] == "application/pdf"
+
+
+def test_supabase_storage_does_not_retry_client_errors():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(400, json={"error": "Duplicate"})
+
+    storage = SupabaseStorage(
+        "http://supabase.test", "key", backoff=0, transport=httpx.MockTransport(handler)
+    )
+    with pytest.raises(StorageError):
+        asyncio.run(storage.upload("a.pdf", b"%PDF"))
+    assert len(calls) == 1
+
+
+def test_failed_parse_discards_eager_upload(monkeypatch, tmp_path):
+    storage = LocalStorage(str(tmp_path))
+    monkeypatch.setattr(resume_pipeline, "upload_resume_to_supabase", _local_upload(storage))
+    monkeypatch.setattr(resume_pipeline, "delete_resume_from_supabase", storage.delete)
+    monkeypatch.setattr(resume_pipeline, "STORAGE_UPLOAD_EAGER", True)
+
+    async def failing_parse(contents, wait=False, on_stage=None, name_extractor=None):
+        await asyncio.sleep(0.05)  # let the upload finish first
+        raise ResumeProcessingError(400, "Invalid PDF file format.")
+
+    monkeypatch.setattr(resume_pipeline, "parse_resume", failing_parse)
+
+    with pytest.raises(ResumeProcessingError):
+        asyncio.run(parse_and_store(UploadItem("bad.pdf", b"junk", "application/pdf")))
+    assert list((tmp_path / "resumes").iterdir()) == []
+
+
+def _local_upload(storage):
+    async def upload(contents, filename, content_type, object_path=None):
+        return await storage.upload(object_path, contents, content_type)
+
+    return upload
@@ -0,0 +1,91 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+from app.api.events import KEEPALIVE, stage_events
+from app.main import app
+from app.services.job_artifacts import build_job_artifacts
+from app.services.resume_pipeline import ResumeProcessingError
+from app.services.skill_index import SkillIndex
+
+client = TestClient(app)
+
+
+def parse_events(body: bytes) -> list:
+    events = []
+    for block in body.decode().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        if fields:
+            events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def collect(agen) -> list:
+    async def run():
+        return [chunk async for chunk in agen]
+
+    return asyncio.run(run())
+
+
+def test_stage_events_report_stages_then_result_or_error():
+    async def work(on_stage):
+        on_stage("extracted")
+        await asyncio.sleep(0.05)
+        on_stage("stored")
+        return {"id": 1}
+
+    chunks = collect(stage_events(work, {"extracted": 0.4, "stored": 1.0}, keepalive=0.01))
+    assert KEEPALIVE in chunks
+    assert parse_events(b"".join(chunks)) == [
+        ("stage", {"stage": "extracted", "progress": 0.4}),
+        ("stage", {"stage": "stored", "progress": 1.0}),
+        ("result", {"id": 1}),
+    ]
+
+    async def failing(on_stage):
+        raise ResumeProcessingError(400, "Invalid PDF file format.")
+
+    assert parse_events(b"".join(collect(stage_events(failing)))) == [
+        ("error", {"status_code": 400, "detail": "Invalid PDF file format."}),
+    ]
+
+
+def test_rank_iter_converges_to_rank():
+    index = SkillIndex()
+    for resume_id in range(1, 13):
+        skills = ["Python", "SQL", "Docker", "AWS", "Java"][: 1 + resume_id % 5]
+        index.add(resume_id, {"skills": skills, "experience": []})
+    artifacts = build_job_artifacts({"skills": ["python", "sql", "docker", "aws"], "description": ""})
+
+    steps = list(index.rank_iter(artifacts, k=3, chunk_size=4))
+    assert [(scored, total) for scored, total, _ in steps] == [(4, 12), (8, 12), (12, 12)]
+    assert all(len(top) == 3 for _, _, top in steps)
+    assert steps[-1][2] == index.rank(artifacts, k=3)
+    # No overlap anywhere: every resume is scored, as in a full scan
+    unknown = build_job_artifacts({"skills": ["Rust"], "description": ""})
+    assert list(index.rank_iter(unknown, k=3, chunk_size=100))[-1][:2] == (12, 12)
+
+
+def test_match_stream_sends_received_before_result():
+    data = {"resume": {"skills": ["Python"], "experience": []}, "job": {"skills": ["Python", "SQL"]}}
+    response = client.post("/match/stream", json=data)
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = parse_events(response.content)
+    assert events[0] == ("stage", {"stage": "received", "progress": 0.0})
+    assert events[1] == ("result", client.post("/match", json=data).json())
+
+    assert client.post("/match/stream", json={"resume": {}, "job": {}}).status_code == 422
+
+
+def test_upload_stream_reports_errors_as_events():
+    response = client.post("/upload-resume/stream", files={"file": ("empty.pdf", b"")})
+    assert response.status_code == 200
+    assert parse_events(response.content) == [
+        ("stage", {"stage": "received", "progress": 0.0}),
+        ("error", {"status_code": 400, "detail": "Invalid PDF file format."}),
+    ]
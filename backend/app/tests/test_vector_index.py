@@ -0,0 +1,80 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import asyncio
+import random
+
+import numpy as np
+
+from app.services import vector_index
+from app.services.vector_index import VectorIndex, embed_text
+
+TOPICS = [
+    "python django postgresql backend api services",
+    "react typescript css frontend design components",
+    "nurse patient care hospital clinical medication",
+    "accounting ledger audit tax financial reporting",
+]
+
+
+def make_docs(n, seed=0):
+    rng = random.Random(seed)
+    docs = []
+    for i in range(n):
+        words = TOPICS[i % len(TOPICS)].split()
+        docs.append((i + 1, " ".join(rng.choice(words) for _ in range(40))))
+    return docs
+
+
+def test_embedding_is_normalized_and_deterministic():
+    vector = embed_text("Senior Python developer, Python and SQL", dim=64)
+    assert vector.dtype == np.float32
+    assert np.isclose(np.linalg.norm(vector), 1.0)
+    assert np.array_equal(vector, embed_text("senior python developer python and sql", dim=64))
+    assert not embed_text("", dim=64).any()
+
+
+def test_exact_search_persists_and_replaces(tmp_path):
+    index = VectorIndex(str(tmp_path), dim=128, n_lists=4)
+    index.add_many(make_docs(8))
+    index.add(3, TOPICS[1])
+
+    reopened = VectorIndex(str(tmp_path), dim=128, n_lists=4)
+    assert len(reopened) == 8
+    results = reopened.search(TOPICS[1], k=3)
+    assert results[0][0] == 3
+    assert results[0][1] > 0.5
+    # Resume 3 was about TOPICS[2] before being replaced; only 7 still is
+    assert reopened.search(TOPICS[2], k=1)[0][0] == 7
+
+
+def test_ivf_search_after_training(tmp_path, monkeypatch):
+    monkeypatch.setattr(vector_index, "VECTOR_INDEX_TRAIN_SIZE", 100)
+    index = VectorIndex(str(tmp_path), dim=128, n_lists=4)
+    index.add_many(make_docs(200))
+    assert index.trained_count == 200
+
+    # Inserted after training: filed under its nearest centroid
+    index.add(1000, TOPICS[3] + " payroll")
+    reopened = VectorIndex(str(tmp_path), dim=128, n_lists=4)
+    results = reopened.search(TOPICS[3] + " payroll", k=5, probes=1)
+    assert results[0][0] == 1000
+    assert all(resume_id % 4 == 0 for resume_id, _ in results[1:])
+
+
+def test_insert_trains_in_the_background(tmp_path, monkeypatch):
+    monkeypatch.setattr(vector_index, "VECTOR_INDEX_TRAIN_SIZE", 100)
+    index = VectorIndex(str(tmp_path), dim=128, n_lists=4)
+
+    async def run():
+        await index.insert(make_docs(200))
+        # Not trained inline: search stays an exact scan until the task finishes
+        untrained = index.trained_count
+        await index._training
+        return untrained
+
+    assert asyncio.run(run()) == 0
+    assert index.trained_count == 200
+    assert not index.needs_training
+    assert index.search(TOPICS[0], k=1)[0][0] % 4 == 1
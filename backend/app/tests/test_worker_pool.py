@@ -0,0 +1,60 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+import asyncio
+import threading
+
+import pytest
+
+from app.services.worker_pool import WorkerPool, WorkerPoolSaturated
+
+
+def test_run_returns_result():
+    pool = WorkerPool(kind="thread", max_workers=2, max_pending=2)
+
+    async def main():
+        return await pool.run(sum, [1, 2, 3])
+
+    assert asyncio.run(main()) == 6
+    assert pool.pending == 0
+    pool.shutdown()
+
+
+def test_saturated_pool_rejects_new_work():
+    pool = WorkerPool(kind="thread", max_workers=1, max_pending=1)
+    release = threading.Event()
+
+    async def main():
+        blocked = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0)
+        with pytest.raises(WorkerPoolSaturated):
+            await pool.run(sum, [1])
+        release.set()
+        await blocked
+
+    asyncio.run(main())
+    pool.shutdown()
+
+
+def test_unknown_pool_kind():
+    with pytest.raises(ValueError):
+        WorkerPool(kind="fiber")
+
+
+def test_waiting_caller_gets_the_next_free_slot():
+    pool = WorkerPool(kind="thread", max_workers=1, max_pending=1)
+    release = threading.Event()
+
+    async def main():
+        blocked = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0)
+        queued = asyncio.ensure_future(pool.run(sum, [2, 3], wait=True))
+        await asyncio.sleep(0.01)
+        assert not queued.done()
+        release.set()
+        await blocked
+        return await queued
+
+    assert asyncio.run(main()) == 5
+    pool.shutdown()
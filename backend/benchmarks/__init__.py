@@ -0,0 +1 @@
+"""Benchmark suites, corpus generator and runner (python -m benchmarks.run)."""
@@ -0,0 +1,75 @@
+"""
+Microbenchmark: per-skill process.extractOne loop versus the cdist-based
+fuzzy_skill_match_batch in app.services.matcher, at 10/100/1000 skills.
+
+    cd backend && python benchmarks/bench_fuzzy_match.py [--workers -1]
+"""
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from rapidfuzz import fuzz, process
+
+from app.services.matcher import fuzzy_skill_match_batch
+from app.services.skills_list import skills_list
+
+
+def legacy_fuzzy_skill_match(resume_skills, job_skills, threshold=80):
+    # The implementation fuzzy_skill_match replaced, kept for comparison
+    matched_skills = set()
+    for r_skill in resume_skills:
+        best_match = process.extractOne(r_skill, job_skills, scorer=fuzz.token_sort_ratio)
+        if best_match and best_match[1] >= threshold:
+            matched_skills.add(best_match[0])
+    return matched_skills
+
+
+def perturb(skill, rng):
+    # Typos and suffixes so that not every pair is an exact hit
+    skill = skill.lower()
+    roll = rng.random()
+    if roll < 0.2 and len(skill) > 3:
+        i = rng.randrange(len(skill))
+        return skill[:i] + skill[i + 1:]
+    if roll < 0.3:
+        return skill + " development"
+    return skill
+
+
+def make_skills(n, rng):
+    return [perturb(rng.choice(skills_list), rng) + ("" if i < len(skills_list) else f" {i}") for i in range(n)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="fuzzy skill matching microbenchmark")
+    parser.add_argument("--workers", type=int, default=1, help="cdist workers (-1 = all cores)")
+    parser.add_argument("--resumes", type=int, default=20, help="resumes scored per batch")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    print(f"{'skills':>7} {'legacy ms':>11} {'cdist ms':>10} {'speedup':>8}")
+    for n in (10, 100, 1000):
+        job_skills = set(make_skills(n, rng))
+        resumes = [set(make_skills(n, rng)) for _ in range(args.resumes)]
+
+        legacy = [legacy_fuzzy_skill_match(r, job_skills) for r in resumes]
+        batched = fuzzy_skill_match_batch(resumes, job_skills, workers=args.workers)
+        assert legacy == batched, "cdist engine diverged from legacy semantics"
+
+        repeat = max(1, 200 // n)
+        legacy_s = timeit.timeit(
+            lambda: [legacy_fuzzy_skill_match(r, job_skills) for r in resumes], number=repeat
+        ) / repeat
+        cdist_s = timeit.timeit(
+            lambda: fuzzy_skill_match_batch(resumes, job_skills, workers=args.workers),
+            number=repeat,
+        ) / repeat
+        print(f"{n:>7} {legacy_s * 1000:>11.2f} {cdist_s * 1000:>10.2f} {legacy_s / cdist_s:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
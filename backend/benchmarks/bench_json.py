@@ -0,0 +1,72 @@
+"""
+Benchmark: stdlib json + FastAPI's default JSONResponse versus the orjson
+codec and response class, on payloads built from real parser output
+(extract_resume_fields over synthetic resumes): one parsed_data document
+per resume, and a bulk/ranking-sized response holding all of them.
+Reports encode/decode time and peak allocation (tracemalloc).
+
+    cd backend && python benchmarks/bench_json.py [--resumes 1000]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse as StdJSONResponse
+
+from app.api.responses import JSONResponse
+from app.services import json_codec
+from app.services.resume_parser import extract_resume_fields
+from bench_section_segmenter import make_resume
+
+
+def peak_kib(func):
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON serialization benchmark")
+    parser.add_argument("--resumes", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    documents = [{"name": f"Candidate {i}", **extract_resume_fields(make_resume(rng))} for i in range(args.resumes)]
+    response = {
+        "status": "success",
+        "results": [{"id": i, "status": "created", "analysis": doc} for i, doc in enumerate(documents)],
+    }
+    encoded_std = [json.dumps(doc) for doc in documents]
+    encoded_fast = [json_codec.dumps_str(doc) for doc in documents]
+    bullets = sum(len(entry["bullets"]) for doc in documents for entry in doc["experience"])
+    print(f"{len(documents)} parsed resumes, {bullets} experience bullets, "
+          f"response {len(json.dumps(response)) / 1024:.0f} KiB")
+
+    cases = [
+        ("parsed_data encode", lambda: [json.dumps(d) for d in documents],
+         lambda: [json_codec.dumps_str(d) for d in documents]),
+        ("parsed_data decode", lambda: [json.loads(s) for s in encoded_std],
+         lambda: [json_codec.loads(s) for s in encoded_fast]),
+        ("response render", lambda: StdJSONResponse(jsonable_encoder(response)),
+         lambda: JSONResponse(response)),
+    ]
+    print(f"  {'':<20} {'stdlib':>10} {'orjson':>10} {'speedup':>8} {'peak KiB':>18}")
+    for label, std, fast in cases:
+        t_std = min(timeit.repeat(std, number=1, repeat=args.repeat))
+        t_fast = min(timeit.repeat(fast, number=1, repeat=args.repeat))
+        print(f"  {label:<20} {t_std * 1000:8.1f}ms {t_fast * 1000:8.1f}ms {t_std / t_fast:7.1f}x "
+              f"{peak_kib(std):8.0f} -> {peak_kib(fast):6.0f}")
+
+
+if __name__ == "__main__":
+    main()
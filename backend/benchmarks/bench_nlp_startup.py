@@ -0,0 +1,85 @@
+"""
+Cold-start time and peak RSS of the old eager spaCy loading versus the shared,
+lazily-loaded NLP registry in app.services.nlp.
+
+Each approach runs in a fresh interpreter so module caches and the allocator
+state of one run do not leak into the other.
+
+    cd backend && python benchmarks/bench_nlp_startup.py [--runs 3]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+HEADER = "John Doe\njohn.doe@example.com\n+1 234-567-8900\n\nSkills"
+JOB_TEXT = "We are looking for a Python developer with Docker, SQL and AWS experience."
+
+# Mirrors the pre-registry code: nlp.py and job_description_analyzer.py each
+# called spacy.load() at import time and ran the full pipeline on every doc.
+EAGER = """
+import spacy
+from spacy.matcher import PhraseMatcher
+from app.services.skills_list import skills_list
+
+resume_nlp = spacy.load("en_core_web_sm")
+job_nlp = spacy.load("en_core_web_sm")
+matcher = PhraseMatcher(job_nlp.vocab, attr="LOWER")
+matcher.add("SKILLS", [job_nlp.make_doc(s) for s in skills_list if s.strip()])
+
+list(resume_nlp(HEADER).ents)
+matcher(job_nlp(JOB_TEXT.lower()))
+"""
+
+REGISTRY = """
+from app.services.nlp import get_ner_pipeline
+from app.services.job_description_analyzer import analyze_job_description
+
+list(get_ner_pipeline()(HEADER).ents)
+analyze_job_description(JOB_TEXT)
+"""
+
+CHILD = """
+import json, resource, sys, time
+start = time.perf_counter()
+HEADER = {header!r}
+JOB_TEXT = {job!r}
+exec({body!r})
+elapsed = time.perf_counter() - start
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"seconds": elapsed, "max_rss_mb": rss_kb / 1024}}))
+"""
+
+
+def run_once(body):
+    code = CHILD.format(header=HEADER, job=JOB_TEXT, body=body)
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR,
+        env={**os.environ, "PYTHONPATH": BACKEND_DIR},
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'approach':<10} {'startup s (median)':>20} {'peak RSS MB (median)':>22}")
+    for name, body in (("eager", EAGER), ("registry", REGISTRY)):
+        samples = [run_once(body) for _ in range(args.runs)]
+        seconds = statistics.median(s["seconds"] for s in samples)
+        rss = statistics.median(s["max_rss_mb"] for s in samples)
+        print(f"{name:<10} {seconds:>20.3f} {rss:>22.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Benchmark: resume field extraction with the per-extractor lookahead regexes
+versus the single-pass section segmenter, over a corpus of synthetic resumes.
+End-to-end analyze_resume_text is timed too when the spaCy NER model loads.
+
+    cd backend && python benchmarks/bench_section_segmenter.py [--resumes 500]
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.services.resume_parser import (
+    analyze_resume_text,
+    extract_email,
+    extract_name,
+    extract_phone,
+    extract_resume_fields,
+    parse_experience_section,
+    parse_skills_section,
+)
+from app.services.skills_list import skills_list
+
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+FILLER = (
+    "Collaborated with cross-functional teams to deliver features on schedule and "
+    "improved reliability of production services through monitoring and testing"
+).split()
+
+
+def legacy_section(text, header, stops):
+    # The per-extractor lookup the segmenter replaced: dash normalization plus
+    # a lookahead regex over the whole text, once per extractor
+    text = re.sub(r"[–—−‐]", "-", text)
+    match = re.search(
+        rf"(?is)(?:^|\n)(?:{header})\s*\n(.*?)(?=\n(?:{stops})\b|\Z)",
+        text,
+        re.M,
+    )
+    return match.group(1) if match else None
+
+
+def legacy_extract_resume_fields(text):
+    skills = legacy_section(
+        text,
+        "skills",
+        "certifications|education|experience|projects|summary|contact|languages|profile"
+        "|additional information|additional",
+    )
+    experience = legacy_section(
+        text,
+        "work experience|experience|professional experience",
+        "certifications|education|skills|projects|summary|contact|languages|profile"
+        "|additional information|additional",
+    )
+    return {
+        "email": extract_email(text),
+        "phone": extract_phone(text),
+        "skills": parse_skills_section(skills),
+        "experience": parse_experience_section(experience),
+    }
+
+
+def sentence(rng, words):
+    return " ".join(rng.choice(FILLER) for _ in range(words)).capitalize()
+
+
+def make_resume(rng):
+    lines = [
+        f"Candidate {rng.randrange(10_000)}",
+        f"candidate{rng.randrange(10_000)}@example.com",
+        f"+1 {rng.randrange(200, 999)}-{rng.randrange(200, 999)}-{rng.randrange(1000, 9999)}",
+        "",
+        "Summary",
+        sentence(rng, rng.randint(30, 80)),
+        "",
+        "Skills",
+        ", ".join(rng.sample(skills_list, rng.randint(8, 30))),
+        "",
+        "Work Experience",
+    ]
+    for _ in range(rng.randint(2, 6)):
+        start = rng.randint(2005, 2020)
+        dash = rng.choice(["-", "–", "—"])
+        lines.append(f"Software Engineer | Company {rng.randrange(100)} | Remote")
+        lines.append(f"{rng.choice(MONTHS)} {start} {dash} {rng.choice(MONTHS)} {start + rng.randint(1, 4)}")
+        lines.extend(f"- {sentence(rng, rng.randint(8, 20))}" for _ in range(rng.randint(2, 6)))
+    lines += [
+        "",
+        "Projects",
+        *(f"- {sentence(rng, 15)}" for _ in range(rng.randint(1, 5))),
+        "",
+        "Education",
+        "Bachelor of Science in Computer Science",
+        "University of Example, Berlin",
+        f"Sep {rng.randint(2000, 2015)} - Jul {rng.randint(2016, 2020)}",
+    ]
+    return "\n".join(lines)
+
+
+def ner_available():
+    try:
+        extract_name("Jane Roe")
+        return True
+    except OSError:
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="section segmenter benchmark")
+    parser.add_argument("--resumes", type=int, default=500, help="synthetic resumes in the corpus")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    corpus = [make_resume(rng) for _ in range(args.resumes)]
+
+    def run(func):
+        return min(timeit.repeat(lambda: [func(t) for t in corpus], number=1, repeat=args.repeat))
+
+    legacy = run(legacy_extract_resume_fields)
+    segmented = run(extract_resume_fields)
+    print(f"corpus: {len(corpus)} resumes, {sum(map(len, corpus)) / len(corpus):.0f} chars avg")
+    print(f"{'fields (no NER)':<20} legacy {legacy * 1000:8.1f} ms   segmented {segmented * 1000:8.1f} ms"
+          f"   speedup {legacy / segmented:.2f}x")
+
+    if not ner_available():
+        print("spaCy NER model not installed; skipping end-to-end analyze_resume_text")
+        return
+
+    def legacy_analyze(text):
+        return {"name": extract_name(text), **legacy_extract_resume_fields(text)}
+
+    legacy = run(legacy_analyze)
+    segmented = run(analyze_resume_text)
+    print(f"{'analyze_resume_text':<20} legacy {legacy * 1000:8.1f} ms   segmented {segmented * 1000:8.1f} ms"
+          f"   speedup {legacy / segmented:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark: skill-overlap scoring of one job against every indexed resume.
+Compares posting-list `np.bincount` with AND + popcount over the contiguous
+bitset matrix (the two strategies SkillIndex.candidates picks between) for a
+job made of common skills and one made of rare skills, with skill popularity
+Zipf-distributed; then per-pair Python set intersection vs int popcount.
+
+    cd backend && python benchmarks/bench_skill_bitset.py [--resumes 1000000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import numpy as np
+
+from app.services.skill_bitset import encode_skill_ids, overlap_counts, skill_vector_to_words, skill_vector_words
+from app.services.skill_taxonomy import get_taxonomy
+
+
+def best_of(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="skill bitset benchmark")
+    parser.add_argument("--resumes", type=int, default=1_000_000)
+    parser.add_argument("--pairs", type=int, default=200_000, help="resumes for the per-pair comparison")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    n_skills = len(get_taxonomy())
+    words = skill_vector_words()
+    weights = [1 / (rank + 1) for rank in range(n_skills)]
+    resumes = []
+    for _ in range(args.resumes):
+        skill_ids = set(rng.choices(range(n_skills), weights=weights, k=rng.randint(5, 30)))
+        resumes.append(sorted(skill_ids))
+    jobs = {
+        "common skills": list(range(15)),
+        "rare skills": rng.sample(range(n_skills // 2, n_skills), 15),
+    }
+
+    matrix = np.zeros((len(resumes), words), dtype=np.uint64)
+    postings = {}
+    for row, skill_ids in enumerate(resumes):
+        matrix[row] = skill_vector_to_words(encode_skill_ids(skill_ids), words)
+        for skill_id in skill_ids:
+            postings.setdefault(skill_id, []).append(row)
+    posting_arrays = {skill_id: np.asarray(rows, dtype=np.int64) for skill_id, rows in postings.items()}
+
+    print(f"{len(resumes)} resumes x 1 job, {n_skills} skills ({words} words per vector)")
+    for name, job in jobs.items():
+        job_words = skill_vector_to_words(encode_skill_ids(job), words)
+
+        def bincount():
+            hits = [posting_arrays[s] for s in job if s in posting_arrays]
+            return np.bincount(np.concatenate(hits), minlength=len(resumes))
+
+        t_postings, by_postings = best_of(bincount, args.repeat)
+        t_matrix, by_matrix = best_of(lambda: overlap_counts(matrix, job_words), args.repeat)
+        assert np.array_equal(by_postings, by_matrix)
+
+        entries = sum(len(posting_arrays.get(s, ())) for s in job)
+        print(f"  {name}: {entries} posting entries, {np.count_nonzero(job_words)} matrix words per row")
+        for label, seconds in (("postings bincount", t_postings), ("bitset AND+popcount", t_matrix)):
+            print(f"    {label:<22} {seconds * 1000:8.1f} ms  {len(resumes) / seconds / 1e6:8.1f} M pairs/s")
+
+    sample = resumes[: args.pairs]
+    sets = [set(skill_ids) for skill_ids in sample]
+    ints = [encode_skill_ids(skill_ids) for skill_ids in sample]
+    job = jobs["common skills"]
+    job_set, job_int = set(job), encode_skill_ids(job)
+    t_sets, by_sets = best_of(lambda: [len(s & job_set) for s in sets], args.repeat)
+    t_ints, by_ints = best_of(lambda: [(v & job_int).bit_count() for v in ints], args.repeat)
+    assert by_sets == by_ints
+
+    print(f"{len(sample)} pairs, one at a time")
+    for label, seconds in (("set intersection", t_sets), ("int AND+bit_count", t_ints)):
+        print(f"  {label:<22} {seconds * 1000:8.1f} ms  {len(sample) / seconds / 1e6:8.1f} M pairs/s")
+
+
+if __name__ == "__main__":
+    main()
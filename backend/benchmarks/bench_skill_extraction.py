@@ -0,0 +1,89 @@
+"""
+Benchmark: job-description skill extraction with the spaCy PhraseMatcher plus
+the four extra regex scans it replaced, versus the shared Aho-Corasick
+automaton in app.services.skill_extractor. Also times the whole
+analyze_job_description (what /analyze-job/ runs on the worker pool).
+
+    cd backend && python benchmarks/bench_skill_extraction.py [--jobs 200]
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import spacy
+from spacy.matcher import PhraseMatcher
+
+from app.services.job_description_analyzer import analyze_job_description
+from app.services.skill_extractor import extract_known_skills, get_skill_extractor
+from app.services.skills_list import skills_list
+
+FILLER = (
+    "we are looking for an engineer with strong experience building scalable services "
+    "you will collaborate with product and design to ship reliable features"
+).split()
+
+LEGACY_PATTERNS = [
+    r"\b(excel|sql|python|pandas|matplotlib|power\s*bi|tableau|google\s*sheets)\b",
+    r"\b(java|javascript|react|node\.js|html|css|docker|kubernetes)\b",
+    r"\b(aws|azure|google\s*cloud|firebase|mongodb|postgresql|mysql)\b",
+    r"\b(data\s*analytics|data\s*science|machine\s*learning|ai|ml)\b",
+]
+
+
+def build_legacy():
+    nlp = spacy.blank("en")
+    matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+    matcher.add("SKILLS", [nlp.make_doc(skill) for skill in skills_list if skill.strip()])
+
+    def extract(text):
+        doc = nlp.make_doc(text.lower())
+        skills = {doc[start:end].text.lower() for _, start, end in matcher(doc)}
+        for pattern in LEGACY_PATTERNS:
+            skills.update(m.group(1) for m in re.finditer(pattern, text.lower()))
+        return sorted(skills)
+
+    return extract
+
+
+def make_job(rng):
+    words = [
+        rng.choice(skills_list) if rng.random() < 0.08 else rng.choice(FILLER)
+        for _ in range(rng.randint(200, 900))
+    ]
+    lines = ["Senior Software Engineer", "About the job"]
+    lines += [" ".join(words[i:i + 14]) for i in range(0, len(words), 14)]
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="skill extraction benchmark")
+    parser.add_argument("--jobs", type=int, default=200, help="synthetic job descriptions")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    corpus = [make_job(rng) for _ in range(args.jobs)]
+
+    def timed(label, func):
+        func(corpus[0])  # build automata / matchers outside the timing
+        seconds = min(timeit.repeat(lambda: [func(t) for t in corpus], number=1, repeat=args.repeat))
+        print(f"{label:<32} {seconds * 1000 / len(corpus):8.3f} ms/job")
+        return seconds
+
+    build = timeit.timeit(get_skill_extractor, number=1)
+    print(f"corpus: {len(corpus)} jobs, {sum(map(len, corpus)) / len(corpus):.0f} chars avg; "
+          f"automaton built in {build * 1000:.1f} ms, {len(get_skill_extractor())} states")
+
+    legacy = timed("PhraseMatcher + regex", build_legacy())
+    automaton = timed("Aho-Corasick", extract_known_skills)
+    print(f"{'skill extraction speedup':<32} {legacy / automaton:8.2f}x")
+    timed("analyze_job_description", analyze_job_description)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Deterministic synthetic corpus for the benchmarks: resumes and job
+descriptions in three sizes, as plain text and as minimal text-layer PDFs.
+The same seed always yields the same documents, so results from different
+commits are comparable.
+"""
+import io
+import random
+from dataclasses import dataclass
+from functools import cached_property
+
+from app.services.skills_list import skills_list
+
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+FIRST_NAMES = ["Maria", "James", "Aisha", "Wei", "Carlos", "Priya", "Lukas", "Fatima", "Noah", "Yuki"]
+LAST_NAMES = ["Garcia", "Smith", "Khan", "Zhang", "Silva", "Patel", "Muller", "Haddad", "Brown", "Tanaka"]
+ROLES = ["Software Engineer", "Data Analyst", "Backend Developer", "Data Scientist", "Frontend Developer"]
+RESUME_FILLER = (
+    "collaborated with cross-functional teams to deliver features on schedule and "
+    "improved reliability of production services through monitoring and testing"
+).split()
+JOB_FILLER = (
+    "we are looking for an engineer with strong experience building scalable services "
+    "you will collaborate with product and design to ship reliable features"
+).split()
+
+# Per size: (skills, experience entries, bullets per entry, projects) for
+# resumes, and body words for job descriptions
+RESUME_SIZES = {"small": (6, 1, 2, 1), "medium": (15, 3, 4, 3), "large": (40, 8, 8, 8)}
+JOB_SIZES = {"small": 120, "medium": 400, "large": 1500}
+SIZES = tuple(RESUME_SIZES)
+
+PDF_LINES_PER_PAGE = 48
+
+
+@dataclass
+class Document:
+    name: str
+    size: str
+    text: str
+    pdf: bytes = None
+
+
+def _sentence(rng: random.Random, words: int, filler=RESUME_FILLER) -> str:
+    return " ".join(rng.choice(filler) for _ in range(words)).capitalize()
+
+
+def make_resume_text(rng: random.Random, size: str = "medium") -> str:
+    skills, entries, bullets, projects = RESUME_SIZES[size]
+    lines = [
+        f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+        f"candidate{rng.randrange(10_000)}@example.com",
+        f"+1 {rng.randrange(200, 999)}-{rng.randrange(200, 999)}-{rng.randrange(1000, 9999)}",
+        "",
+        "Summary",
+        _sentence(rng, rng.randint(20, 40)),
+        "",
+        "Skills",
+        ", ".join(rng.sample(skills_list, skills)),
+        "",
+        "Work Experience",
+    ]
+    for _ in range(entries):
+        start = rng.randint(2005, 2020)
+        lines.append(f"{rng.choice(ROLES)} | Company {rng.randrange(100)} | Remote")
+        lines.append(f"{rng.choice(MONTHS)} {start} - {rng.choice(MONTHS)} {start + rng.randint(1, 4)}")
+        lines.extend(f"- {_sentence(rng, rng.randint(8, 20))}" for _ in range(bullets))
+    lines += [
+        "",
+        "Projects",
+        *(f"- {_sentence(rng, 15)}" for _ in range(projects)),
+        "",
+        "Education",
+        "Bachelor of Science in Computer Science",
+        "University of Example, Berlin",
+        f"Sep {rng.randint(2000, 2015)} - Jul {rng.randint(2016, 2020)}",
+    ]
+    return "\n".join(lines)
+
+
+def make_job_text(rng: random.Random, size: str = "medium") -> str:
+    words = [
+        rng.choice(skills_list) if rng.random() < 0.08 else rng.choice(JOB_FILLER)
+        for _ in range(JOB_SIZES[size])
+    ]
+    lines = ["About the job", rng.choice(ROLES), f"{rng.randint(1, 8)}+ years of experience with Python and SQL"]
+    lines += [" ".join(words[i:i + 14]) for i in range(0, len(words), 14)]
+    lines += ["Key Responsibilities", *(f"- {_sentence(rng, 10, JOB_FILLER)}" for _ in range(5))]
+    lines += ["Education", "Bachelor degree in Computer Science or a related field"]
+    return "\n".join(lines)
+
+
+def make_pdf(text: str, lines_per_page: int = PDF_LINES_PER_PAGE) -> bytes:
+    """Minimal PDF with one Helvetica text line per line of `text`."""
+    lines = text.split("\n")
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for page in pages:
+        ops = ["BT /F1 10 Tf 14 TL 54 760 Td"]
+        for line in page:
+            escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            ops.append(f"({escaped}) Tj T*")
+        ops.append("ET")
+        stream = "\n".join(ops).encode("latin-1", "replace")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(b"%d 0 R" % k for k in kids), len(kids))
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    out.writelines(b"%010d 00000 n \n" % offset for offset in offsets)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+def resume_corpus(count: int, seed: int = 42, sizes: tuple = SIZES, pdf: bool = False) -> list:
+    """`count` resumes cycling through `sizes`, optionally rendered to PDF."""
+    rng = random.Random(seed)
+    documents = []
+    for i in range(count):
+        size = sizes[i % len(sizes)]
+        text = make_resume_text(rng, size)
+        documents.append(Document(f"resume_{i:05d}_{size}.pdf", size, text, make_pdf(text) if pdf else None))
+    return documents
+
+
+def job_corpus(count: int, seed: int = 7, sizes: tuple = SIZES) -> list:
+    rng = random.Random(seed)
+    documents = []
+    for i in range(count):
+        size = sizes[i % len(sizes)]
+        documents.append(Document(f"job_{i:04d}_{size}", size, make_job_text(rng, size)))
+    return documents
+
+
+class Corpus:
+    """The documents every suite shares, built on first use and reused for the whole run."""
+
+    def __init__(self, resumes: int = 30, jobs: int = 6, seed: int = 42):
+        self.resume_count = resumes
+        self.job_count = jobs
+        self.seed = seed
+
+    @cached_property
+    def resumes(self) -> list:
+        return resume_corpus(self.resume_count, self.seed, pdf=True)
+
+    @cached_property
+    def jobs(self) -> list:
+        return job_corpus(self.job_count, self.seed + 1)
+
+    def resumes_of_size(self, size: str) -> list:
+        return [document for document in self.resumes if document.size == size]
+
+    def jobs_of_size(self, size: str) -> list:
+        return [document for document in self.jobs if document.size == size]
+
+    @cached_property
+    def parsed_resumes(self) -> list:
+        from app.services.resume_parser import extract_resume_fields
+
+        return [extract_resume_fields(document.text) for document in self.resumes]
+
+    @cached_property
+    def parsed_jobs(self) -> list:
+        from app.services.job_description_analyzer import analyze_job_description
+
+        return [analyze_job_description(document.text) for document in self.jobs]
@@ -0,0 +1,84 @@
+"""
+Accuracy and cost of each NAME_EXTRACTOR mode against a labelled set: how
+often the heuristic fast path answered without NER, how often the returned
+name matched the label, and the mean time per resume.
+
+The bundled set (benchmarks/data/name_headers.jsonl, one {"text", "name"}
+object per line) is small and hand-written; pass --labels with headers from
+real resumes for numbers worth acting on. --synthetic adds corpus resumes,
+whose first line is the name. "ner" and the NER fallback of "auto" need the
+spaCy model; without it "ner" is skipped and "auto" keeps the heuristic guess.
+
+    cd backend && python benchmarks/eval_name_extractor.py [--labels FILE] [--synthetic 200] [--misses]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app.services.name_extractor import NAME_EXTRACTOR_MODES, NAME_MIN_CONFIDENCE, heuristic_name, resolve_name
+from benchmarks.corpus import resume_corpus
+
+DEFAULT_LABELS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "name_headers.jsonl")
+
+
+def load_labels(path: str) -> list:
+    with open(path, encoding="utf-8") as f:
+        entries = [json.loads(line) for line in f if line.strip()]
+    return [(entry["text"], entry["name"]) for entry in entries]
+
+
+def normalize(name: str) -> str:
+    return " ".join((name or "").split()).casefold()
+
+
+def evaluate(samples: list, mode: str) -> dict:
+    correct = fast = 0
+    misses = []
+    start = time.perf_counter()
+    for text, expected in samples:
+        name, method = resolve_name(text, mode)
+        fast += method == "heuristic"
+        if normalize(name) == normalize(expected):
+            correct += 1
+        else:
+            misses.append((expected, name))
+    elapsed = time.perf_counter() - start
+    return {
+        "accuracy": correct / len(samples),
+        "fast_path": fast / len(samples),
+        "mean_us": elapsed / len(samples) * 1e6,
+        "misses": misses,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Name extractor accuracy per mode")
+    parser.add_argument("--labels", default=DEFAULT_LABELS)
+    parser.add_argument("--synthetic", type=int, default=0, help="add this many generated resumes")
+    parser.add_argument("--misses", action="store_true", help="list every wrong answer")
+    args = parser.parse_args()
+
+    samples = load_labels(args.labels)
+    samples += [(doc.text, doc.text.split("\n", 1)[0]) for doc in resume_corpus(args.synthetic, seed=99)]
+    confident = sum(heuristic_name(text)[1] >= NAME_MIN_CONFIDENCE for text, _ in samples)
+    print(f"{len(samples)} labelled resumes; the heuristic is confident (>= {NAME_MIN_CONFIDENCE}) "
+          f"on {confident / len(samples):.1%}, the rest go to NER in auto mode")
+    print(f"{'mode':<10} {'accuracy':>9} {'fast path':>10} {'mean':>12}")
+    for mode in NAME_EXTRACTOR_MODES:
+        try:
+            result = evaluate(samples, mode)
+        except OSError as e:
+            print(f"{mode:<10} skipped: spaCy NER model not available ({e})")
+            continue
+        print(f"{mode:<10} {result['accuracy']:>9.1%} {result['fast_path']:>10.1%} {result['mean_us']:>9.0f} us")
+        if args.misses:
+            for expected, name in result["misses"]:
+                print(f"    expected {expected!r}, got {name!r}")
+
+
+if __name__ == "__main__":
+    main()
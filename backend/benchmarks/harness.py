@@ -0,0 +1,209 @@
+"""
+A small stand-in for pytest-benchmark. Suites are `bench_*(benchmark, corpus)`
+functions in `suite_*.py` modules; `benchmark(func, *args)` times `func`
+(calibrated iterations per round, several rounds) and returns its result.
+Results are saved in pytest-benchmark's JSON layout, so either tool can read
+them, and `compare()` diffs two result files by median.
+"""
+import datetime
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from app.services import json_codec
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+class Skip(Exception):
+    """Raised by a suite whose prerequisites (e.g. the spaCy NER model) are missing."""
+
+
+def parametrize(name: str, values):
+    """Run the decorated suite once per value, passed as keyword `name`."""
+
+    def decorate(func):
+        func.params = (name, tuple(values))
+        return func
+
+    return decorate
+
+
+class Benchmark:
+    def __init__(self, name: str, group: str, params: dict = None, min_rounds: int = 5,
+                 max_time: float = 1.0, min_round_time: float = 0.01):
+        self.name = name
+        self.group = group
+        self.params = params or {}
+        self.min_rounds = min_rounds
+        self.max_time = max_time
+        self.min_round_time = min_round_time
+        self.extra_info = {}
+        self.samples = None
+        self.iterations = 1
+
+    def __call__(self, func, *args, **kwargs):
+        result = func(*args, **kwargs)  # warm-up, and the value handed back to the suite
+        # Enough iterations per round to be well above timer resolution
+        iterations = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(iterations):
+                func(*args, **kwargs)
+            elapsed = time.perf_counter() - start
+            if elapsed >= self.min_round_time or iterations >= 1 << 20:
+                break
+            iterations *= max(2, min(10, math.ceil(self.min_round_time / max(elapsed, 1e-9))))
+
+        samples = [elapsed / iterations]
+        deadline = time.perf_counter() + self.max_time
+        while len(samples) < self.min_rounds or time.perf_counter() < deadline:
+            start = time.perf_counter()
+            for _ in range(iterations):
+                func(*args, **kwargs)
+            samples.append((time.perf_counter() - start) / iterations)
+            if len(samples) >= 1000:
+                break
+        self.record(samples, iterations)
+        return result
+
+    def record(self, samples: list, iterations: int = 1, **extra_info):
+        """Store externally measured per-call timings (seconds), e.g. request latencies."""
+        self.samples = list(samples)
+        self.iterations = iterations
+        self.extra_info.update(extra_info)
+
+    @property
+    def fullname(self) -> str:
+        if not self.params:
+            return self.name
+        return f"{self.name}[{'-'.join(str(value) for value in self.params.values())}]"
+
+    def stats(self) -> dict:
+        samples = sorted(self.samples)
+        quartiles = statistics.quantiles(samples, n=4) if len(samples) > 1 else [samples[0]] * 3
+        mean = statistics.fmean(samples)
+        return {
+            "min": samples[0],
+            "max": samples[-1],
+            "mean": mean,
+            "stddev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+            "median": statistics.median(samples),
+            "iqr": quartiles[2] - quartiles[0],
+            "q1": quartiles[0],
+            "q3": quartiles[2],
+            "rounds": len(samples),
+            "iterations": self.iterations,
+            "ops": 1 / mean if mean else 0.0,
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "group": self.group,
+            "name": self.fullname,
+            "fullname": f"{self.group}::{self.fullname}",
+            "params": self.params or None,
+            "stats": self.stats(),
+            "extra_info": self.extra_info,
+        }
+
+
+def _git(*args) -> str:
+    try:
+        return subprocess.run(["git", *args], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def commit_info() -> dict:
+    return {
+        "id": _git("rev-parse", "HEAD"),
+        "branch": _git("rev-parse", "--abbrev-ref", "HEAD"),
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+    }
+
+
+def machine_info() -> dict:
+    return {
+        "node": platform.node(),
+        "processor": platform.processor(),
+        "machine": platform.machine(),
+        "python_implementation": platform.python_implementation(),
+        "python_version": platform.python_version(),
+        "release": platform.release(),
+        "system": platform.system(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def build_report(benchmarks: list) -> dict:
+    return {
+        "machine_info": machine_info(),
+        "commit_info": commit_info(),
+        "benchmarks": [benchmark.to_dict() for benchmark in benchmarks],
+        "datetime": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "version": "resume-analyzer-benchmarks/1",
+    }
+
+
+def saved_results(directory: str = RESULTS_DIR) -> list:
+    """Saved result files, oldest first (names start with a counter)."""
+    if not os.path.isdir(directory):
+        return []
+    return [os.path.join(directory, name) for name in sorted(os.listdir(directory)) if name.endswith(".json")]
+
+
+def save_report(report: dict, path: str = None, directory: str = RESULTS_DIR) -> str:
+    """Write `report` to `path`, or to NNNN_<commit>.json in the results directory."""
+    if path is None:
+        os.makedirs(directory, exist_ok=True)
+        commit = report["commit_info"]["id"][:8] or "nocommit"
+        if report["commit_info"]["dirty"]:
+            commit += "_dirty"
+        path = os.path.join(directory, f"{len(saved_results(directory)) + 1:04d}_{commit}.json")
+    with open(path, "wb") as f:
+        f.write(json_codec.dumps(report))
+    return path
+
+
+def load_report(path: str) -> dict:
+    with open(path, "rb") as f:
+        return json_codec.loads(f.read())
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.10) -> list:
+    """
+    (fullname, baseline median, current median, relative change, regressed)
+    for every benchmark present in both reports. A benchmark regressed when
+    its median grew by more than `threshold`.
+    """
+    previous = {entry["fullname"]: entry["stats"]["median"] for entry in baseline["benchmarks"]}
+    rows = []
+    for entry in current["benchmarks"]:
+        before = previous.get(entry["fullname"])
+        if before is None:
+            continue
+        after = entry["stats"]["median"]
+        change = after / before - 1 if before else 0.0
+        rows.append((entry["fullname"], before, after, change, change > threshold))
+    return rows
+
+
+def format_seconds(value: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if value >= scale:
+            return f"{value / scale:8.2f} {unit}"
+    return f"{value / 1e-9:8.0f} ns"
+
+
+def print_results(benchmarks: list, out=sys.stdout):
+    width = max((len(f"{b.group}::{b.fullname}") for b in benchmarks), default=10)
+    print(f"{'benchmark':<{width}}  {'min':>11}  {'median':>11}  {'mean':>11}  {'rounds':>6}", file=out)
+    for benchmark in benchmarks:
+        stats = benchmark.stats()
+        print(f"{benchmark.group + '::' + benchmark.fullname:<{width}}  {format_seconds(stats['min'])}  "
+              f"{format_seconds(stats['median'])}  {format_seconds(stats['mean'])}  {stats['rounds']:>6}", file=out)
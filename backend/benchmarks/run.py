@@ -0,0 +1,139 @@
+"""
+Run the benchmark suites (benchmarks/suite_*.py), print a summary and save
+the results as JSON under benchmarks/results/ (NNNN_<commit>.json), so runs
+from different commits can be compared.
+
+    cd backend && python -m benchmarks.run [-k match] [--quick] [--compare [FILE]]
+
+--compare without a file diffs against the most recent saved run. With
+--fail-on-regression the exit status is 1 when any median grew by more than
+--threshold (default 10%). By default the HTTP scenario runs against a
+temporary SQLite database with local file storage; set DATABASE_URL (and
+STORAGE_BACKEND) to point it elsewhere. Without the spaCy NER model,
+NAME_EXTRACTOR defaults to "heuristic" so uploads still work.
+"""
+import argparse
+import importlib
+import inspect
+import os
+import pkgutil
+import sys
+import tempfile
+import traceback
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+
+def _ner_model_installed() -> bool:
+    import spacy
+
+    from app.services.nlp import SPACY_MODEL
+
+    return spacy.util.is_package(SPACY_MODEL) or os.path.isdir(SPACY_MODEL)
+
+
+def configure_environment(directory: str, quick: bool):
+    # Must happen before app.models.session creates the engine
+    os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{directory}/bench.db")
+    os.environ.setdefault("STORAGE_BACKEND", "local")
+    os.environ.setdefault("STORAGE_LOCAL_DIR", os.path.join(directory, "storage"))
+    os.environ.setdefault("VECTOR_INDEX_DIR", os.path.join(directory, "vector_index"))
+    os.environ.setdefault("SUPABASE_URL", "http://localhost")
+    os.environ.setdefault("SUPABASE_KEY", "bench")
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    if "NAME_EXTRACTOR" not in os.environ and not _ner_model_installed():
+        # The default "ner" mode would fail every upload in the HTTP scenario
+        print("spaCy NER model not installed; running with NAME_EXTRACTOR=heuristic")
+        os.environ["NAME_EXTRACTOR"] = "heuristic"
+    if quick:
+        os.environ.setdefault("BENCH_HTTP_REQUESTS", "40")
+        os.environ.setdefault("BENCH_HTTP_RESUMES", "20")
+
+
+def collect(keyword: str = None) -> list:
+    """(group, suite function, params) for every suite matching `keyword`, in definition order."""
+    import benchmarks
+
+    suites = []
+    for module_info in pkgutil.iter_modules(benchmarks.__path__):
+        if not module_info.name.startswith("suite_"):
+            continue
+        group = module_info.name[len("suite_"):]
+        module = importlib.import_module(f"benchmarks.{module_info.name}")
+        for name, func in vars(module).items():
+            if not name.startswith("bench_") or not inspect.isfunction(func):
+                continue
+            param_name, values = getattr(func, "params", (None, (None,)))
+            for value in values:
+                params = {param_name: value} if param_name else {}
+                label = f"{group}::{name}[{value}]" if params else f"{group}::{name}"
+                if keyword and keyword.lower() not in label.lower():
+                    continue
+                suites.append((group, func, params))
+    return suites
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Parsing and matching pipeline benchmarks")
+    parser.add_argument("-k", dest="keyword", help="only run benchmarks whose name contains this")
+    parser.add_argument("--quick", action="store_true", help="fewer rounds and requests (smoke run)")
+    parser.add_argument("--resumes", type=int, default=30, help="resumes in the shared corpus")
+    parser.add_argument("--jobs", type=int, default=6, help="job descriptions in the shared corpus")
+    parser.add_argument("--output", help="write results here instead of benchmarks/results/")
+    parser.add_argument("--no-save", action="store_true")
+    parser.add_argument("--compare", nargs="?", const="last", help="results file to diff against (default: last)")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        configure_environment(directory, args.quick)
+        from benchmarks import harness
+        from benchmarks.corpus import Corpus
+
+        baseline_path = args.compare
+        if baseline_path == "last":
+            saved = harness.saved_results()
+            baseline_path = saved[-1] if saved else None
+            if baseline_path is None:
+                print("No saved results to compare against.")
+
+        corpus = Corpus(resumes=args.resumes, jobs=args.jobs)
+        timing = {"min_rounds": 3, "max_time": 0.2} if args.quick else {}
+        results = []
+        for group, func, params in collect(args.keyword):
+            benchmark = harness.Benchmark(func.__name__, group, params, **timing)
+            try:
+                func(benchmark, corpus, **params)
+            except harness.Skip as e:
+                print(f"SKIP {group}::{benchmark.fullname}: {e}")
+                continue
+            except Exception:
+                print(f"FAIL {group}::{benchmark.fullname}")
+                traceback.print_exc()
+                continue
+            results.append(benchmark)
+
+        from app.services.worker_pool import worker_pool
+
+        worker_pool.shutdown(wait=True)
+
+    harness.print_results(results)
+    report = harness.build_report(results)
+    if not args.no_save:
+        print(f"\nSaved {harness.save_report(report, args.output)}")
+
+    if not baseline_path:
+        return 0
+    rows = harness.compare(harness.load_report(baseline_path), report, args.threshold)
+    print(f"\nCompared with {baseline_path} (median, regression threshold {args.threshold:.0%}):")
+    for name, before, after, change, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(f"  {name:<60} {harness.format_seconds(before)} -> {harness.format_seconds(after)}  "
+              f"{change:+7.1%}{flag}")
+    regressions = sum(regressed for *_, regressed in rows)
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
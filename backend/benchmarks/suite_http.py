@@ -0,0 +1,121 @@
+"""
+End-to-end load scenario through the ASGI app (httpx.ASGITransport, no
+network): resume uploads, job analysis, stored matches, ranking and listing
+against the database and storage the runner configured (a temporary SQLite
+file and local storage by default). Each route's latencies become one result.
+"""
+import asyncio
+import os
+import random
+import time
+
+from benchmarks.corpus import job_corpus, resume_corpus
+from benchmarks.harness import parametrize
+
+BENCH_HTTP_REQUESTS = int(os.getenv("BENCH_HTTP_REQUESTS", "200"))
+BENCH_HTTP_CONCURRENCY = int(os.getenv("BENCH_HTTP_CONCURRENCY", "8"))
+BENCH_HTTP_RESUMES = int(os.getenv("BENCH_HTTP_RESUMES", "60"))
+
+ROUTES = (
+    "POST /upload-resume/",
+    "POST /analyze-job/",
+    "GET /match/{resume_id}/{job_id}",
+    "GET /jobs/{job_id}/rank",
+    "GET /resumes",
+)
+
+_state = {"resume_ids": [], "job_ids": [], "uploads": 0}
+
+
+def _percentile(samples: list, q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def _upload(client, document):
+    files = {"file": (document.name, document.pdf, "application/pdf")}
+    return await client.post("/upload-resume/", files=files)
+
+
+async def _seed(client, corpus):
+    """Jobs and resumes, both through the API."""
+    if _state["job_ids"]:
+        return
+    for document in corpus.jobs:
+        response = await client.post("/analyze-job/", json={"description": document.text})
+        response.raise_for_status()
+        _state["job_ids"].append(response.json()["id"])
+
+    for document in resume_corpus(BENCH_HTTP_RESUMES, seed=1000, pdf=True):
+        response = await _upload(client, document)
+        response.raise_for_status()
+        _state["resume_ids"].append(response.json()["id"])
+
+
+def _requests(route: str, rng: random.Random):
+    """Request factories for `route`; uploads use fresh documents so none hit the resume cache."""
+    if route == "POST /upload-resume/":
+        documents = resume_corpus(BENCH_HTTP_REQUESTS + 1, seed=2000 + _state["uploads"], pdf=True)
+        _state["uploads"] += 1
+        return [lambda c, d=document: _upload(c, d) for document in documents]
+    if route == "POST /analyze-job/":
+        documents = job_corpus(BENCH_HTTP_REQUESTS + 1, seed=3000)
+        return [lambda c, d=document: c.post("/analyze-job/", json={"description": d.text}) for document in documents]
+    if route == "GET /match/{resume_id}/{job_id}":
+        return [
+            lambda c, r=rng.choice(_state["resume_ids"]), j=rng.choice(_state["job_ids"]): c.get(f"/match/{r}/{j}")
+            for _ in range(BENCH_HTTP_REQUESTS + 1)
+        ]
+    if route == "GET /jobs/{job_id}/rank":
+        return [
+            lambda c, j=rng.choice(_state["job_ids"]): c.get(f"/jobs/{j}/rank", params={"k": 10})
+            for _ in range(BENCH_HTTP_REQUESTS + 1)
+        ]
+    return [lambda c: c.get("/resumes", params={"limit": 50}) for _ in range(BENCH_HTTP_REQUESTS + 1)]
+
+
+async def _run_route(route: str, corpus) -> tuple:
+    import httpx
+
+    from app.main import app
+    from app.models.session import engine, init_db
+
+    await init_db()
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            await _seed(client, corpus)
+            slots = asyncio.Semaphore(BENCH_HTTP_CONCURRENCY)
+
+            async def timed(send):
+                async with slots:
+                    start = time.perf_counter()
+                    response = await send(client)
+                    elapsed = time.perf_counter() - start
+                # 503 is the worker pool shedding load, expected at high concurrency
+                if response.status_code >= 500 and response.status_code != 503:
+                    raise RuntimeError(f"{route}: {response.status_code} {response.text[:200]}")
+                return elapsed, response.status_code == 503
+
+            warmup, *requests = _requests(route, random.Random(1))
+            await timed(warmup)  # index loads, caches, first-use compilation
+            start = time.perf_counter()
+            results = await asyncio.gather(*(timed(send) for send in requests))
+            wall = time.perf_counter() - start
+    finally:
+        # ASGITransport does not run shutdown hooks, and the pool is bound to this loop
+        await engine.dispose()
+    return [elapsed for elapsed, _ in results], sum(shed for _, shed in results), wall
+
+
+@parametrize("route", ROUTES)
+def bench_http(benchmark, corpus, route):
+    samples, shed, wall = asyncio.run(_run_route(route, corpus))
+    benchmark.record(
+        samples,
+        p50=_percentile(samples, 0.5),
+        p99=_percentile(samples, 0.99),
+        requests_per_second=len(samples) / wall,
+        concurrency=BENCH_HTTP_CONCURRENCY,
+        shed=shed,
+    )
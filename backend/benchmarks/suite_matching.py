@@ -0,0 +1,29 @@
+"""Skill matching and resume-to-job scoring on parsed corpus documents."""
+from app.services.job_artifacts import build_job_artifacts
+from app.services.matcher import fuzzy_skill_match, match_resume_to_job, match_resumes_to_job
+from benchmarks.harness import parametrize
+
+
+@parametrize("threshold", (80, 90))
+def bench_fuzzy_skill_match(benchmark, corpus, threshold):
+    resume, job = corpus.parsed_resumes[-1], corpus.parsed_jobs[-1]
+    matched = benchmark(fuzzy_skill_match, resume["skills"], job["skills"], threshold)
+    benchmark.extra_info.update(resume_skills=len(resume["skills"]), job_skills=len(job["skills"]),
+                                matched=len(matched))
+
+
+def bench_match_resume_to_job(benchmark, corpus):
+    # From the raw job dict, as POST /match does: job-side work is redone per call
+    benchmark(match_resume_to_job, corpus.parsed_resumes[1], corpus.parsed_jobs[1])
+
+
+def bench_match_resume_to_job_artifacts(benchmark, corpus):
+    # With precomputed job artifacts, as GET /match/{resume_id}/{job_id} does
+    artifacts = build_job_artifacts(corpus.parsed_jobs[1])
+    benchmark(match_resume_to_job, corpus.parsed_resumes[1], artifacts=artifacts)
+
+
+def bench_match_resumes_to_job(benchmark, corpus):
+    artifacts = build_job_artifacts(corpus.parsed_jobs[1])
+    benchmark(match_resumes_to_job, corpus.parsed_resumes, artifacts=artifacts)
+    benchmark.extra_info["resumes"] = len(corpus.parsed_resumes)
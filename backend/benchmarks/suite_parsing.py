@@ -0,0 +1,78 @@
+"""Resume and job description parsing, per document size."""
+import io
+
+from starlette.datastructures import UploadFile
+
+from app.services.job_description_analyzer import analyze_job_description
+from app.services.name_extractor import NAME_EXTRACTOR_MODES
+from app.services.resume_parser import (
+    analyze_resume_text,
+    analyze_resumes,
+    extract_education,
+    extract_email,
+    extract_experience,
+    extract_name,
+    extract_phone,
+    extract_resume_fields,
+    extract_skills,
+    extract_text_from_pdf,
+)
+from benchmarks.corpus import SIZES
+from benchmarks.harness import Skip, parametrize
+
+FIELD_EXTRACTORS = {
+    "email": extract_email,
+    "phone": extract_phone,
+    "skills": extract_skills,
+    "experience": extract_experience,
+    "education": extract_education,
+}
+
+
+@parametrize("size", SIZES)
+def bench_extract_text_from_pdf(benchmark, corpus, size):
+    document = corpus.resumes_of_size(size)[0]
+
+    def extract():
+        upload = UploadFile(io.BytesIO(document.pdf), filename=document.name)
+        return extract_text_from_pdf(upload)
+
+    text = benchmark(extract)
+    benchmark.extra_info.update(pdf_bytes=len(document.pdf), text_chars=len(text))
+
+
+@parametrize("field", tuple(FIELD_EXTRACTORS))
+def bench_extract_field(benchmark, corpus, field):
+    document = corpus.resumes_of_size("medium")[0]
+    benchmark(FIELD_EXTRACTORS[field], document.text)
+
+
+@parametrize("size", SIZES)
+def bench_extract_resume_fields(benchmark, corpus, size):
+    benchmark(extract_resume_fields, corpus.resumes_of_size(size)[0].text)
+
+
+@parametrize("mode", NAME_EXTRACTOR_MODES)
+def bench_extract_name(benchmark, corpus, mode):
+    text = corpus.resumes_of_size("medium")[0].text
+    try:
+        extract_name(text, mode)
+    except OSError as e:
+        raise Skip(f"spaCy NER model not available: {e}")
+    benchmark(extract_name, text, mode)
+
+
+@parametrize("mode", ("single", "batch"))
+def bench_analyze_resumes(benchmark, corpus, mode):
+    # The whole corpus one document at a time, or through the nlp.pipe batch variant
+    texts = [document.text for document in corpus.resumes]
+    if mode == "batch":
+        benchmark(analyze_resumes, texts)
+    else:
+        benchmark(lambda: [analyze_resume_text(text) for text in texts])
+    benchmark.extra_info["documents"] = len(texts)
+
+
+@parametrize("size", SIZES)
+def bench_analyze_job_description(benchmark, corpus, size):
+    benchmark(analyze_job_description, corpus.jobs_of_size(size)[0].text)
@@ -0,0 +1,55 @@
+// Reads a server-sent events response with fetch (EventSource can only GET).
+// Calls onEvent(name, data) for each "stage"/"partial" event and resolves with
+// the data of the final "result" event; an "error" event or a non-2xx
+// response rejects with an Error carrying `status`.
+export async function streamEvents(url, options = {}, onEvent = () => {}) {
+  const response = await fetch(url, {
+    ...options,
+    headers: { Accept: 'text/event-stream', ...options.headers },
+  })
+  if (!response.ok) {
+    let detail = response.statusText
+    try {
+      const body = await response.json()
+      if (typeof body.detail === 'string') detail = body.detail
+    } catch {
+      // Not a JSON error body; keep the status text
+    }
+    throw streamError(response.status, detail)
+  }
+
+  const reader = response.body.pipeThrough(new TextDecoderStream()).getReader()
+  let buffer = ''
+  while (true) {
+    const { value, done } = await reader.read()
+    if (done) break
+    buffer += value
+
+    let boundary
+    while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+      const block = buffer.slice(0, boundary)
+      buffer = buffer.slice(boundary + 2)
+
+      let name = 'message'
+      let data = ''
+      for (const line of block.split('\n')) {
+        if (line.startsWith('event: ')) name = line.slice(7)
+        else if (line.startsWith('data: ')) data += line.slice(6)
+      }
+      // Lines starting with ":" are keep-alive comments
+      if (!data) continue
+
+      const payload = JSON.parse(data)
+      if (name === 'result') return payload
+      if (name === 'error') throw streamError(payload.status_code, payload.detail)
+      onEvent(name, payload)
+    }
+  }
+  throw streamError(0, 'The server closed the connection before sending a result.')
+}
+
+function streamError(status, detail) {
+  const error = new Error(detail)
+  error.status = status
+  return error
+}